@@ -141,10 +141,12 @@ class AnimationManager:
         @param background_color: pygame.Color
         """
         start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
+        start_node_coords = tuple(start_node_coords)
+        end_node_coords = tuple(end_node_coords)
         coords_to_remove = []
 
         for coords, node in list(self.animation_dict.items()):
-            if list(coords) == start_node_coords or list(coords) == end_node_coords:
+            if coords == start_node_coords or coords == end_node_coords:
                 continue
 
             if node.finished:
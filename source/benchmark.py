@@ -0,0 +1,135 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingHeuristics, PathfindingEngine, create_grid_model
+from search_budget import SearchBudget
+
+def gen_random_grid_model(num_of_rows, num_of_columns, wall_density, weight_density, max_weight, rng):
+    """
+    Creates a GridModel where each cell (apart from the start and end nodes) has a
+    wall_density chance of being a marked node and a weight_density chance of being a
+    weighted node with a weight between 1 and max_weight.
+
+    @param num_of_rows: int
+    @param num_of_columns: int
+    @param wall_density: float
+    @param weight_density: float
+    @param max_weight: int
+    @param rng: random.Random
+    @return: GridModel
+    """
+    walls = []
+    weights = []
+    for y in range(num_of_rows):
+        for x in range(num_of_columns):
+            if [y, x] == [0, 0] or [y, x] == [num_of_rows-1, num_of_columns-1]:
+                continue
+
+            value = rng.random()
+            if value < wall_density:
+                walls.append([y, x])
+            elif value < wall_density + weight_density:
+                weights.append([[y, x], rng.randint(1, max_weight)])
+
+    return create_grid_model(num_of_rows, num_of_columns, walls, weights)
+
+def measure_peak_memory(algorithm_type, heuristic, grid_model, max_time):
+    """
+    Runs the algorithm given on the grid_model given with a new PathfindingEngine and returns the
+    largest number of bytes which were allocated at the same time while it was running (measured
+    with tracemalloc). A new engine is used every time so that the arrays which an engine keeps
+    between runs (such as its SearchSpace) are counted as well.
+
+    The ComponentIndex of the engine is built before tracemalloc is started, since it is shared by
+    every algorithm (it is checked before any of them are run) and isn't part of what they use.
+
+    @param algorithm_type: PathfindingAlgorithmTypes
+    @param heuristic: PathfindingHeuristics
+    @param grid_model: GridModel
+    @param max_time: float or None
+    @return: int
+    """
+    engine = PathfindingEngine()
+    engine.component_index.is_connected(grid_model, grid_model.start_index, grid_model.end_index)
+
+    tracemalloc.start()
+    try:
+        engine.run(grid_model, algorithm_type, heuristic, SearchBudget(max_time))
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_benchmark(algorithm_types, heuristic, grid_models, repeats, max_time):
+    """
+    Runs each algorithm in algorithm_types on every GridModel in grid_models (repeats times each)
+    and prints out the average time taken, the average number of checked nodes, and the number
+    of grids a path was found on for each algorithm. Each run is stopped after max_time seconds
+    (see SearchBudget), and a run which is stopped doesn't count as having found a path.
+
+    The average peak memory of each algorithm (see measure_peak_memory) is printed as well, along
+    with how many times bigger or smaller it is than the average peak memory of plain A* on the same
+    grids, so the memory saved by the algorithms which don't keep every cell (IDA* and Fringe Search)
+    can be compared. The memory is measured in a separate run since tracemalloc slows down every allocation.
+
+    @param algorithm_types: List
+    @param heuristic: PathfindingHeuristics
+    @param grid_models: List
+    @param repeats: int
+    @param max_time: float or None
+    """
+    astar_peak_memory = sum(measure_peak_memory(PathfindingAlgorithmTypes.ASTAR, heuristic, grid_model, max_time)
+                            for grid_model in grid_models) / len(grid_models)
+
+    print(f"{'Algorithm':<26}{'Avg time (ms)':>15}{'Avg checked':>15}{'Paths found':>15}{'Avg peak (KB)':>15}{'vs A*':>10}")
+    for algorithm_type in algorithm_types:
+        engine = PathfindingEngine()
+        total_time = 0
+        total_checked_nodes = 0
+        total_peak_memory = 0
+        paths_found = 0
+
+        for grid_model in grid_models:
+            for _ in range(repeats):
+                start_time = time.perf_counter()
+                result = engine.run(grid_model, algorithm_type, heuristic, SearchBudget(max_time))
+                total_time += time.perf_counter() - start_time
+
+            total_checked_nodes += len(result.checked_nodes)
+            total_peak_memory += measure_peak_memory(algorithm_type, heuristic, grid_model, max_time)
+            if result.found_path:
+                paths_found += 1
+
+        avg_time = total_time*1000 / (len(grid_models)*repeats)
+        avg_checked_nodes = total_checked_nodes / len(grid_models)
+        avg_peak_memory = total_peak_memory / len(grid_models)
+        print(f"{algorithm_type.name:<26}{avg_time:>15.3f}{avg_checked_nodes:>15.1f}{paths_found:>10}/{len(grid_models):<4}"
+              f"{avg_peak_memory/1024:>15.1f}{avg_peak_memory/astar_peak_memory:>9.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the pathfinding algorithms on random grids without pygame.")
+    parser.add_argument("--rows", type=int, default=60, help="Number of rows in each grid.")
+    parser.add_argument("--columns", type=int, default=110, help="Number of columns in each grid.")
+    parser.add_argument("--grids", type=int, default=20, help="Number of random grids to generate.")
+    parser.add_argument("--repeats", type=int, default=1, help="Number of times to run each algorithm on each grid.")
+    parser.add_argument("--walls", type=float, default=0.25, help="Chance of each cell being a marked node.")
+    parser.add_argument("--weights", type=float, default=0.1, help="Chance of each cell being a weighted node.")
+    parser.add_argument("--max-weight", type=int, default=50, help="Largest weight of a weighted node.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generating the grids.")
+    parser.add_argument("--max-time", type=float, default=5.0, help="Number of seconds each run is stopped after (IDA* can take a very long time).")
+    parser.add_argument("--heuristic", choices=[heuristic.name for heuristic in PathfindingHeuristics],
+                        default=PathfindingHeuristics.MANHATTAN_DISTANCE.name, help="Heuristic used by the informed algorithms.")
+    parser.add_argument("--algorithms", nargs="+", choices=[algorithm_type.name for algorithm_type in PathfindingAlgorithmTypes],
+                        default=[algorithm_type.name for algorithm_type in PathfindingAlgorithmTypes], help="Algorithms to benchmark.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    grid_models = [gen_random_grid_model(args.rows, args.columns, args.walls, args.weights, args.max_weight, rng) for _ in range(args.grids)]
+
+    algorithm_types = [PathfindingAlgorithmTypes[name] for name in args.algorithms]
+    run_benchmark(algorithm_types, PathfindingHeuristics[args.heuristic], grid_models, args.repeats, args.max_time)
+
+if __name__ == "__main__":
+    main()
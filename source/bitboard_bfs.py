@@ -0,0 +1,162 @@
+from bisect import bisect_left
+
+from search_budget import SearchBudget
+
+# NOTE(ali): Turns every byte which isn't 0 into 1, so that they can all be found with bytes.find.
+NONZERO_BYTES_TABLE = bytes([0] + [1]*255)
+
+# NOTE(ali): The positions of the bits which are 1 in every possible byte.
+BYTE_BIT_POSITIONS = [tuple(bit for bit in range(8) if (byte >> bit) & 1) for byte in range(256)]
+
+def bits_to_int(bits):
+    """
+    Turns a bytes object of b'0's and b'1's into an int, where the first byte
+    in bits is the lowest bit of the int.
+
+    @param bits: bytes
+    @return: int
+    """
+    # NOTE(ali): int() reads the most significant bit first, so the bytes are reversed.
+    return int(bits[::-1], 2) if len(bits) != 0 else 0
+
+class BitboardBFS:
+    def __init__(self):
+        """
+        Initializes the BitboardBFS class.
+
+        The BitboardBFS runs the BFS (Breadth First Search) pathfinding algorithm on bitboards, which are
+        Python ints where each bit is one cell of the grid, and the bit for each cell is its index (see
+        GridModel.get_index). Every cell in the next layer of the search is found at the same time: the
+        current layer is shifted left and right by 1 bit and up and down by num_of_columns bits, and then
+        the cells which are marked or have already been reached are masked out. Since each of these operations
+        works on a whole int at once (in C instead of in Python), this is much faster than checking each cell
+        one at a time on large grids. Every layer is kept, so the path is found by going back from the end node
+        through the layers one at a time.
+
+        Shifting by 1 bit would move a cell at the end of one row onto the start of the next row (and the
+        other way around), so the open cells are stored in two more bitboards as well: self.open_cells_east
+        leaves out the first column (no cell can be moved right onto it) and self.open_cells_west leaves
+        out the last column (no cell can be moved left onto it).
+
+        The bitboards of open cells are kept between runs and are only built again once the board has
+        changed (see GridModel.board_hash).
+        """
+        self.open_cells = 0
+        self.open_cells_east = 0
+        self.open_cells_west = 0
+        self.open_cells_key = None
+
+    def build_open_cells(self, grid_model):
+        """
+        Builds the bitboards of the cells in the GridModel given which aren't marked if the board has
+        changed since they were last built. Each bitboard is built by turning the cells into a bytes
+        object of b'0's and b'1's (in C using bytes.translate) and then turning that into an int.
+
+        @param grid_model: GridModel
+        """
+        key = (grid_model.board_hash, grid_model.num_of_rows, grid_model.num_of_columns)
+        if self.open_cells_key == key:
+            return
+
+        rows = grid_model.num_of_rows
+        columns = grid_model.num_of_columns
+        self.open_cells = bits_to_int(bytes(grid_model.walls).translate(bytes.maketrans(b'\x00\x01', b'10')))
+        self.open_cells_east = self.open_cells & bits_to_int((b'0' + b'1'*(columns - 1))*rows)
+        self.open_cells_west = self.open_cells & bits_to_int((b'1'*(columns - 1) + b'0')*rows)
+        self.open_cells_key = key
+
+    def get_indexes(self, bitboard):
+        """
+        Returns a list containing the indexes of the cells in the bitboard given in ascending order.
+        The bitboard is turned into bytes and only the bytes which aren't 0 are looked at (these are
+        found in C using bytes.find), so the empty parts of the grid are skipped without any Python code.
+
+        @param bitboard: int
+        @return: List
+        """
+        data = bitboard.to_bytes((bitboard.bit_length() + 7) // 8, 'little')
+        nonzero_bytes = data.translate(NONZERO_BYTES_TABLE)
+
+        indexes = []
+        position = nonzero_bytes.find(1)
+        while position != -1:
+            for bit in BYTE_BIT_POSITIONS[data[position]]:
+                indexes.append(position*8 + bit)
+            position = nonzero_bytes.find(1, position + 1)
+        return indexes
+
+    def run(self, grid_model, budget=None):
+        """
+        Runs the search from the start node until the layer which reaches the end node (or until there
+        are no new cells to reach), and returns the indexes of the cells in each layer in order, the number
+        of checked nodes at the end of each layer, and the indexes of the cells on the path (or an empty
+        list if there is no path).
+
+        If a SearchBudget is given it is checked once per layer (every cell in the layer counts as an
+        expansion). Once it has run out the path is the path to the cell in the last layer which is
+        closest to the end node (by the Manhattan distance), like PathfindingEngine.get_partial_path.
+
+        @param grid_model: GridModel
+        @param budget: SearchBudget or None
+        @return: Tuple
+        """
+        if budget == None:
+            budget = SearchBudget()
+
+        self.build_open_cells(grid_model)
+        open_cells = self.open_cells
+        open_cells_east = self.open_cells_east
+        open_cells_west = self.open_cells_west
+        columns = grid_model.num_of_columns
+
+        start_bit = 1 << grid_model.start_index
+        end_bit = 1 << grid_model.end_index
+
+        layers = [start_bit]
+        reached = start_bit
+        frontier = start_bit
+        while frontier & end_bit == 0:
+            # NOTE(ali): A whole layer is expanded at once, so the budget is checked once per layer.
+            budget.add_expansions(frontier.bit_count())
+            if budget.check():
+                break
+
+            frontier = (((frontier << 1) & open_cells_east) | ((frontier >> 1) & open_cells_west) |
+                        (((frontier << columns) | (frontier >> columns)) & open_cells)) & ~reached
+            if frontier == 0:
+                break
+            reached |= frontier
+            layers.append(frontier)
+
+        checked_nodes = []
+        layer_ends = []
+        for layer in layers:
+            checked_nodes.extend(self.get_indexes(layer))
+            layer_ends.append(len(checked_nodes))
+
+        index = grid_model.end_index
+        if budget.is_stopped_early:
+            end_y, end_x = divmod(index, columns)
+            last_layer_start = layer_ends[-2] if len(layer_ends) > 1 else 0
+            index = min(checked_nodes[last_layer_start:], key=lambda index: abs(end_y - index // columns) + abs(end_x - index % columns))
+        elif frontier & end_bit == 0:
+            return checked_nodes, layer_ends, []
+
+        # NOTE(ali): The indexes of each layer are in ascending order, so we can check if a cell is in a
+        #            layer with a binary search instead of shifting the whole bitboard of the layer.
+        #            The first layer only holds the start node, so it is added to the path at the end.
+        path = [index]
+        for layer_number in range(len(layers) - 2, 0, -1):
+            layer_start = layer_ends[layer_number - 1]
+            layer_end = layer_ends[layer_number]
+            for neighbor in grid_model.get_open_neighbors(index):
+                position = bisect_left(checked_nodes, neighbor, layer_start, layer_end)
+                if position != layer_end and checked_nodes[position] == neighbor:
+                    index = neighbor
+                    break
+            path.append(index)
+
+        if index != grid_model.start_index:
+            path.append(grid_model.start_index)
+        path.reverse()
+        return checked_nodes, layer_ends, path
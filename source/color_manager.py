@@ -496,7 +496,7 @@ class ColorManager:
                 case ColorNodeTypes.CHECKED_NODE_FOREGROUND_COLOR:
                     if current_pathfinding_algorithm != None:
                         for checked_coord in current_pathfinding_algorithm.checked_nodes:
-                            if checked_coord not in current_pathfinding_algorithm.path.stack:
+                            if current_pathfinding_algorithm.path.exists(checked_coord) == False:
                                 self.animation_manager.add_coords_to_animation_dict(checked_coord, AnimationTypes.LINEAR_COLOR_INTERPOLATION, (self.CHECKED_NODE_FOREGROUND_COLOR, pygame.Color(color)), self.theme_colors[ColorNodeTypes.BOARD_COLOR])
 
                 case ColorNodeTypes.START_NODE_COLOR:
@@ -0,0 +1,185 @@
+from array import array
+
+class ComponentIndex:
+    def __init__(self):
+        """
+        Initializes the ComponentIndex class.
+
+        The ComponentIndex keeps track of which open cells of a GridModel are connected to each
+        other, so that we can tell straight away if there is no path between the start node and
+        the end node without having to run a search. It is stored as a union-find (disjoint set)
+        structure where self.parents holds the parent of each cell, and the cell at the top of each
+        tree (the root) is the label of every cell in its tree. Cells which are in the same tree
+        are connected and self.sizes holds the number of cells under each root.
+
+        The ComponentIndex adds itself as a change listener to the GridModel. When a cell is unmarked
+        it is joined with the open cells next to it straight away, but a union-find can't split a tree
+        in two, so when a cell is marked which could split the cells around it apart (see can_split) the
+        labels are only worked out again the next time they are needed. When a cell is marked which can't
+        split them the labels are kept, and the marked cell is just left in its tree (marked cells are
+        skipped by get_component). Weight changes don't change which cells are connected, so they are ignored.
+        """
+        self.grid_model = None
+        self.parents = array('i')
+        self.sizes = array('i')
+        self.known_walls = array('b')
+        self.needs_rebuild = True
+
+    def notify_changed(self, index):
+        """
+        This is the change listener which is added to the GridModel. If the cell at the index
+        given has been unmarked it is joined with the open cells next to it, and if it has been
+        marked and could split the cells around it apart (see can_split) the labels are worked
+        out again the next time they are needed.
+
+        @param index: int
+        """
+        if self.needs_rebuild:
+            return
+
+        grid_model = self.grid_model
+        wall = grid_model.walls[index]
+        if wall == self.known_walls[index]:
+            return
+
+        self.known_walls[index] = wall
+        if wall:
+            if self.can_split(index):
+                self.needs_rebuild = True
+        else:
+            for neighbor in grid_model.get_open_neighbors(index):
+                self.union(index, neighbor)
+
+    def can_split(self, index):
+        """
+        Returns True if marking the cell at the index given could split the cells it was connected
+        to into more than one component. The eight cells around it are gone through in order, and two
+        open cells next to it (above, to the right, below or to the left) are still connected without
+        it if the cell in the corner between them is open as well. If all the open cells next to it are
+        connected to each other like this the cells around it can't be split apart, otherwise they
+        might be (they could still be connected by a longer path, but that isn't checked).
+
+        @param index: int
+        @return: bool
+        """
+        grid_model = self.grid_model
+        walls = grid_model.walls
+        rows = grid_model.num_of_rows
+        columns = grid_model.num_of_columns
+        y, x = divmod(index, columns)
+
+        # Up, Up Right, Right, Down Right, Down, Down Left, Left, Up Left
+        ring = []
+        for ny, nx in ((y-1, x), (y-1, x+1), (y, x+1), (y+1, x+1), (y+1, x), (y+1, x-1), (y, x-1), (y-1, x-1)):
+            ring.append(0 <= ny < rows and 0 <= nx < columns and walls[ny*columns + nx] == 0)
+
+        # NOTE(ali): Each open cell next to it starts a group of its own unless it is connected to the
+        #            next open cell around it through the corner. If all four are connected to each other
+        #            in a loop there aren't any groups left over, but that is still only one group.
+        num_of_groups = 0
+        for slot in range(0, 8, 2):
+            if ring[slot] and (ring[slot + 1] and ring[(slot + 2) % 8]) == False:
+                num_of_groups += 1
+        return num_of_groups > 1
+
+    def find(self, index):
+        """
+        Returns the root of the tree which the cell at the index given is in. Each cell on
+        the way is pointed at the cell two steps above it so that the trees stay shallow.
+
+        @param index: int
+        @return: int
+        """
+        parents = self.parents
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def union(self, index_a, index_b):
+        """
+        Joins the trees which the cells at the indexes given are in, the
+        smaller tree is always added under the root of the bigger tree.
+
+        @param index_a: int
+        @param index_b: int
+        """
+        root_a = self.find(index_a)
+        root_b = self.find(index_b)
+        if root_a == root_b:
+            return
+
+        if self.sizes[root_a] < self.sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parents[root_b] = root_a
+        self.sizes[root_a] += self.sizes[root_b]
+
+    def rebuild(self, grid_model):
+        """
+        Works out the label of every open cell in the GridModel given from scratch by joining
+        each open cell with the open cells to the right of it and below it. This also moves the
+        change listener from the old GridModel to the GridModel given.
+
+        @param grid_model: GridModel
+        """
+        if self.grid_model is not grid_model:
+            if self.grid_model != None:
+                self.grid_model.remove_change_listener(self.notify_changed)
+            grid_model.add_change_listener(self.notify_changed)
+
+        self.grid_model = grid_model
+        self.parents = array('i', range(grid_model.num_of_cells))
+        self.sizes = array('i', [1]) * grid_model.num_of_cells
+        self.known_walls = array('b', grid_model.walls)
+
+        walls = grid_model.walls
+        columns = grid_model.num_of_columns
+        for index in range(grid_model.num_of_cells):
+            if walls[index]:
+                continue
+            if (index + 1) % columns != 0 and walls[index + 1] == 0:
+                self.union(index, index + 1)
+            if index + columns < grid_model.num_of_cells and walls[index + columns] == 0:
+                self.union(index, index + columns)
+
+        self.needs_rebuild = False
+
+    def update(self, grid_model):
+        """
+        Makes sure that the labels are up to date for the GridModel given.
+
+        @param grid_model: GridModel
+        """
+        if self.needs_rebuild or self.grid_model is not grid_model or len(self.parents) != grid_model.num_of_cells:
+            self.rebuild(grid_model)
+
+    def is_connected(self, grid_model, index_a, index_b):
+        """
+        Returns True if there is a path between the cells at the indexes given. If either
+        of the cells is marked True is returned, since the algorithms still search from (and
+        to) the start node and the end node when they are marked.
+
+        @param grid_model: GridModel
+        @param index_a: int
+        @param index_b: int
+        @return: bool
+        """
+        if grid_model.walls[index_a] or grid_model.walls[index_b]:
+            return True
+
+        self.update(grid_model)
+        return self.find(index_a) == self.find(index_b)
+
+    def get_component(self, grid_model, index):
+        """
+        Returns a list containing the indexes of every open cell which is
+        connected to the cell at the index given (including itself).
+
+        @param grid_model: GridModel
+        @param index: int
+        @return: List
+        """
+        self.update(grid_model)
+        root = self.find(index)
+        walls = grid_model.walls
+        return [other_index for other_index in range(grid_model.num_of_cells) if walls[other_index] == 0 and self.find(other_index) == root]
@@ -0,0 +1,156 @@
+from array import array
+
+from queue_classes import create_distance_queue
+from search_budget import SearchBudget
+
+class GoalDistanceField:
+    def __init__(self):
+        """
+        Initializes the GoalDistanceField class.
+
+        The GoalDistanceField holds the distance from every cell in the grid to the end node, along with
+        the next hop of each cell, which is the cell next to it that is one step closer to the end node on a
+        shortest path. It is built by running Dial's version of the Dijkastra pathfinding algorithm backwards
+        from the end node over the whole grid (or the normal Dijkastra when the weights are too big for a
+        BucketQueue, see create_distance_queue), after which the shortest path from any start node is found by
+        following the next hops from the start node until the end node is reached (without any searching).
+
+        The field is kept between runs. It adds itself as a change listener to the GridModel (see
+        GridModel.add_change_listener), and it is only built again once the end node has moved or a
+        cell has been marked, unmarked or has had its weight changed. Moving the start node around
+        only ever needs the next hops to be followed again.
+        """
+        self.grid_model = None
+        self.end_index = -1
+        self.needs_rebuild = True
+
+        self.distances = array('q')
+        self.next_hops = array('i')
+
+    def notify_changed(self, index):
+        """
+        This is the change listener which is added to the GridModel. Any change to
+        the walls or weights means that the field has to be built again.
+
+        @param index: int
+        """
+        self.needs_rebuild = True
+
+    def needs_update(self, grid_model):
+        """
+        Returns True if the field has to be built again before it can be used with the GridModel given.
+
+        @param grid_model: GridModel
+        @return: bool
+        """
+        return (self.needs_rebuild or self.grid_model is not grid_model or self.end_index != grid_model.end_index or
+                len(self.next_hops) != grid_model.num_of_cells)
+
+    def build(self, grid_model, budget):
+        """
+        Works out the distance to the end node and the next hop of every cell which can reach
+        the end node, and returns a list of the indexes of the cells in the order they were
+        expanded. A distance of -1 and a next hop of -1 means the cell can't reach the end node.
+
+        The budget given is checked in the same way as in PathfindingEngine.iter_events. If it runs
+        out the field is only kept until the next run (which builds it again). The next hops which
+        have been found so far still lead to the end node, but they might not be the shortest paths.
+
+        @param grid_model: GridModel
+        @param budget: SearchBudget
+        @return: List
+        """
+        if self.grid_model is not grid_model:
+            if self.grid_model != None:
+                self.grid_model.remove_change_listener(self.notify_changed)
+            grid_model.add_change_listener(self.notify_changed)
+
+        self.grid_model = grid_model
+        self.end_index = grid_model.end_index
+        self.needs_rebuild = False
+
+        distances = array('q', [-1]) * grid_model.num_of_cells
+        next_hops = array('i', [-1]) * grid_model.num_of_cells
+        expanded = bytearray(grid_model.num_of_cells)
+        weights = grid_model.weights
+
+        checked_nodes = []
+        distances[self.end_index] = 0
+        frontier = create_distance_queue(max(1, max(weights)))
+        frontier.enqueue(self.end_index, 0)
+
+        check_interval = countdown = budget.get_check_interval()
+        while frontier.is_empty() == False:
+            countdown -= 1
+            if countdown == 0:
+                budget.add_expansions(check_interval)
+                if budget.check():
+                    self.needs_rebuild = True
+                    break
+                check_interval = countdown = budget.get_check_interval()
+
+            current_index = frontier.dequeue()
+            expanded[current_index] = 1
+            checked_nodes.append(current_index)
+
+            # NOTE(ali): Going from a neighbour into the current cell costs the weight
+            #            of the current cell, since it is the cell being stepped onto.
+            new_distance = distances[current_index] + weights[current_index]
+            for index in grid_model.get_open_neighbors(current_index):
+                if expanded[index]:
+                    continue
+
+                if distances[index] == -1:
+                    distances[index] = new_distance
+                    next_hops[index] = current_index
+                    frontier.enqueue(index, new_distance)
+                elif new_distance < distances[index]:
+                    distances[index] = new_distance
+                    next_hops[index] = current_index
+                    frontier.replace(index, new_distance)
+
+        if budget.is_stopped_early == False:
+            budget.add_expansions(check_interval - countdown)
+
+        self.distances = distances
+        self.next_hops = next_hops
+        return checked_nodes
+
+    def get_path(self, start_index):
+        """
+        Returns a list containing the indexes of the cells on the path from the cell at start_index
+        to the end node by following the next hops, or an empty list if there is no path.
+
+        @param start_index: int
+        @return: List
+        """
+        if start_index != self.end_index and self.next_hops[start_index] == -1:
+            return []
+
+        path = [start_index]
+        index = start_index
+        while index != self.end_index:
+            index = self.next_hops[index]
+            path.append(index)
+        return path
+
+    def run(self, grid_model, budget=None):
+        """
+        Builds the field again if needs_update returns True, and then returns the indexes of the
+        cells which were expanded (an empty list if the field didn't have to be built again) and
+        the indexes of the cells on the path from the start node to the end node.
+
+        If a SearchBudget is given the field is only built until it has run out of budget (see build).
+
+        @param grid_model: GridModel
+        @param budget: SearchBudget or None
+        @return: Tuple
+        """
+        if budget == None:
+            budget = SearchBudget()
+
+        checked_nodes = []
+        if self.needs_update(grid_model):
+            checked_nodes = self.build(grid_model, budget)
+
+        return checked_nodes, self.get_path(grid_model.start_index)
@@ -4,6 +4,7 @@ import time
 from enum import IntEnum
 
 from animations import *
+from grid_model import GridModel
 
 class ScreenManager(object):
     def __init__(self, screen, screen_width, screen_height, grid_width, grid_height, resolution_divider):
@@ -113,27 +114,121 @@ class ScreenManager(object):
 
 
 class RectNode:
-    def __init__(self, rect, coords):
+    __slots__ = ('rect', 'coords', 'index', 'grid_model')
+
+    def __init__(self, rect, coords, grid_model):
         """
         Initialises the RectNode class.
 
+        A RectNode is a view over a single cell of the GridModel given. It only
+        stores the pygame.Rect of the cell, its coordinates and its linear index,
+        the rest of its attributes are read from and written to the arrays in
+        the GridModel.
+
         @param rect: pygame.Rect
         @param coords: List
-        @param is_start_node: bool
-        @param is_end_node: bool
-        @param is_user_weight: bool
-        @param weight: int
-        @param marked: bool
-        @param adjacent_nodes: List
+        @param grid_model: GridModel
         """
         self.rect = rect
         self.coords = coords
-        self.is_start_node = False
-        self.is_end_node = False
-        self.is_user_weight = False
-        self.weight = 1
-        self.marked = False
-        self.adjacent_nodes = [None, None, None, None]
+        self.grid_model = grid_model
+        self.index = grid_model.get_index(coords)
+
+    @property
+    def is_start_node(self):
+        """
+        Returns True if this node is the start node.
+
+        @return: bool
+        """
+        return self.grid_model.start_index == self.index
+
+    @is_start_node.setter
+    def is_start_node(self, value):
+        """
+        Makes this node the start node in the GridModel if value is True.
+
+        @param value: bool
+        """
+        if value:
+            self.grid_model.start_index = self.index
+        elif self.grid_model.start_index == self.index:
+            self.grid_model.start_index = -1
+
+    @property
+    def is_end_node(self):
+        """
+        Returns True if this node is the end node.
+
+        @return: bool
+        """
+        return self.grid_model.end_index == self.index
+
+    @is_end_node.setter
+    def is_end_node(self, value):
+        """
+        Makes this node the end node in the GridModel if value is True.
+
+        @param value: bool
+        """
+        if value:
+            self.grid_model.end_index = self.index
+        elif self.grid_model.end_index == self.index:
+            self.grid_model.end_index = -1
+
+    @property
+    def is_user_weight(self):
+        """
+        Returns True if this node is a weighted node.
+
+        @return: bool
+        """
+        return self.grid_model.user_weights[self.index] == 1
+
+    @is_user_weight.setter
+    def is_user_weight(self, value):
+        """
+        Sets whether this node is a weighted node in the GridModel.
+
+        @param value: bool
+        """
+        self.grid_model.set_user_weight(self.index, value)
+
+    @property
+    def weight(self):
+        """
+        Returns the weight of this node.
+
+        @return: int
+        """
+        return self.grid_model.weights[self.index]
+
+    @weight.setter
+    def weight(self, value):
+        """
+        Sets the weight of this node in the GridModel.
+
+        @param value: int
+        """
+        self.grid_model.set_weight(self.index, value)
+
+    @property
+    def marked(self):
+        """
+        Returns True if this node is a marked node.
+
+        @return: bool
+        """
+        return self.grid_model.walls[self.index] == 1
+
+    @marked.setter
+    def marked(self, value):
+        """
+        Sets whether this node is a marked node in the GridModel.
+
+        @param value: bool
+        """
+        self.grid_model.set_wall(self.index, value)
 
 class RectArray:
     def __init__(self, screen_manager):
@@ -144,15 +239,17 @@ class RectArray:
         """
         self.screen_manager = screen_manager
         self.array = []
+        self.grid_model = None
         self.gen_rect_array()
 
     def gen_rect_array(self):
         """
-        This function will make self.array into 2D array which represents the game's grid.
-        Each row in self.array will contain multiple RectNode instances (each row should have
-        enough RectNode instances to match the number of columns in the grid) which will
-        represent each cell on the grid. The top left most node should be set as the start node
-        and the bottom right most node should be set as the end node.
+        This function will create a new GridModel for the current number of rows and columns,
+        and make self.array into 2D array which represents the game's grid. Each row in self.array
+        will contain multiple RectNode instances (each row should have enough RectNode instances to
+        match the number of columns in the grid) which will be views over the cells in the GridModel.
+        The top left most node should be set as the start node and the bottom right most node should
+        be set as the end node (the GridModel does this when it is created).
         """
 
         column_width = self.screen_manager.column_width
@@ -162,6 +259,7 @@ class RectArray:
             column_width += 1
             row_width += 1
 
+        self.grid_model = GridModel(self.screen_manager.num_of_rows, self.screen_manager.num_of_columns)
         self.array = []
 
         pos_x = 0
@@ -171,67 +269,27 @@ class RectArray:
             self.array.append([])
             for x in range(self.screen_manager.num_of_columns):
                 square_pygame_rect = pygame.Rect(pos_x, pos_y, column_width, row_width)
-                self.array[-1].append(RectNode(square_pygame_rect, [y, x]))
+                self.array[-1].append(RectNode(square_pygame_rect, [y, x], self.grid_model))
                 pos_x += self.screen_manager.column_width
             else:
                 pos_x = 0
                 pos_y += self.screen_manager.row_width
 
-        self.array[0][0].is_start_node = True
-        self.array[0][0].weight = 0
-        self.array[-1][-1].is_end_node = True
-
-    def gen_rect_array_with_adjacent_nodes(self):
-        """
-        This function will go through each RectNode in self.array and calculate
-        the coordinates of its adjacent nodes (i.e. if any node exists above,
-        below, to the right or to the left of the current node and that node is
-        not marked, then that node will be considered an adjacent node to our current
-        node). It will then fill in the adjacent_nodes attribute of the RectNode with the
-        coordinates of its adjacent nodes if they exist.
-        """
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                # Right
-                if x+1 < self.screen_manager.num_of_columns:
-                    if self.array[y][x+1].marked == False:
-                        self.array[y][x].adjacent_nodes[0] = [y, x+1]
-                # Down
-                if y+1 < self.screen_manager.num_of_rows:
-                    if self.array[y+1][x].marked == False:
-                        self.array[y][x].adjacent_nodes[1] = [y+1, x]
-                # Up
-                if y-1 > -1:
-                    if self.array[y-1][x].marked == False:
-                        self.array[y][x].adjacent_nodes[2] = [y-1, x]
-                # Left
-                if x-1 > -1:
-                    if self.array[y][x-1].marked == False:
-                        self.array[y][x].adjacent_nodes[3] = [y, x-1]
-
-    def reset_rect_array_adjacent_nodes(self):
-        """
-        This function will go through each RectNode in self.array
-        and set the adjacent_nodes attribute of each RectNode to
-        the list [None, None, None, None].
-        """
-        for row in self.array:
-            for node in row:
-                node.adjacent_nodes = [None, None, None, None]
-
     def get_valid_adjacent_nodes(self, coords):
         """
-        This function will find the RectNode at the coordinates given in self.array,
-        and then go through the adjacent_nodes attribute of the RectNode and return
-        a new array only containing the coordinates of the adjacent nodes (this list
-        will not contain any 'None' values which may exist in the adjacent_nodes attribute).
+        This function will return a list containing the coordinates of the nodes
+        above, below, to the right and to the left of the node at the coordinates
+        given which are not marked. These are read from the neighbor table in
+        self.grid_model, which is kept up to date whenever a node is marked or
+        unmarked, so nothing needs to be generated before running an algorithm.
 
         @param coords: List
         @return: List
         """
-        node = self.array[coords[0]][coords[1]]
-        valid_adjacent_nodes = [i for i in node.adjacent_nodes if i != None] 
-        return valid_adjacent_nodes
+        grid_model = self.grid_model
+        columns = grid_model.num_of_columns
+        index = coords[0]*columns + coords[1]
+        return [[neighbor // columns, neighbor % columns] for neighbor in grid_model.get_open_neighbors(index)]
 
     def reset_rect_array(self):
         """
@@ -241,33 +299,13 @@ class RectArray:
         
     def get_start_and_end_node_coords(self):
         """
-        This function will go through self.array and find the coordinates
-        of the start the end nodes and then return those coordinates.
+        This function will return the coordinates of the start and end nodes,
+        these are worked out from the start_index and end_index attributes in
+        self.grid_model so the grid does not need to be searched.
 
         @return: Tuple
         """
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                if self.array[y][x].is_start_node:
-                    start_node_coords = [y, x]
-                elif self.array[y][x].is_end_node:
-                    end_node_coords = [y, x]
-
-        return start_node_coords, end_node_coords
-
-    def reset_non_user_weights(self):
-        """
-        This function will go through each RectNode in the grid and will
-        set the weight attribute of the RectNode to 1 if the is_user_weight attribute
-        is set to False.
-        """
-        for row in self.array:
-            for node in row:
-                if node.is_user_weight == False:
-                    node.weight = 1
-
-        start_node_coords, end_node_coords = self.get_start_and_end_node_coords()
-        self.array[start_node_coords[0]][start_node_coords[1]].weight = 0
+        return self.grid_model.get_coords(self.grid_model.start_index), self.grid_model.get_coords(self.grid_model.end_index)
 
     def get_weight_at_node(self, coord):
         """
@@ -277,19 +315,7 @@ class RectArray:
         @param coord: List
         @return: int
         """
-        return self.array[coord[0]][coord[1]].weight
-
-    def set_weight_at_node(self, coord, weight):
-        """
-        This function will get the RectNode at the coordinates given from self.array
-        and set the weight attribute of the RectNode to the weight given if the
-        is_user_weight attribute is set to False.
-
-        @param coord: List
-        @param weight: bool
-        """
-        if self.array[coord[0]][coord[1]].is_user_weight == False:
-            self.array[coord[0]][coord[1]].weight = weight
+        return self.grid_model.weights[coord[0]*self.grid_model.num_of_columns + coord[1]]
 
 
 class CursorNodeTypes(IntEnum):
@@ -452,20 +478,16 @@ class Grid:
 
     def mark_start_node(self, node):
         """
-        This function will find the current RectNode which has the 'is_start_node' attribute
-        set to True in self.rect_array_obj.array and it will set it to False. It will then
-        set the 'is_start_node' attribute of the RectNode passed into the function to True, and
-        then animate both the old and new start nodes using the add_coords_to_animation_dict in
-        self.animation_manager.
+        This function will find the current start node using the start_index attribute
+        in self.rect_array_obj.grid_model and it will set its 'is_start_node' attribute to False.
+        It will then set the 'is_start_node' attribute of the RectNode passed into the function
+        to True, and then animate both the old and new start nodes using the add_coords_to_animation_dict
+        in self.animation_manager.
 
         @param node: RectNode
         """
-        original_start_node = None
-
-        for row in self.rect_array_obj.array:
-            for new_node in row:
-                if new_node.is_start_node:
-                    original_start_node = new_node
+        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
+        original_start_node = self.rect_array_obj.array[start_node_coords[0]][start_node_coords[1]]
 
         if not node.is_start_node and not node.is_end_node:
             node.is_start_node = True
@@ -490,20 +512,16 @@ class Grid:
 
     def mark_end_node(self, node):
         """
-        This function will find the current RectNode which has the 'is_end_node' attribute
-        set to True in self.rect_array_obj.array and it will set it to False. It will then
-        set the 'is_end_node' attribute of the RectNode passed into the function to True, and
-        then animate both the old and new end nodes using the add_coords_to_animation_dict in
-        self.animation_manager.
+        This function will find the current end node using the end_index attribute
+        in self.rect_array_obj.grid_model and it will set its 'is_end_node' attribute to False.
+        It will then set the 'is_end_node' attribute of the RectNode passed into the function
+        to True, and then animate both the old and new end nodes using the add_coords_to_animation_dict
+        in self.animation_manager.
 
         @param node: RectNode
         """
-        original_end_node = None
-
-        for row in self.rect_array_obj.array:
-            for new_node in row:
-                if new_node.is_end_node:
-                    original_end_node = new_node
+        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
+        original_end_node = self.rect_array_obj.array[end_node_coords[0]][end_node_coords[1]]
 
         if not node.is_end_node and not node.is_start_node:
             node.is_end_node = True
@@ -537,12 +555,12 @@ class Grid:
 
         @param animate: bool
         """
-        for row in self.rect_array_obj.array:
-            for node in row:
-                if node.marked:
-                    if animate:
-                        self.animation_manager.add_coords_to_animation_dict(node.coords, AnimationTypes.SHRINKING_SQUARE, self.color_manager.MARKED_NODE_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
-                    node.marked = False
+        grid_model = self.rect_array_obj.grid_model
+        for index in range(grid_model.num_of_cells):
+            if grid_model.walls[index]:
+                if animate:
+                    self.animation_manager.add_coords_to_animation_dict(grid_model.get_coords(index), AnimationTypes.SHRINKING_SQUARE, self.color_manager.MARKED_NODE_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
+                grid_model.set_wall(index, False)
 
     def reset_all_weights(self, animate=True):
         """
@@ -554,16 +572,13 @@ class Grid:
 
         @param animate: Bool
         """
-        for row in self.rect_array_obj.array:
-            for node in row:
-                if node.is_user_weight:
-                    if animate:
-                        self.animation_manager.add_coords_to_animation_dict(node.coords, AnimationTypes.SHRINKING_SQUARE, self.color_manager.WEIGHTED_NODE_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
-                    node.is_user_weight = False
-                    node.weight = 1
-
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-        self.rect_array_obj.array[start_node_coords[0]][start_node_coords[1]].weight = 0
+        grid_model = self.rect_array_obj.grid_model
+        for index in range(grid_model.num_of_cells):
+            if grid_model.user_weights[index]:
+                if animate:
+                    self.animation_manager.add_coords_to_animation_dict(grid_model.get_coords(index), AnimationTypes.SHRINKING_SQUARE, self.color_manager.WEIGHTED_NODE_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
+                grid_model.set_user_weight(index, False)
+                grid_model.set_weight(index, 1)
 
     def get_board_info(self):
         """
@@ -580,11 +595,11 @@ class Grid:
         marked_coords = []
         weighted_coords = []
 
-        for row in self.rect_array_obj.array:
-            for node in row:
-                if node.marked:
-                    marked_coords.append(node.coords)
-                elif node.is_user_weight:
-                    weighted_coords.append([node.coords, node.weight])
+        grid_model = self.rect_array_obj.grid_model
+        for index in range(grid_model.num_of_cells):
+            if grid_model.walls[index]:
+                marked_coords.append(grid_model.get_coords(index))
+            elif grid_model.user_weights[index]:
+                weighted_coords.append([grid_model.get_coords(index), grid_model.weights[index]])
 
         return [start_node_coords, end_node_coords, marked_coords, weighted_coords, self.screen_manager.resolution_divider]
@@ -0,0 +1,290 @@
+from array import array
+from copy import copy
+
+class GridModel:
+    def __init__(self, num_of_rows, num_of_columns):
+        """
+        Initializes the GridModel class.
+
+        The GridModel class holds the state of every cell in the grid in flat
+        arrays instead of in separate objects. Each cell is addressed by its
+        linear index which is y*num_of_columns + x. The arrays are:
+
+        walls: 1 if the cell is a marked node, otherwise 0.
+        user_weights: 1 if the cell is a weighted node, otherwise 0.
+        weights: the weight of the cell.
+
+        The start and end nodes are stored as the start_index and end_index
+        attributes. The top left most cell is the start node and the bottom
+        right most cell is the end node.
+
+        The adjacency of the grid is stored as a neighbor table in CSR form
+        (see build_neighbor_table) which is built once when the GridModel is
+        created and then patched whenever a cell is marked or unmarked.
+
+        Functions can be added with add_change_listener to be told about every
+        cell which is marked, unmarked or has its weight changed, this lets
+        incremental algorithms (see lpa_star.py) only repair what has changed.
+
+        self.board_hash is a hash of the walls and weights of every cell. It is the
+        XOR of the hash of each cell (see get_cell_hash), so whenever a cell changes
+        its old hash is XORed out and its new hash is XORed in, which means that the
+        board never has to be hashed again from scratch after it has been created.
+
+        @param num_of_rows: int
+        @param num_of_columns: int
+        """
+        self.num_of_rows = num_of_rows
+        self.num_of_columns = num_of_columns
+        self.num_of_cells = num_of_rows*num_of_columns
+
+        self.walls = array('b', bytes(self.num_of_cells))
+        self.user_weights = array('b', bytes(self.num_of_cells))
+        self.weights = array('l', [1]) * self.num_of_cells
+
+        self.start_index = 0
+        self.end_index = self.num_of_cells - 1
+
+        self.change_listeners = []
+
+        self.board_hash = 0
+        for index in range(self.num_of_cells):
+            self.board_hash ^= self.get_cell_hash(index)
+
+        self.neighbor_offsets = None
+        self.grid_neighbor_ids = None
+        self.neighbor_ids = None
+        self.reverse_slots = None
+        self.build_neighbor_table()
+
+    def build_neighbor_table(self):
+        """
+        Builds the neighbor table for the grid. The neighbors of the cell with
+        index i are stored in the slots neighbor_offsets[i] to neighbor_offsets[i+1]
+        (not including neighbor_offsets[i+1]), in the order right, down, up, left.
+
+        grid_neighbor_ids: the index of the cell next to i in that direction.
+        neighbor_ids: the same as grid_neighbor_ids, but -1 if that cell is marked.
+        reverse_slots: the slot in the neighbor's row which points back at i.
+
+        Every cell keeps a slot for each cell next to it even if that cell is marked,
+        so marking or unmarking a cell only has to update the slots which point to it.
+        """
+        rows = self.num_of_rows
+        columns = self.num_of_columns
+
+        self.neighbor_offsets = array('i', [0]) * (self.num_of_cells + 1)
+        grid_neighbor_ids = []
+        slot_lookup = {}
+
+        for y in range(rows):
+            for x in range(columns):
+                index = y*columns + x
+                self.neighbor_offsets[index] = len(grid_neighbor_ids)
+                # Right, Down, Up, Left
+                for ny, nx in ((y, x+1), (y+1, x), (y-1, x), (y, x-1)):
+                    if 0 <= ny < rows and 0 <= nx < columns:
+                        slot_lookup[(index, ny*columns + nx)] = len(grid_neighbor_ids)
+                        grid_neighbor_ids.append(ny*columns + nx)
+
+        self.neighbor_offsets[self.num_of_cells] = len(grid_neighbor_ids)
+        self.grid_neighbor_ids = array('i', grid_neighbor_ids)
+        self.reverse_slots = array('i', [0]) * len(grid_neighbor_ids)
+
+        for index in range(self.num_of_cells):
+            for slot in range(self.neighbor_offsets[index], self.neighbor_offsets[index+1]):
+                self.reverse_slots[slot] = slot_lookup[(self.grid_neighbor_ids[slot], index)]
+
+        self.neighbor_ids = array('i', self.grid_neighbor_ids)
+        for index in range(self.num_of_cells):
+            if self.walls[index]:
+                self.patch_neighbor_table(index)
+
+    def patch_neighbor_table(self, index):
+        """
+        Updates the slots in the neighbor table which point to the cell at the
+        index given so that they match whether the cell is marked or not.
+
+        @param index: int
+        """
+        value = -1 if self.walls[index] else index
+        for slot in range(self.neighbor_offsets[index], self.neighbor_offsets[index+1]):
+            self.neighbor_ids[self.reverse_slots[slot]] = value
+
+    def get_open_neighbors(self, index):
+        """
+        Returns a list containing the indexes of the cells next to the cell
+        at the index given which are not marked.
+
+        @param index: int
+        @return: List
+        """
+        return [neighbor for neighbor in self.neighbor_ids[self.neighbor_offsets[index]:self.neighbor_offsets[index+1]] if neighbor != -1]
+
+    def add_change_listener(self, listener):
+        """
+        Adds a function which will be called with the index of a cell
+        whenever that cell is marked, unmarked or has its weight changed.
+
+        @param listener: Callable
+        """
+        if listener not in self.change_listeners:
+            self.change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """
+        Removes a function which was added with add_change_listener.
+
+        @param listener: Callable
+        """
+        if listener in self.change_listeners:
+            self.change_listeners.remove(listener)
+
+    def notify_change_listeners(self, index):
+        """
+        Calls every function in self.change_listeners with the index given.
+
+        @param index: int
+        """
+        for listener in self.change_listeners:
+            listener(index)
+
+    def get_cell_hash(self, index):
+        """
+        Returns the hash of the cell at the index given, which
+        depends on its index, walls, user_weights and weights values.
+
+        @param index: int
+        @return: int
+        """
+        return hash((index, self.walls[index], self.user_weights[index], self.weights[index]))
+
+    def get_index(self, coords):
+        """
+        Converts the [y, x] coordinates given into a linear cell index.
+
+        @param coords: List
+        @return: int
+        """
+        return coords[0]*self.num_of_columns + coords[1]
+
+    def get_coords(self, index):
+        """
+        Converts the linear cell index given into [y, x] coordinates.
+
+        @param index: int
+        @return: List
+        """
+        return [index // self.num_of_columns, index % self.num_of_columns]
+
+    def is_wall(self, index):
+        """
+        Returns True if the cell at the index given is a marked node.
+
+        @param index: int
+        @return: bool
+        """
+        return self.walls[index] == 1
+
+    def set_wall(self, index, value):
+        """
+        Marks or unmarks the cell at the index given and patches the
+        neighbor table if this has changed.
+
+        @param index: int
+        @param value: bool
+        """
+        value = 1 if value else 0
+        if self.walls[index] != value:
+            self.board_hash ^= self.get_cell_hash(index)
+            self.walls[index] = value
+            self.board_hash ^= self.get_cell_hash(index)
+            self.patch_neighbor_table(index)
+            self.notify_change_listeners(index)
+
+    def is_user_weight(self, index):
+        """
+        Returns True if the cell at the index given is a weighted node.
+
+        @param index: int
+        @return: bool
+        """
+        return self.user_weights[index] == 1
+
+    def set_user_weight(self, index, value):
+        """
+        Sets whether the cell at the index given is a weighted node.
+
+        @param index: int
+        @param value: bool
+        """
+        self.board_hash ^= self.get_cell_hash(index)
+        self.user_weights[index] = 1 if value else 0
+        self.board_hash ^= self.get_cell_hash(index)
+
+    def get_weight(self, index):
+        """
+        Returns the weight of the cell at the index given.
+
+        @param index: int
+        @return: int
+        """
+        return self.weights[index]
+
+    def set_weight(self, index, weight):
+        """
+        Sets the weight of the cell at the index given.
+
+        @param index: int
+        @param weight: int
+        """
+        if self.weights[index] != weight:
+            self.board_hash ^= self.get_cell_hash(index)
+            self.weights[index] = weight
+            self.board_hash ^= self.get_cell_hash(index)
+            self.notify_change_listeners(index)
+
+    def copy(self):
+        """
+        Returns a new GridModel holding the same board as this one, without any change listeners.
+        The arrays (including the neighbor table) are copied in C, which is much faster than creating
+        a new GridModel and building its neighbor table again.
+
+        @return: GridModel
+        """
+        grid_model = copy(self)
+        grid_model.walls = array('b', self.walls)
+        grid_model.user_weights = array('b', self.user_weights)
+        grid_model.weights = array('l', self.weights)
+        grid_model.neighbor_ids = array('i', self.neighbor_ids)
+        grid_model.change_listeners = []
+        return grid_model
+
+    def sync_from(self, grid_model):
+        """
+        Makes this GridModel hold the same board as the GridModel given (which has to have the
+        same number of rows and columns). Only the cells which are different are changed, and they
+        are changed with set_wall, set_user_weight and set_weight so that the neighbor table, the
+        board hash and the change listeners are all kept up to date.
+
+        @param grid_model: GridModel
+        """
+        # NOTE(ali): Comparing the whole arrays is done in C, so boards which
+        #            haven't changed don't have to be looked at one cell at a time.
+        if self.walls != grid_model.walls:
+            for index in range(self.num_of_cells):
+                if self.walls[index] != grid_model.walls[index]:
+                    self.set_wall(index, grid_model.walls[index])
+
+        if self.user_weights != grid_model.user_weights:
+            for index in range(self.num_of_cells):
+                if self.user_weights[index] != grid_model.user_weights[index]:
+                    self.set_user_weight(index, grid_model.user_weights[index])
+
+        if self.weights != grid_model.weights:
+            for index in range(self.num_of_cells):
+                if self.weights[index] != grid_model.weights[index]:
+                    self.set_weight(index, grid_model.weights[index])
+
+        self.start_index = grid_model.start_index
+        self.end_index = grid_model.end_index
@@ -0,0 +1,234 @@
+from array import array
+from enum import IntEnum
+
+from landmarks import LandmarkTable
+
+class PathfindingHeuristics(IntEnum):
+    MANHATTAN_DISTANCE = 0,
+    EUCLIDEAN_DISTANCE = 1,
+    OCTILE_DISTANCE = 2,
+    CHEBYSHEV_DISTANCE = 3,
+    LANDMARKS = 4
+
+# NOTE(ali): sqrt(2) - 1, used by the octile distance.
+OCTILE_DIAGONAL_COST = 0.41421356237309515
+
+class HeuristicField:
+    def __init__(self, num_of_rows, num_of_columns, end_index, heuristic, landmark_table=None, store_values=True):
+        """
+        Initializes the HeuristicField class.
+
+        The HeuristicField holds the value of a heuristic for every cell in a grid for
+        one end node. The values are only calculated the first time they are asked for
+        (most cells are never looked at by an informed search), and are then stored in
+        self.values so that they never have to be calculated again. A value of -1 in
+        self.values means that the value for that cell has not been calculated yet.
+
+        The landmarks heuristic needs the LandmarkTable for the current board to be given.
+
+        If store_values is False self.values is None and the values have to be calculated every
+        time with calculate_value instead, so the field doesn't take up any memory for each cell.
+
+        @param num_of_rows: int
+        @param num_of_columns: int
+        @param end_index: int
+        @param heuristic: PathfindingHeuristics or None (treated as Euclidean distance)
+        @param landmark_table: LandmarkTable or None
+        @param store_values: bool
+        """
+        self.num_of_rows = num_of_rows
+        self.num_of_columns = num_of_columns
+        self.end_index = end_index
+        self.end_y = end_index // num_of_columns
+        self.end_x = end_index % num_of_columns
+        self.heuristic = heuristic
+        self.landmark_table = landmark_table
+        self.values = array('d', [-1.0]) * (num_of_rows*num_of_columns) if store_values else None
+
+        match heuristic:
+            case PathfindingHeuristics.MANHATTAN_DISTANCE:
+                self.calculate = self.get_manhattan_distance
+            case PathfindingHeuristics.OCTILE_DISTANCE:
+                self.calculate = self.get_octile_distance
+            case PathfindingHeuristics.CHEBYSHEV_DISTANCE:
+                self.calculate = self.get_chebyshev_distance
+            case PathfindingHeuristics.LANDMARKS:
+                self.calculate = self.get_landmark_distance
+            case _:
+                self.calculate = self.get_euclidean_distance
+
+    def get_value(self, index):
+        """
+        Returns the value of the heuristic for the cell at the index given,
+        calculating it first if this has not been done yet.
+
+        @param index: int
+        @return: float
+        """
+        value = self.values[index]
+        if value < 0:
+            value = self.calculate(index // self.num_of_columns, index % self.num_of_columns)
+            self.values[index] = value
+        return value
+
+    def calculate_value(self, index):
+        """
+        Calculates the value of the heuristic for the cell at the index given without storing it.
+
+        @param index: int
+        @return: float
+        """
+        return self.calculate(index // self.num_of_columns, index % self.num_of_columns)
+
+    def get_euclidean_distance(self, y, x):
+        """
+        This function will calculate the Euclidean distance between
+        the cell at the coordinates given and the end node.
+
+        @param y: int
+        @param x: int
+        @return: int
+        """
+        diff_row = self.end_y+1 - y
+        diff_column = self.end_x+1 - x
+        return (diff_row**2) + (diff_column**2)
+
+    def get_manhattan_distance(self, y, x):
+        """
+        This function will calculate the Manhattan distance between
+        the cell at the coordinates given and the end node.
+
+        @param y: int
+        @param x: int
+        @return: int
+        """
+        diff_row = abs(self.end_y - y)
+        diff_column = abs(self.end_x - x)
+        manhattan_distance = diff_row + diff_column
+        # NOTE(ali): This makes sure that the heuristic and distance values
+        #            don't mess each other up.
+        return manhattan_distance*3
+
+    def get_octile_distance(self, y, x):
+        """
+        This function will calculate the octile distance between the cell at
+        the coordinates given and the end node, this is the length of the path
+        if diagonal moves which cost sqrt(2) were allowed.
+
+        @param y: int
+        @param x: int
+        @return: float
+        """
+        diff_row = abs(self.end_y - y)
+        diff_column = abs(self.end_x - x)
+        return max(diff_row, diff_column) + OCTILE_DIAGONAL_COST*min(diff_row, diff_column)
+
+    def get_chebyshev_distance(self, y, x):
+        """
+        This function will calculate the Chebyshev distance between the cell
+        at the coordinates given and the end node, this is the length of the
+        path if diagonal moves which cost 1 were allowed.
+
+        @param y: int
+        @param x: int
+        @return: int
+        """
+        return max(abs(self.end_y - y), abs(self.end_x - x))
+
+    def get_landmark_distance(self, y, x):
+        """
+        This function will calculate the ALT (landmarks) lower bound on the
+        distance between the cell at the coordinates given and the end node
+        using self.landmark_table (see LandmarkTable.get_lower_bound).
+
+        @param y: int
+        @param x: int
+        @return: int
+        """
+        return self.landmark_table.get_lower_bound(y*self.num_of_columns + x, self.end_index)
+
+
+class HeuristicFieldProvider:
+    def __init__(self, max_num_of_fields=8):
+        """
+        Initializes the HeuristicFieldProvider class.
+
+        The HeuristicFieldProvider keeps the HeuristicField instances which have been
+        created in self.fields, where the key is (end_index, heuristic, num_of_rows, num_of_columns).
+        This means that running an algorithm again after only the start node (or a wall or
+        weight) has changed reuses the values which have already been calculated. Once there are
+        more than max_num_of_fields fields the one which was used the longest time ago is removed.
+
+        The landmarks heuristic depends on the walls and weights as well, so the board hash of the
+        GridModel (see GridModel.board_hash) is also part of the key of its fields. The LandmarkTable
+        for the current board is kept in self.landmark_table and is only built again once the board
+        has changed, so every query on the same board reuses the same landmark distances.
+
+        @param max_num_of_fields: int
+        """
+        self.max_num_of_fields = max_num_of_fields
+        self.fields = {}
+        self.landmark_table = None
+        self.landmark_table_key = None
+
+    def get_landmark_table(self, grid_model):
+        """
+        Returns the LandmarkTable for the current board of the grid_model
+        given, building a new one if the board has changed.
+
+        @param grid_model: GridModel
+        @return: LandmarkTable
+        """
+        key = (grid_model.board_hash, grid_model.num_of_rows, grid_model.num_of_columns)
+        if self.landmark_table_key != key:
+            self.landmark_table = LandmarkTable(grid_model)
+            self.landmark_table_key = key
+        return self.landmark_table
+
+    def get_field(self, grid_model, heuristic, end_index=None):
+        """
+        Returns the HeuristicField for the heuristic given and the end_index given (or the
+        end node of the grid_model given if end_index is None), creating it if it does not exist.
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics or None
+        @param end_index: int or None
+        @return: HeuristicField
+        """
+        if end_index == None:
+            end_index = grid_model.end_index
+
+        key = (end_index, heuristic, grid_model.num_of_rows, grid_model.num_of_columns)
+        landmark_table = None
+        if heuristic == PathfindingHeuristics.LANDMARKS:
+            key += (grid_model.board_hash,)
+            landmark_table = self.get_landmark_table(grid_model)
+
+        field = self.fields.pop(key, None)
+        if field == None:
+            field = HeuristicField(grid_model.num_of_rows, grid_model.num_of_columns, end_index, heuristic, landmark_table)
+            if len(self.fields) >= self.max_num_of_fields:
+                del self.fields[next(iter(self.fields))]
+
+        # NOTE(ali): Dictionaries keep the order that keys were added in, so adding
+        #            the field back at the end keeps the most recently used field last.
+        self.fields[key] = field
+        return field
+
+    def create_unstored_field(self, grid_model, heuristic):
+        """
+        Returns a new HeuristicField for the heuristic given and the end node of the grid_model given
+        which doesn't store its values (see HeuristicField), for the searches which only keep track of
+        a small part of the grid. The field isn't kept in self.fields, since it doesn't hold anything
+        which would be worth reusing.
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics or None
+        @return: HeuristicField
+        """
+        landmark_table = None
+        if heuristic == PathfindingHeuristics.LANDMARKS:
+            landmark_table = self.get_landmark_table(grid_model)
+
+        return HeuristicField(grid_model.num_of_rows, grid_model.num_of_columns, grid_model.end_index,
+                              heuristic, landmark_table, store_values=False)
@@ -0,0 +1,426 @@
+from queue_classes import PriorityQueue, create_distance_queue
+from search_budget import SearchBudget
+
+class HPAStarPlanner:
+    def __init__(self, cluster_size=10):
+        """
+        Initializes the HPAStarPlanner class.
+
+        The HPAStarPlanner runs the HPA* (Hierarchical Pathfinding A*) pathfinding algorithm. The grid
+        is split into square clusters which are cluster_size cells wide. Wherever two clusters next to each
+        other have open cells on both sides of the border between them there is an entrance, and the cells
+        on either side of an entrance become nodes of an abstract graph. The abstract graph has an edge
+        across every entrance and an edge between every pair of nodes in the same cluster, with the length
+        of the shortest path between them which stays inside the cluster (which is also saved).
+
+        The abstract graph is only built once and then kept between runs. The planner adds itself as a change
+        listener to the GridModel (see GridModel.add_change_listener), and when a cell changes only its cluster
+        is marked as dirty. Before the next run the entrances of each dirty cluster are found again, and the
+        edges inside the dirty cluster (and inside any cluster next to it which shares an entrance that has
+        changed) are worked out again.
+
+        Clusters which haven't been built yet (because the last run ran out of budget) are kept in
+        self.dirty_clusters as well, so the next run carries on building them.
+
+        Each run then only has to connect the start node and the end node to the nodes in their clusters,
+        search the abstract graph, and join the saved paths of the edges which were used together. The path
+        found is not always the shortest path, but it is usually very close to it.
+
+        @param cluster_size: int
+        """
+        self.cluster_size = cluster_size
+        self.grid_model = None
+        self.num_of_cluster_rows = 0
+        self.num_of_cluster_columns = 0
+
+        self.entrances = {}
+        self.cluster_nodes = []
+        self.intra_edges = []
+        self.inter_edges = []
+        self.dirty_clusters = set()
+        self.max_weight = 1
+
+    def notify_changed(self, index):
+        """
+        This is the change listener which is added to the GridModel. It marks the
+        cluster of the cell which has changed as dirty.
+
+        @param index: int
+        """
+        self.dirty_clusters.add(self.get_cluster(index))
+
+    def get_cluster(self, index):
+        """
+        Returns the index of the cluster which the cell at the index given is in.
+
+        @param index: int
+        @return: int
+        """
+        columns = self.grid_model.num_of_columns
+        return (index // columns // self.cluster_size)*self.num_of_cluster_columns + (index % columns // self.cluster_size)
+
+    def get_cluster_bounds(self, cluster):
+        """
+        Returns (y0, x0, y1, x1) for the cluster given, where the cells in the
+        cluster are the cells with y0 <= y < y1 and x0 <= x < x1.
+
+        @param cluster: int
+        @return: Tuple
+        """
+        y0 = (cluster // self.num_of_cluster_columns)*self.cluster_size
+        x0 = (cluster % self.num_of_cluster_columns)*self.cluster_size
+        return y0, x0, min(y0 + self.cluster_size, self.grid_model.num_of_rows), min(x0 + self.cluster_size, self.grid_model.num_of_columns)
+
+    def get_borders(self, cluster):
+        """
+        Returns a list of (cluster_a, cluster_b) keys for the borders of the cluster given,
+        where cluster_b is always to the right of or below cluster_a.
+
+        @param cluster: int
+        @return: List
+        """
+        cluster_y = cluster // self.num_of_cluster_columns
+        cluster_x = cluster % self.num_of_cluster_columns
+
+        borders = []
+        if cluster_x + 1 < self.num_of_cluster_columns:
+            borders.append((cluster, cluster + 1))
+        if cluster_y + 1 < self.num_of_cluster_rows:
+            borders.append((cluster, cluster + self.num_of_cluster_columns))
+        if cluster_x > 0:
+            borders.append((cluster - 1, cluster))
+        if cluster_y > 0:
+            borders.append((cluster - self.num_of_cluster_columns, cluster))
+        return borders
+
+    def find_entrances(self, border):
+        """
+        Returns a list of (index_a, index_b) pairs of cells which are next to each other on
+        either side of the border given (index_a is in the first cluster of the border). The
+        open cells along the border are split into runs, and each run gets one entrance in
+        its middle, or one at each end if the run is 6 or more cells long.
+
+        @param border: Tuple
+        @return: List
+        """
+        cluster_a, cluster_b = border
+        y0, x0, y1, x1 = self.get_cluster_bounds(cluster_a)
+        columns = self.grid_model.num_of_columns
+        walls = self.grid_model.walls
+
+        # NOTE(ali): The cluster below is checked first, because when there is only one
+        #            column of clusters the cluster below is also cluster_a + 1.
+        if cluster_b == cluster_a + self.num_of_cluster_columns:
+            pairs = [((y1-1)*columns + x, y1*columns + x) for x in range(x0, x1)]
+        else:
+            pairs = [(y*columns + x1-1, y*columns + x1) for y in range(y0, y1)]
+
+        entrances = []
+        run = []
+        for pair in pairs + [None]:
+            if pair != None and walls[pair[0]] == 0 and walls[pair[1]] == 0:
+                run.append(pair)
+                continue
+
+            if len(run) >= 6:
+                entrances.append(run[0])
+                entrances.append(run[-1])
+            elif len(run) != 0:
+                entrances.append(run[len(run)//2])
+            run = []
+
+        return entrances
+
+    def search_cluster(self, source_index, cluster, targets, backwards=False):
+        """
+        Runs Dial's version of the Dijkastra pathfinding algorithm (or the normal Dijkastra when the weights are too
+        big for a BucketQueue, see create_distance_queue) from the cell at source_index without leaving the cluster
+        given, and returns the distances and parents of the cells it reached as two dictionaries. The
+        search stops once every cell in targets has been expanded. If backwards is True the distances are the
+        lengths of the paths from each cell to the source cell instead.
+
+        @param source_index: int
+        @param cluster: int
+        @param targets: Set
+        @param backwards: bool
+        @return: Tuple
+        """
+        grid_model = self.grid_model
+        columns = grid_model.num_of_columns
+        weights = grid_model.weights
+        y0, x0, y1, x1 = self.get_cluster_bounds(cluster)
+
+        distances = {source_index: 0}
+        parents = {source_index: -1}
+        expanded_nodes = set()
+        targets_left = len(targets)
+        frontier = create_distance_queue(self.max_weight)
+        frontier.enqueue(source_index, 0)
+
+        while frontier.is_empty() == False and targets_left != 0:
+            current_index = frontier.dequeue()
+            expanded_nodes.add(current_index)
+            if current_index in targets:
+                targets_left -= 1
+
+            for index in grid_model.get_open_neighbors(current_index):
+                if index in expanded_nodes or (y0 <= index // columns < y1 and x0 <= index % columns < x1) == False:
+                    continue
+
+                new_distance = distances[current_index] + (weights[current_index] if backwards else weights[index])
+                if index not in distances:
+                    distances[index] = new_distance
+                    parents[index] = current_index
+                    frontier.enqueue(index, new_distance)
+                elif new_distance < distances[index]:
+                    distances[index] = new_distance
+                    parents[index] = current_index
+                    frontier.replace(index, new_distance)
+
+        return distances, parents
+
+    def get_path_from_parents(self, parents, index):
+        """
+        Follows the parents given back from the index given and returns
+        the list of indexes on the way, ending with the index given.
+
+        @param parents: Dict
+        @param index: int
+        @return: List
+        """
+        path = []
+        while index != -1:
+            path.append(index)
+            index = parents[index]
+        path.reverse()
+        return path
+
+    def build_cluster(self, cluster):
+        """
+        Works out which cells of the cluster given are nodes of the abstract graph from the entrances
+        on its borders, and then saves the edges across its entrances and the edges between each pair
+        of its nodes (along with the path of each edge). The number of cells which were reached by the
+        searches between the nodes is returned, so that it can be added to the budget of the run.
+
+        @param cluster: int
+        @return: int
+        """
+        nodes = set()
+        inter_edges = {}
+        for border in self.get_borders(cluster):
+            for index_a, index_b in self.entrances[border]:
+                if border[0] == cluster:
+                    node, other_node = index_a, index_b
+                else:
+                    node, other_node = index_b, index_a
+                nodes.add(node)
+                inter_edges.setdefault(node, []).append(other_node)
+
+        intra_edges = {}
+        num_of_reached_cells = 0
+        for node in nodes:
+            distances, parents = self.search_cluster(node, cluster, nodes)
+            intra_edges[node] = [(other_node, distances[other_node], self.get_path_from_parents(parents, other_node)[1:])
+                                 for other_node in nodes if other_node != node and other_node in distances]
+            num_of_reached_cells += len(distances)
+
+        self.cluster_nodes[cluster] = nodes
+        self.inter_edges[cluster] = inter_edges
+        self.intra_edges[cluster] = intra_edges
+        return num_of_reached_cells
+
+    def build_dirty_clusters(self, budget):
+        """
+        Builds every cluster in self.dirty_clusters, checking the budget given before each one. Returns
+        True once they have all been built, or False if the budget ran out first (the clusters which
+        haven't been built yet are then left in self.dirty_clusters).
+
+        @param budget: SearchBudget
+        @return: bool
+        """
+        for cluster in list(self.dirty_clusters):
+            if budget.check():
+                return False
+            budget.add_expansions(self.build_cluster(cluster))
+            self.dirty_clusters.discard(cluster)
+
+        return True
+
+    def build(self, grid_model):
+        """
+        Finds every entrance of the abstract graph for the GridModel given from scratch and marks every
+        cluster as dirty, so that they are all built by build_dirty_clusters. This also moves the change
+        listener from the old GridModel to the GridModel given.
+
+        @param grid_model: GridModel
+        """
+        if self.grid_model is not grid_model:
+            if self.grid_model != None:
+                self.grid_model.remove_change_listener(self.notify_changed)
+            grid_model.add_change_listener(self.notify_changed)
+
+        self.grid_model = grid_model
+        self.max_weight = max(1, max(grid_model.weights))
+        self.num_of_cluster_rows = -(-grid_model.num_of_rows // self.cluster_size)
+        self.num_of_cluster_columns = -(-grid_model.num_of_columns // self.cluster_size)
+        num_of_clusters = self.num_of_cluster_rows*self.num_of_cluster_columns
+
+        self.entrances = {}
+        for cluster in range(num_of_clusters):
+            for border in self.get_borders(cluster):
+                if border not in self.entrances:
+                    self.entrances[border] = self.find_entrances(border)
+
+        self.cluster_nodes = [None]*num_of_clusters
+        self.intra_edges = [None]*num_of_clusters
+        self.inter_edges = [None]*num_of_clusters
+        self.dirty_clusters = set(range(num_of_clusters))
+
+    def update_dirty_clusters(self):
+        """
+        Finds the entrances on the borders of every dirty cluster again, and then marks any
+        cluster next to them which shares an entrance that has changed as dirty as well, so
+        that it is built again by build_dirty_clusters. Every other cluster is left as it is.
+        """
+        clusters_to_build = set(self.dirty_clusters)
+        for cluster in self.dirty_clusters:
+            for border in self.get_borders(cluster):
+                entrances = self.find_entrances(border)
+                if entrances != self.entrances[border]:
+                    self.entrances[border] = entrances
+                    clusters_to_build.update(border)
+
+        self.dirty_clusters = clusters_to_build
+
+    def get_edges(self, index, start_index, start_edges, end_index, end_cluster, end_edges):
+        """
+        Returns a list of (other_node, distance, path) edges going out of the node at the index given
+        in the abstract graph, including the edges from the start node and the edges to the end node.
+
+        @param index: int
+        @param start_index: int
+        @param start_edges: List
+        @param end_index: int
+        @param end_cluster: int
+        @param end_edges: Dict
+        @return: List
+        """
+        cluster = self.get_cluster(index)
+        if index == start_index:
+            edges = list(start_edges)
+        else:
+            edges = list(self.intra_edges[cluster].get(index, []))
+
+        weights = self.grid_model.weights
+        for other_node in self.inter_edges[cluster].get(index, []):
+            edges.append((other_node, weights[other_node], [other_node]))
+
+        if cluster == end_cluster and index in end_edges and index != end_index:
+            edges.append(end_edges[index])
+
+        return edges
+
+    def run(self, grid_model, budget=None):
+        """
+        Builds or updates the abstract graph, connects the start node and the end node to it and then
+        runs the A* pathfinding algorithm on it. The indexes of the abstract nodes which were expanded
+        and the indexes of the cells on the path (or an empty list if there is no path) are returned.
+
+        If a SearchBudget is given it is checked while the clusters are being built and while the abstract
+        graph is being searched in the same way as in PathfindingEngine.iter_events. Once it has run out
+        the path is an empty list, since there is no path through the abstract graph until it is finished.
+
+        @param grid_model: GridModel
+        @param budget: SearchBudget or None
+        @return: Tuple
+        """
+        if budget == None:
+            budget = SearchBudget()
+
+        if (self.grid_model is not grid_model or self.num_of_cluster_rows != -(-grid_model.num_of_rows // self.cluster_size) or
+                self.num_of_cluster_columns != -(-grid_model.num_of_columns // self.cluster_size)):
+            self.build(grid_model)
+        elif len(self.dirty_clusters) != 0:
+            self.max_weight = max(1, max(grid_model.weights))
+            self.update_dirty_clusters()
+
+        if self.build_dirty_clusters(budget) == False:
+            return [], []
+
+        columns = grid_model.num_of_columns
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        start_cluster = self.get_cluster(start_index)
+        end_cluster = self.get_cluster(end_index)
+
+        # NOTE(ali): The start node and the end node are connected to the nodes in their
+        #            clusters for this run only, so the saved abstract graph doesn't change.
+        start_targets = self.cluster_nodes[start_cluster] | {end_index}
+        distances, parents = self.search_cluster(start_index, start_cluster, start_targets)
+        start_edges = [(node, distances[node], self.get_path_from_parents(parents, node)[1:])
+                       for node in start_targets if node != start_index and node in distances]
+
+        distances, parents = self.search_cluster(end_index, end_cluster, self.cluster_nodes[end_cluster], backwards=True)
+        end_edges = {}
+        for node in self.cluster_nodes[end_cluster]:
+            if node in distances:
+                path = self.get_path_from_parents(parents, node)
+                path.reverse()
+                end_edges[node] = (end_index, distances[node], path[1:])
+
+        end_y, end_x = end_index // columns, end_index % columns
+        def get_heuristic(index):
+            return abs(end_y - index // columns) + abs(end_x - index % columns)
+
+        g = {start_index: 0}
+        abstract_parents = {start_index: (-1, [start_index])}
+        expanded_nodes = set()
+        checked_nodes = []
+        frontier = PriorityQueue()
+        frontier.enqueue(start_index, get_heuristic(start_index))
+
+        check_interval = countdown = budget.get_check_interval()
+        while frontier.is_empty() == False:
+            countdown -= 1
+            if countdown == 0:
+                budget.add_expansions(check_interval)
+                if budget.check():
+                    return checked_nodes, []
+                check_interval = countdown = budget.get_check_interval()
+
+            current_index = frontier.dequeue()
+            expanded_nodes.add(current_index)
+            checked_nodes.append(current_index)
+
+            if current_index == end_index:
+                break
+
+            for index, distance, path in self.get_edges(current_index, start_index, start_edges, end_index, end_cluster, end_edges):
+                if index in expanded_nodes:
+                    continue
+
+                new_distance = g[current_index] + distance
+                if index not in g:
+                    g[index] = new_distance
+                    abstract_parents[index] = (current_index, path)
+                    frontier.enqueue(index, new_distance + get_heuristic(index))
+                elif new_distance < g[index]:
+                    g[index] = new_distance
+                    abstract_parents[index] = (current_index, path)
+                    frontier.replace(index, new_distance + get_heuristic(index))
+
+        budget.add_expansions(check_interval - countdown)
+        if end_index not in expanded_nodes:
+            return checked_nodes, []
+
+        segments = []
+        index = end_index
+        while index != -1:
+            index, path = abstract_parents[index][0], abstract_parents[index][1]
+            segments.append(path)
+
+        path = []
+        for segment in reversed(segments):
+            path.extend(segment)
+
+        return checked_nodes, path
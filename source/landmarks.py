@@ -0,0 +1,134 @@
+from array import array
+
+from queue_classes import create_distance_queue
+
+class LandmarkTable:
+    def __init__(self, grid_model, num_of_landmarks=4):
+        """
+        Initializes the LandmarkTable class.
+
+        The LandmarkTable is the preprocessing step of the ALT (A*, Landmarks and the Triangle inequality)
+        heuristic. A few cells are picked as landmarks and the distance from each landmark to every other cell
+        is worked out with one run of Dial's version of the Dijkastra pathfinding algorithm per landmark (or the
+        normal Dijkastra when the weights are too big for a BucketQueue, see create_distance_queue). The distances
+        are all stored in one flat array of 64 bit ints in self.distances, where the distance from the
+        landmark at position k in self.landmarks to the cell at index is at k*num_of_cells + index (and -1
+        means the landmark can't reach the cell).
+
+        The landmarks are picked one at a time so that they are as far away from each other as possible
+        (the first one is the cell furthest away from the first open cell in the grid, and each landmark
+        after that is the cell whose distance to the closest landmark picked so far is the largest), which
+        puts them around the edges of the grid and at the ends of long corridors where they help the most.
+
+        A LandmarkTable is only correct for the board it was built from, so a new one has to be built
+        once the walls or weights have changed (see HeuristicFieldProvider.get_landmark_table).
+
+        @param grid_model: GridModel
+        @param num_of_landmarks: int
+        """
+        self.num_of_rows = grid_model.num_of_rows
+        self.num_of_columns = grid_model.num_of_columns
+        self.num_of_cells = grid_model.num_of_cells
+        self.weights = array('l', grid_model.weights)
+        self.landmarks = []
+        self.distances = array('q')
+
+        first_open_index = next((index for index in range(grid_model.num_of_cells) if grid_model.walls[index] == 0), -1)
+        if first_open_index == -1:
+            return
+
+        closest_distances = self.get_distances(grid_model, first_open_index)
+        for _ in range(num_of_landmarks):
+            landmark = max(range(self.num_of_cells), key=lambda index: closest_distances[index])
+            if closest_distances[landmark] <= 0:
+                break
+
+            distances = self.get_distances(grid_model, landmark)
+            self.landmarks.append(landmark)
+            self.distances.extend(distances)
+
+            # NOTE(ali): The first open cell is only used to find the first landmark,
+            #            so it is not counted as one of the landmarks picked so far.
+            if len(self.landmarks) == 1:
+                closest_distances = distances[:]
+                continue
+
+            for index in range(self.num_of_cells):
+                if distances[index] < closest_distances[index]:
+                    closest_distances[index] = distances[index]
+
+    def get_distances(self, grid_model, source_index):
+        """
+        Returns an array holding the distance from the cell at source_index to every
+        cell in the grid, where the distance of a cell which can't be reached is -1. The
+        distances are 64 bit ints, since the weights typed in by the user can add up to more
+        than a 32 bit int can hold.
+
+        @param grid_model: GridModel
+        @param source_index: int
+        @return: array
+        """
+        weights = grid_model.weights
+        distances = array('q', [-1]) * grid_model.num_of_cells
+        expanded = bytearray(grid_model.num_of_cells)
+
+        distances[source_index] = 0
+        frontier = create_distance_queue(max(1, max(weights)))
+        frontier.enqueue(source_index, 0)
+
+        while frontier.is_empty() == False:
+            current_index = frontier.dequeue()
+            expanded[current_index] = 1
+
+            for index in grid_model.get_open_neighbors(current_index):
+                if expanded[index]:
+                    continue
+
+                new_distance = distances[current_index] + weights[index]
+                if distances[index] == -1:
+                    distances[index] = new_distance
+                    frontier.enqueue(index, new_distance)
+                elif new_distance < distances[index]:
+                    distances[index] = new_distance
+                    frontier.replace(index, new_distance)
+
+        return distances
+
+    def get_lower_bound(self, index, end_index):
+        """
+        Returns a value which is never larger than the length of the shortest path from the cell at
+        index to the cell at end_index, using the triangle inequality with each landmark L:
+
+            d(v, t) >= d(L, t) - d(L, v)
+            d(v, t) >= d(v, L) - d(t, L)
+
+        The cost of a move is the weight of the cell being moved onto, so a path going backwards costs
+        the same apart from the weights of its two ends, d(v, L) = d(L, v) + weight(L) - weight(v),
+        which means that one run of Dijkastra from each landmark gives us the distances both ways. The
+        Manhattan distance (which is always a lower bound as every weight is at least 1) is used when it
+        is larger, or when no landmark can reach both cells. This heuristic is consistent, so A* using
+        it always finds the shortest path.
+
+        @param index: int
+        @param end_index: int
+        @return: int
+        """
+        columns = self.num_of_columns
+        best = abs(end_index // columns - index // columns) + abs(end_index % columns - index % columns)
+
+        distances = self.distances
+        weight_difference = self.weights[end_index] - self.weights[index]
+        for offset in range(0, len(distances), self.num_of_cells):
+            landmark_to_index = distances[offset + index]
+            landmark_to_end = distances[offset + end_index]
+            if landmark_to_index == -1 or landmark_to_end == -1:
+                continue
+
+            forward = landmark_to_end - landmark_to_index
+            backward = landmark_to_index - landmark_to_end + weight_difference
+            if forward > best:
+                best = forward
+            if backward > best:
+                best = backward
+
+        return best
@@ -0,0 +1,287 @@
+from array import array
+
+from queue_classes import PriorityQueue
+from search_budget import SearchBudget
+
+INFINITY = float('inf')
+
+class LPAStarPlanner:
+    def __init__(self):
+        """
+        Initializes the LPAStarPlanner class.
+
+        The LPAStarPlanner runs the Lifelong Planning A* (LPA*) pathfinding algorithm. Like A*,
+        it stores g (the distance of each cell from the start node), but it also stores rhs, which
+        is the distance of each cell worked out from the g values of the cells next to it. A cell
+        is consistent when g and rhs are equal and only inconsistent cells are kept in self.frontier.
+
+        The g and rhs values are kept between runs. The planner adds itself as a change listener
+        to the GridModel (see GridModel.add_change_listener) so that it knows which cells have been
+        marked, unmarked or have had their weight changed since the last run, and the next run only
+        updates those cells and the cells next to them and then repairs the inconsistent cells, so
+        the cost depends on how much of the path has changed instead of on the size of the grid.
+
+        Everything is worked out again from scratch if the GridModel, the start node or the end
+        node has changed since the last run.
+
+        self.is_repaired is False when the last run was stopped before it had finished repairing
+        the g values (see compute_shortest_path), so the next run has to carry on repairing them.
+
+        The heuristic has to be consistent for the g values to still be correct after they have
+        been repaired, so the planner always uses the Manhattan distance without multiplying it by 3
+        (neither the Manhattan distance nor the Euclidean distance used by A* are consistent).
+        """
+        self.grid_model = None
+        self.start_index = -1
+        self.end_index = -1
+        self.end_y = 0
+        self.end_x = 0
+
+        self.g = array('d')
+        self.rhs = array('d')
+        self.frontier = PriorityQueue()
+        self.changed_cells = set()
+        self.is_repaired = True
+
+    def notify_changed(self, index):
+        """
+        This is the change listener which is added to the GridModel. It saves the
+        index of the cell which has changed so that it is updated in the next run.
+
+        @param index: int
+        """
+        self.changed_cells.add(index)
+
+    def needs_reset(self, grid_model):
+        """
+        Returns True if the GridModel, the start node or the end node has changed
+        since the last run, which means the g and rhs values can't be reused.
+
+        @param grid_model: GridModel
+        @return: bool
+        """
+        return self.grid_model is not grid_model or self.start_index != grid_model.start_index or self.end_index != grid_model.end_index
+
+    def needs_update(self, grid_model):
+        """
+        Returns True if running the planner again could give a different path.
+
+        @param grid_model: GridModel
+        @return: bool
+        """
+        return len(self.changed_cells) != 0 or self.is_repaired == False or self.needs_reset(grid_model)
+
+    def reset(self, grid_model):
+        """
+        Sets every g and rhs value to infinity apart from the rhs value of the start node
+        (which is 0) and adds the start node to the frontier. This also moves the change
+        listener from the old GridModel to the GridModel given.
+
+        @param grid_model: GridModel
+        """
+        if self.grid_model is not grid_model:
+            if self.grid_model != None:
+                self.grid_model.remove_change_listener(self.notify_changed)
+            grid_model.add_change_listener(self.notify_changed)
+
+        self.grid_model = grid_model
+        self.start_index = grid_model.start_index
+        self.end_index = grid_model.end_index
+        self.end_y = self.end_index // grid_model.num_of_columns
+        self.end_x = self.end_index % grid_model.num_of_columns
+
+        self.g = array('d', [INFINITY]) * grid_model.num_of_cells
+        self.rhs = array('d', [INFINITY]) * grid_model.num_of_cells
+        self.frontier = PriorityQueue()
+        self.changed_cells = set()
+
+        self.rhs[self.start_index] = 0
+        self.frontier.enqueue(self.start_index, self.calculate_key(self.start_index))
+
+    def calculate_key(self, index):
+        """
+        Returns the key of the cell at the index given, the cells in the frontier
+        are sorted by the first value and then by the second value of the key.
+
+        @param index: int
+        @return: Tuple
+        """
+        distance = min(self.g[index], self.rhs[index])
+        columns = self.grid_model.num_of_columns
+        heuristic = abs(self.end_y - index // columns) + abs(self.end_x - index % columns)
+        return (distance + heuristic, distance)
+
+    def get_neighbors(self, index):
+        """
+        Returns the indexes of every cell next to the cell at the index given,
+        including the marked cells.
+
+        @param index: int
+        @return: List
+        """
+        grid_model = self.grid_model
+        return grid_model.grid_neighbor_ids[grid_model.neighbor_offsets[index]:grid_model.neighbor_offsets[index+1]]
+
+    def calculate_rhs(self, index):
+        """
+        Returns the rhs value of the cell at the index given, which is the smallest g value of
+        the cells next to it added to its weight (or infinity if the cell is marked).
+
+        @param index: int
+        @return: float
+        """
+        grid_model = self.grid_model
+        if grid_model.walls[index]:
+            return INFINITY
+
+        g = self.g
+        walls = grid_model.walls
+        best = INFINITY
+        for neighbor in self.get_neighbors(index):
+            if walls[neighbor] == 0 and g[neighbor] < best:
+                best = g[neighbor]
+
+        return best + grid_model.weights[index]
+
+    def update_vertex(self, index):
+        """
+        Works out the rhs value of the cell at the index given again, and then makes
+        sure that the cell is in the frontier only if it is inconsistent.
+
+        @param index: int
+        """
+        if index != self.start_index:
+            self.rhs[index] = self.calculate_rhs(index)
+
+        self.frontier.remove(index)
+        if self.g[index] != self.rhs[index]:
+            self.frontier.enqueue(index, self.calculate_key(index))
+
+    def compute_shortest_path(self, checked_nodes, budget):
+        """
+        Expands the inconsistent cells in the frontier until the end node is
+        consistent and no cell in the frontier could give it a shorter path.
+        The index of every expanded cell is added to checked_nodes.
+
+        The budget given is checked in the same way as in PathfindingEngine.iter_events. If it runs out
+        the cells which haven't been repaired yet are left in the frontier, so the next run carries on
+        from where this one stopped.
+
+        @param checked_nodes: List
+        @param budget: SearchBudget
+        """
+        end_index = self.end_index
+        g = self.g
+        rhs = self.rhs
+        check_interval = countdown = budget.get_check_interval()
+        while self.frontier.is_empty() == False and (self.frontier.peek_priority() < self.calculate_key(end_index) or rhs[end_index] != g[end_index]):
+            countdown -= 1
+            if countdown == 0:
+                budget.add_expansions(check_interval)
+                if budget.check():
+                    self.is_repaired = False
+                    return
+                check_interval = countdown = budget.get_check_interval()
+
+            index = self.frontier.dequeue()
+            checked_nodes.append(index)
+
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+            else:
+                g[index] = INFINITY
+                self.update_vertex(index)
+
+            for neighbor in self.get_neighbors(index):
+                self.update_vertex(neighbor)
+
+        budget.add_expansions(check_interval - countdown)
+        self.is_repaired = True
+
+    def get_path(self):
+        """
+        Returns a list containing the indexes of the cells on the path from the start node
+        to the end node, which is found by going back from the end node to whichever cell next
+        to it has the smallest g value. If there is no path an empty list is returned.
+
+        @return: List
+        """
+        g = self.g
+        walls = self.grid_model.walls
+        if g[self.end_index] == INFINITY:
+            return []
+
+        path = [self.end_index]
+        index = self.end_index
+        while index != self.start_index:
+            best = -1
+            for neighbor in self.get_neighbors(index):
+                if walls[neighbor] == 0 and (best == -1 or g[neighbor] < g[best]):
+                    best = neighbor
+
+            # NOTE(ali): This can't happen when every g value is consistent, but
+            #            it makes sure a bad state can never cause an infinite loop.
+            if best == -1 or g[best] >= g[index] or len(path) > self.grid_model.num_of_cells:
+                return []
+
+            path.append(best)
+            index = best
+
+        path.reverse()
+        return path
+
+    def update_changed_cells(self, grid_model):
+        """
+        Updates every cell which has changed since the last run and the cells next to them (or
+        starts again from scratch if needs_reset returns True), which adds every cell which has
+        become inconsistent to the frontier without repairing any g values yet.
+
+        @param grid_model: GridModel
+        """
+        if self.needs_reset(grid_model):
+            self.reset(grid_model)
+        else:
+            changed_cells = self.changed_cells
+            self.changed_cells = set()
+            for index in changed_cells:
+                self.update_vertex(index)
+                for neighbor in self.get_neighbors(index):
+                    self.update_vertex(neighbor)
+
+    def skip_repair(self, grid_model):
+        """
+        This is used instead of run when the end node can't be reached from the start node at all
+        (see PathfindingEngine.start_events). The changed cells are still taken in by update_changed_cells
+        so that needs_update returns False until the board changes again, but nothing is repaired. The cells
+        which still have to be repaired stay in the frontier, so the run after a change has connected the
+        start node and the end node again repairs them along with the cells which have changed since.
+
+        @param grid_model: GridModel
+        """
+        self.update_changed_cells(grid_model)
+        self.is_repaired = True
+
+    def run(self, grid_model, budget=None):
+        """
+        Updates every cell which has changed since the last run (or starts again from scratch
+        if needs_reset returns True), repairs the g values and returns the indexes of the cells
+        which were expanded and the indexes of the cells on the path.
+
+        If a SearchBudget is given the repair is stopped once it has run out of budget (see
+        compute_shortest_path), and the path is then an empty list, since the g values it would
+        be found from might not have been repaired yet.
+
+        @param grid_model: GridModel
+        @param budget: SearchBudget or None
+        @return: Tuple
+        """
+        if budget == None:
+            budget = SearchBudget()
+
+        self.update_changed_cells(grid_model)
+
+        checked_nodes = []
+        self.compute_shortest_path(checked_nodes, budget)
+        if budget.is_stopped_early:
+            return checked_nodes, []
+        return checked_nodes, self.get_path()
@@ -48,6 +48,17 @@ def main():
     astar = AStar(screen_manager, rect_array, color_manager, animation_manager)
     greedy_bfs = GreedyBFS(screen_manager, rect_array, color_manager, animation_manager)
     bidirectional_bfs = BidirectionalBFS(screen_manager, rect_array, color_manager, animation_manager)
+    dial_dijkastra = DialDijkastra(screen_manager, rect_array, color_manager, animation_manager)
+    jump_point_search = JumpPointSearch(screen_manager, rect_array, color_manager, animation_manager)
+    lpa_star = LPAStar(screen_manager, rect_array, color_manager, animation_manager)
+    bidirectional_dijkastra = BidirectionalDijkastra(screen_manager, rect_array, color_manager, animation_manager)
+    bidirectional_astar = BidirectionalAStar(screen_manager, rect_array, color_manager, animation_manager)
+    hpa_star = HPAStar(screen_manager, rect_array, color_manager, animation_manager)
+    flow_field = FlowField(screen_manager, rect_array, color_manager, animation_manager)
+    bitboard_bfs = BitboardBFS(screen_manager, rect_array, color_manager, animation_manager)
+    ara_star = ARAStar(screen_manager, rect_array, color_manager, animation_manager)
+    ida_star = IDAStar(screen_manager, rect_array, color_manager, animation_manager)
+    fringe_search = FringeSearch(screen_manager, rect_array, color_manager, animation_manager)
 
     pathfinding_algorithms_dict = {
         PathfindingAlgorithmTypes.DFS: dfs,
@@ -55,7 +66,18 @@ def main():
         PathfindingAlgorithmTypes.DIJKASTRA: dijkastra,
         PathfindingAlgorithmTypes.ASTAR: astar,
         PathfindingAlgorithmTypes.GREEDY_BFS: greedy_bfs,
-        PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS: bidirectional_bfs
+        PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS: bidirectional_bfs,
+        PathfindingAlgorithmTypes.DIAL_DIJKASTRA: dial_dijkastra,
+        PathfindingAlgorithmTypes.JUMP_POINT_SEARCH: jump_point_search,
+        PathfindingAlgorithmTypes.LPA_STAR: lpa_star,
+        PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA: bidirectional_dijkastra,
+        PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR: bidirectional_astar,
+        PathfindingAlgorithmTypes.HPA_STAR: hpa_star,
+        PathfindingAlgorithmTypes.FLOW_FIELD: flow_field,
+        PathfindingAlgorithmTypes.BITBOARD_BFS: bitboard_bfs,
+        PathfindingAlgorithmTypes.ARA_STAR: ara_star,
+        PathfindingAlgorithmTypes.IDA_STAR: ida_star,
+        PathfindingAlgorithmTypes.FRINGE_SEARCH: fringe_search
     }
 
     random_weighted_maze = RandomWeightedMaze(screen_manager, rect_array, color_manager, animation_manager)
@@ -86,6 +108,7 @@ def main():
 
     mark_spray = False
     unmark_spray = False
+    drag_start_node = False
 
     current_pathfinding_algorithm = None
     current_maze_generation_algorithm = None
@@ -97,6 +120,7 @@ def main():
         time_delta = clock.tick(60)/1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                shutdown_search_executor()
                 client.create_network_event(NetworkingEventTypes.DISCONNECT_FROM_SERVER)
                 server.shutdown()
                 pygame.quit()
@@ -151,9 +175,7 @@ def main():
                         mark_spray = True
 
                     elif event.button == 2:
-                        mouse_pos = pygame.mouse.get_pos()
-                        grid.mark_start_node_at_mouse_pos(mouse_pos)
-                        client.create_network_event(NetworkingEventTypes.SET_START_NODE, mouse_pos)
+                        drag_start_node = True
 
                     elif event.button == 3:
                         unmark_spray = True
@@ -161,6 +183,7 @@ def main():
                 if event.type == pygame.MOUSEBUTTONUP:
                     mark_spray = False
                     unmark_spray = False
+                    drag_start_node = False
 
                 if event.type == pygame.MOUSEWHEEL:
                     mouse_pos = pygame.mouse.get_pos()
@@ -210,6 +233,24 @@ def main():
             grid.unmark_node_at_mouse_pos(mouse_pos)
             client.create_network_event(NetworkingEventTypes.REMOVE_NODE, mouse_pos)
 
+        # NOTE(ali): The start node follows the mouse while the middle mouse button is held down,
+        #            and we only tell the other clients about it when it has actually moved.
+        if drag_start_node:
+            mouse_pos = pygame.mouse.get_pos()
+            start_index = rect_array.grid_model.start_index
+            grid.mark_start_node_at_mouse_pos(mouse_pos)
+            if rect_array.grid_model.start_index != start_index:
+                client.create_network_event(NetworkingEventTypes.SET_START_NODE, mouse_pos)
+
+        # NOTE(ali): Lifelong Planning A* can repair its path whenever the grid changes,
+        #            so we keep the path up to date while nodes are being marked and unmarked.
+        #            The flow field can find the path from any start node straight away, so
+        #            we keep the path up to date while the start node is being dragged around.
+        if screen_lock == False and current_pathfinding_algorithm != None and current_pathfinding_algorithm.type == PathfindingAlgorithmTypes.LPA_STAR:
+            current_pathfinding_algorithm.replan()
+        elif screen_lock == False and current_pathfinding_algorithm != None and current_pathfinding_algorithm.type == PathfindingAlgorithmTypes.FLOW_FIELD:
+            current_pathfinding_algorithm.update_preview()
+
         screen.fill(color_manager.BOARD_COLOR)
         border_or_background_color = animation_manager.update_border_and_board_interpolation()
 
@@ -257,6 +298,13 @@ def main():
             current_pathfinding_algorithm = new_pathfinding_algorithm[1]
             ui_manager.update_current_pathfinding_algorithm(current_pathfinding_algorithm.type, current_pathfinding_algorithm.heuristic, True)
 
+        # NOTE(ali): The algorithm the server told us to run is taken from the client instead of from
+        #            current_pathfinding_algorithm, since it might have changed after we checked above.
+        if client.run_current_pathfinding_algorithm:
+            client.reset_run_current_pathfinding_algorithm()
+            ui_manager.run_pathfinding_algorithm(client.current_pathfinding_algorithm, client.current_pathfinding_algorithm.heuristic)
+            pygame.time.set_timer(DRAW_CHECKED_NODES, pathfinding_algorithm_speed)
+
         new_maze_generation_algorithm = client.update_current_maze_generation_algorithm(current_maze_generation_algorithm)
         if new_maze_generation_algorithm[0]:
             current_maze_generation_algorithm = new_maze_generation_algorithm[1]
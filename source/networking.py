@@ -5,7 +5,7 @@ import socket
 import threading
 import json
 
-from pathfinding_algorithms import PathfindingAlgorithmTypes, PathfindingHeuristics
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingHeuristics
 from maze_generation_algorithms import MazeGenerationAlgorithmTypes
 from animations import AnimationTypes
 from color_manager import *
@@ -71,6 +71,10 @@ class Client:
         self.cancel_recursive_division = False
         self.recursive_division_cut_off_point = None
 
+        # NOTE(ali): The pathfinding algorithms can only be run from the main loop (see PathfindingAlgorithm.run),
+        #            so when the server tells us to run one we only set this and the main loop runs it.
+        self.run_current_pathfinding_algorithm = False
+
         self.resolution_divider = None
         self.pathfinding_algorithm_speed = 25
         self.recursive_division_speed = 15
@@ -317,6 +321,12 @@ class Client:
         """
         self.cancel_pathfinding_algorithm = False
 
+    def reset_run_current_pathfinding_algorithm(self):
+        """
+        This function will set the run_current_pathfinding_algorithm attribute to False.
+        """
+        self.run_current_pathfinding_algorithm = False
+
     def reset_cancel_recursive_division(self):
         """
         This function will set the cancel_recursive_division and
@@ -409,21 +419,11 @@ class Client:
                         else:
                             heuristic = None
 
-                        self.rect_array_obj.reset_rect_array_adjacent_nodes()
-                        self.rect_array_obj.gen_rect_array_with_adjacent_nodes()
-                        self.rect_array_obj.reset_non_user_weights()
-
                         self.current_pathfinding_algorithm = self.pathfinding_algorithms_dict[pathfinding_algorithm_type]
-
-                        self.current_pathfinding_algorithm.reset_animated_checked_coords_stack()
-                        self.current_pathfinding_algorithm.reset_animated_path_coords_stack()
-
                         self.current_pathfinding_algorithm.heuristic = heuristic
-                        self.current_pathfinding_algorithm.run()
-
-                        pygame.time.set_timer(self.events_dict['DRAW_CHECKED_NODES'], 25)
 
                         self.changed_current_pathfinding_algorithm = True
+                        self.run_current_pathfinding_algorithm = True
 
                     case NetworkingEventTypes.RUN_MAZE_GENERATION_ALGORITHM:
                         maze_generation_algorithm_type = args[0]
@@ -0,0 +1,117 @@
+from array import array
+import hashlib
+
+from pathfinding_engine import PathfindingResult
+
+class PathCache:
+    def __init__(self, max_num_of_bytes=8*1024*1024):
+        """
+        Initializes the PathCache class.
+
+        The PathCache keeps the results of the pathfinding algorithms which have been run, so that
+        running the same algorithm again on a board which hasn't changed doesn't have to run the
+        algorithm again. The results are stored in self.results where the key is made by get_key from
+        the board hash of the GridModel (see GridModel.board_hash), the start node, the end node, the
+        algorithm type and the heuristic. The checked nodes, path and layer ends of each result are
+        stored as arrays of ints so that they take up as little memory as possible.
+
+        The board hash is only 64 bits, so two different boards can have the same hash. Each result is
+        saved with the fingerprint of the board it was found on (see get_fingerprint), and a result is
+        only taken from the cache if its fingerprint is the same as the fingerprint of the board it is
+        asked for on, so a path through walls is never taken from a board with the same hash.
+
+        Once the results take up more than max_num_of_bytes bytes the results which were used the
+        longest time ago are removed until they fit again.
+
+        @param max_num_of_bytes: int
+        """
+        self.max_num_of_bytes = max_num_of_bytes
+        self.num_of_bytes = 0
+        self.results = {}
+
+    def get_key(self, grid_model, algorithm_type, heuristic):
+        """
+        Returns the key for the result of running the algorithm type given
+        with the heuristic given on the current board of the grid_model given.
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param heuristic: PathfindingHeuristics or None
+        @return: Tuple
+        """
+        return (grid_model.board_hash, grid_model.num_of_rows, grid_model.num_of_columns, grid_model.start_index,
+                grid_model.end_index, int(algorithm_type), None if heuristic == None else int(heuristic))
+
+    def get_fingerprint(self, grid_model):
+        """
+        Returns the fingerprint of the current board of the grid_model given, which is the walls
+        of every cell (one byte each) and a digest of the weights of every cell.
+
+        @param grid_model: GridModel
+        @return: Tuple
+        """
+        return bytes(grid_model.walls), hashlib.blake2b(grid_model.weights, digest_size=16).digest()
+
+    def get_num_of_bytes(self, entry):
+        """
+        Returns the number of bytes taken up by the arrays of the result and by the fingerprint of the entry given.
+
+        @param entry: Tuple
+        @return: int
+        """
+        fingerprint, result = entry
+        num_of_result_bytes = result.checked_nodes.itemsize*(len(result.checked_nodes) + len(result.path) + len(result.layer_ends))
+        return num_of_result_bytes + len(fingerprint[0]) + len(fingerprint[1])
+
+    def get(self, key, grid_model):
+        """
+        Returns the result saved for the key given, or None if there isn't one or if it was
+        found on a different board than the current board of the grid_model given.
+
+        @param key: Tuple
+        @param grid_model: GridModel
+        @return: PathfindingResult or None
+        """
+        entry = self.results.get(key)
+        if entry == None or entry[0] != self.get_fingerprint(grid_model):
+            return None
+
+        # NOTE(ali): Dictionaries keep the order that keys were added in, so adding
+        #            the entry back at the end keeps the most recently used entry last.
+        del self.results[key]
+        self.results[key] = entry
+        return entry[1]
+
+    def put(self, key, result, grid_model):
+        """
+        Saves the result given (found on the current board of the grid_model given) for the key
+        given, and then removes the results which were used the longest time ago until the results
+        fit in max_num_of_bytes again. If the result given is too big to fit on its own it isn't saved.
+
+        @param key: Tuple
+        @param result: PathfindingResult
+        @param grid_model: GridModel
+        """
+        result = PathfindingResult(array('i', result.checked_nodes), array('i', result.path), array('i', result.layer_ends))
+        entry = (self.get_fingerprint(grid_model), result)
+        num_of_bytes = self.get_num_of_bytes(entry)
+        if num_of_bytes > self.max_num_of_bytes:
+            return
+
+        old_entry = self.results.pop(key, None)
+        if old_entry != None:
+            self.num_of_bytes -= self.get_num_of_bytes(old_entry)
+
+        self.results[key] = entry
+        self.num_of_bytes += num_of_bytes
+
+        while self.num_of_bytes > self.max_num_of_bytes:
+            oldest_key = next(iter(self.results))
+            self.num_of_bytes -= self.get_num_of_bytes(self.results.pop(oldest_key))
+
+    def clear(self):
+        """
+        Removes every result from the cache.
+        """
+        self.results = {}
+        self.num_of_bytes = 0
@@ -1,30 +1,91 @@
 import pygame
 from pygame.locals import *
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import time
 
 from animations import *
 
 from stack import Stack
-from queue_classes import Queue, PriorityQueue
 
-from enum import IntEnum
-
-class PathfindingAlgorithmTypes(IntEnum):
-    DFS = 0,
-    BFS = 1,
-    DIJKASTRA = 2,
-    ASTAR = 3,
-    GREEDY_BFS = 4,
-    BIDIRECTIONAL_BFS = 5
-
-class PathfindingHeuristics(IntEnum):
-    MANHATTAN_DISTANCE = 0,
-    EUCLIDEAN_DISTANCE = 1
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingHeuristics, PathfindingEventTypes, PathfindingResult, PathfindingEngine
+from path_cache import PathCache
+from search_budget import SearchBudget, SearchStopReasons
 
 class PathfindingAlgorithm:
+    # NOTE(ali): This is shared between every pathfinding algorithm, so running any
+    #            algorithm again (including from a networked client) on a board which
+    #            hasn't changed reuses the result from the last time it was run.
+    path_cache = PathCache()
+
+    # NOTE(ali): The engine is run on this thread instead of the main thread so that the
+    #            window keeps being drawn while an algorithm is running. There is only one
+    #            worker so only one algorithm is ever running at the same time.
+    search_executor = ThreadPoolExecutor(max_workers=1)
+
+    # NOTE(ali): The engine hands its events (see PathfindingEngine.iter_events) to the main loop in
+    #            batches of EVENT_BATCH_SIZE events, and at most EVENT_BUFFER_SIZE batches can be waiting
+    #            at the same time. The main loop only takes a batch once it has nearly drawn every checked
+    #            node it already has, so when the buffer is full the engine waits for the animation to catch
+    #            up instead of storing every cell it has checked.
+    EVENT_BATCH_SIZE = 256
+    EVENT_BUFFER_SIZE = 8
+
+    # NOTE(ali): If the buffer stays full and the main loop hasn't looked for events (see update_search)
+    #            for this many seconds, the engine gives up on the search instead of waiting for a main
+    #            loop which has gone (search_executor's thread would otherwise stop the game from quitting).
+    EVENT_CONSUMER_TIMEOUT = 10.0
+
+    # NOTE(ali): The budget given to every search (see SearchBudget). The time the engine spends waiting
+    #            for its events to be drawn isn't counted, so this only stops searches which are slow to run
+    #            (the path found so far is drawn instead), not searches which are slow to animate.
+    MAX_SEARCH_TIME = 5.0
+    MAX_SEARCH_EXPANSIONS = None
+
+    # NOTE(ali): The pathfinding algorithm whose search is running on search_executor at the moment.
+    #            Its search is cancelled when any other algorithm is run, since nothing would ever take
+    #            its events once it isn't being drawn and it would stop search_executor from running anything else.
+    active_search = None
+
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
         Initializes the PathfindingAlgorithm class.
 
+        The pathfinding algorithms themselves are run by the PathfindingEngine (see
+        pathfinding_engine.py) which does not depend on pygame. This class and its child
+        classes only run the engine with the GridModel in self.rect_array_obj and then
+        draw and animate the checked nodes and path which the engine returns.
+
+        The results of the engine are saved in PathfindingAlgorithm.path_cache (see path_cache.py).
+
+        The engine is run on PathfindingAlgorithm.search_executor so that it doesn't stop the main
+        loop from drawing the window. The engine never reads the GridModel in self.rect_array_obj
+        (which is changed by the main loop) while it is running, instead it runs on self.search_model
+        which is a copy of the board that is only brought up to date on the main thread before the
+        engine is run (see get_search_model). self.search_future is the Future of the last time the
+        engine was run, self.search_events is the queue which the engine puts its events in (see
+        send_events and update_search), and self.search_budget is the SearchBudget of the search which
+        is also used to cancel it. self.search_update_time is the last time the main loop looked for events
+        from the engine, which the engine uses to tell when nothing is going to take its events any more.
+        self.run_pending is True when the algorithm has been run while its last
+        search was still stopping, so the new search is started by update_search once it has stopped.
+
+        Algorithms which find better paths as they go (see PathfindingEngine.iter_ara_star) send each
+        path they find before the last one as a PATH_IMPROVED event. These are kept in self.improved_paths
+        as tuples of the number of checked nodes which had been found at the time and the coordinates of
+        the path, and each path replaces the one on the screen once its checked nodes have been drawn
+        (see show_improved_paths).
+
+        The pathfinding algorithms which keep their path up to date while the board is being changed (see
+        LPAStar.replan and FlowField.update_preview) run the engine on search_executor as well, but without
+        streaming its events (see start_background_search). self.background_search is True while the result
+        of one of these runs hasn't been taken yet.
+
+        self.search_stop_reason and self.search_num_of_expansions are the SearchStopReasons and the
+        number of expanded cells of the last search (or of the result taken from self.path_cache), so
+        the UI can tell whether the path on the screen is only the best path found before it was stopped.
+
         @param screen_manager: ScreenManager
         @param rect_array_obj: RectArray
         @param color_manager: ColorManager
@@ -34,34 +95,44 @@ class PathfindingAlgorithm:
         self.rect_array_obj = rect_array_obj
         self.animation_manager = animation_manager
         self.color_manager = color_manager
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.checked_nodes = Stack()
+        self.path = Stack()
         self.drawn_checked_nodes = False
         self.checked_nodes_pointer = -1
         self.path_pointer = -1
-        self.animated_coords = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.animated_checked_coords = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.animated_path_coords = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.animated_checked_nodes_pointer = 0
+        self.animated_path_coords = Stack()
         self.heuristic = None
         self.reset_checked_nodes = False
         self.reset_path_nodes = False
+        self.layer_ends = []
         self.type = type
-
-    def reset_animated_checked_coords_stack(self):
-        """
-        This function will set the value of the self.animated_checked_coords attribute to be a new stack which
-        will have a size that is the same as the number of nodes in the grid (we can calculate this by multiplying
-        the num_of_rows attribute by the num_of_columns attribute which are both found in self.screen_manager.
-        """
-        self.animated_checked_coords = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.engine = PathfindingEngine()
+        self.search_model = None
+        self.search_future = None
+        self.search_key = None
+        self.search_events = None
+        self.search_budget = SearchBudget()
+        self.search_update_time = 0
+        self.run_pending = False
+        self.background_search = False
+        self.improved_paths = []
+        self.search_stop_reason = SearchStopReasons.FINISHED
+        self.search_num_of_expansions = 0
+
+    def reset_animated_checked_nodes_pointer(self):
+        """
+        This function will set the animated_checked_nodes_pointer attribute back to 0, so that
+        every checked node in the checked_nodes stack is animated again when it is next drawn.
+        """
+        self.animated_checked_nodes_pointer = 0
 
     def reset_animated_path_coords_stack(self):
         """
-        This function will set the value of the self.animated_path_coords attribute to be a new stack which
-        will have a size that is the same as the number of nodes in the grid (we can calculate this by multiplying
-        the num_of_rows attribute by the num_of_columns attribute which are both found in self.screen_manager.
+        This function will set the value of the self.animated_path_coords attribute to be a new empty
+        stack, which only grows as the path nodes are animated (see draw).
         """
-        self.animated_path_coords = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.animated_path_coords = Stack()
 
     def get_checked_nodes(self):
         """
@@ -105,14 +176,16 @@ class PathfindingAlgorithm:
         if self.reset_checked_nodes == False:
             for coord in self.checked_nodes.gen_copy_without_empty_values()[:self.checked_nodes_pointer]:
                 if check_for_colliding_path_nodes:
-                    if coord not in self.path.gen_copy_without_empty_values():
+                    if self.path.exists(coord) == False:
                         self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.SHRINKING_SQUARE, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
                 else:
                     self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.SHRINKING_SQUARE, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR, AnimationBackgroundTypes.THEME_BACKGROUND)
 
         self.checked_nodes_pointer = -1
+        self.animated_checked_nodes_pointer = 0
         self.reset_checked_nodes = True
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.checked_nodes = Stack()
+        self.cancel_search()
 
     def update_checked_nodes_pointer(self):
         """
@@ -121,10 +194,32 @@ class PathfindingAlgorithm:
         stack (we can get the total size of the stack by using the get_size method in self.checked_nodes),
         otherwise we will return -1.
 
+        If the algorithm checks a whole layer of nodes at once (self.layer_ends is not empty) the
+        checked_nodes_pointer attribute is moved to the end of the next layer instead, so each
+        layer is drawn at the same time like a wave.
+
+        While the engine is still running the checked nodes it has found so far are added to the
+        checked_nodes stack first (see update_search). If the checked_nodes_pointer attribute has
+        caught up with them (or the end of the next layer hasn't been found yet), it stays where it
+        is and 0 is returned so that we wait for the engine, and -1 is only returned once the engine
+        has finished and every checked node has been drawn. 0 is also returned while the search is
+        waiting for the last search of this algorithm to stop (see run).
+
         @return: int
         """
+        self.update_search()
+        if self.run_pending:
+            return 0
+        self.show_improved_paths()
+
         if self.checked_nodes_pointer != self.checked_nodes.get_size():
-            self.checked_nodes_pointer += 1
+            position = bisect_right(self.layer_ends, self.checked_nodes_pointer)
+            if position != len(self.layer_ends):
+                self.checked_nodes_pointer = self.layer_ends[position]
+            elif len(self.layer_ends) == 0 or self.search_key == None:
+                self.checked_nodes_pointer += 1
+            return 0
+        elif self.search_key != None:
             return 0
         else:
             return -1
@@ -148,7 +243,7 @@ class PathfindingAlgorithm:
             if self.path_pointer != -1:
                 for coord in self.path.gen_copy_without_empty_values()[:self.path_pointer]:
                     if use_checked_nodes_foreground_color:
-                        if coord in self.checked_nodes.gen_copy_without_empty_values():
+                        if self.checked_nodes.exists(coord):
                             self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.SHRINKING_SQUARE, self.color_manager.PATH_NODE_FOREGROUND_COLOR, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR)
                             continue
 
@@ -156,7 +251,7 @@ class PathfindingAlgorithm:
 
         self.path_pointer = -1
         self.reset_path_nodes = True
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        self.path = Stack()
 
     def update_path_pointer(self):
         """
@@ -172,34 +267,322 @@ class PathfindingAlgorithm:
         else:
             return -1
 
-    def get_euclidean_distance(self, coords, end_node_coords):
+    def get_search_model(self):
         """
-        This function will calculate the Euclidean distance between
-        2 coordinates.
+        Brings self.search_model up to date with the GridModel in self.rect_array_obj (it is
+        copied again if the grid has changed size) and returns it. This has to be called on the
+        main thread, and never while the engine is running.
 
-        @param coords: List
-        @param end_node_coords: List
-        @return: int
+        @return: GridModel
         """
-        diff_row = end_node_coords[0]+1 - coords[0]
-        diff_column = end_node_coords[1]+1 - coords[1]
-        return (diff_row**2) + (diff_column**2)
+        grid_model = self.rect_array_obj.grid_model
+        if (self.search_model == None or self.search_model.num_of_rows != grid_model.num_of_rows or
+                self.search_model.num_of_columns != grid_model.num_of_columns):
+            self.search_model = grid_model.copy()
+        else:
+            self.search_model.sync_from(grid_model)
 
-    def get_manhattan_distance(self, coords, end_node_coords):
+        return self.search_model
+
+    def is_searching(self):
         """
-        This function will calculate the Manhattan distance between
-        two coordinates.
+        Returns True if the engine is still running (or is waiting to be run) on search_executor.
 
-        @param coords: List
-        @param end_node_coords: List
-        @return: int
+        @return: bool
+        """
+        return self.search_future != None and self.search_future.done() == False
+
+    def cancel_search(self):
+        """
+        Stops the search which is running on search_executor (if there is one) and forgets about it,
+        so none of its events are added to the checked_nodes stack or the path stack.
+        """
+        self.search_budget.cancel()
+        self.search_key = None
+        self.run_pending = False
+        self.background_search = False
+        self.improved_paths = []
+        if PathfindingAlgorithm.active_search is self:
+            PathfindingAlgorithm.active_search = None
+
+    def run(self):
+        """
+        Runs the pathfinding algorithm with the type in the type attribute on the GridModel
+        in self.rect_array_obj using self.engine. This function doesn't wait for the engine
+        to finish, the coordinates of the checked nodes and the path nodes are added to the
+        checked_nodes stack and the path stack as the engine finds them (see update_search).
+
+        If the same algorithm has already been run with the same heuristic on the same board
+        (with the same start node and end node) the result is taken from self.path_cache and
+        the engine isn't run at all.
+        """
+        self.reset_path_nodes = False
+        self.reset_checked_nodes = False
+
+        self.checked_nodes_pointer = -1
+        self.path_pointer = -1
+
+        if PathfindingAlgorithm.active_search != None:
+            PathfindingAlgorithm.active_search.cancel_search()
+
+        self.checked_nodes = Stack()
+        self.path = Stack()
+        self.animated_checked_nodes_pointer = 0
+        self.layer_ends = []
+        self.improved_paths = []
+
+        # NOTE(ali): The search which was cancelled might still be running on self.engine and
+        #            self.search_model, so they can't be changed again until it has stopped. Instead
+        #            of waiting for it here (which would stop the window from being drawn) the search
+        #            is started by update_search once it has stopped.
+        if self.is_searching():
+            self.run_pending = True
+            PathfindingAlgorithm.active_search = self
+            return
+
+        self.start_search()
+
+    def start_search(self):
+        """
+        Brings self.search_model up to date and starts running self.engine on it on search_executor,
+        or loads the result from self.path_cache if the same search has already been run on the same
+        board. This is only called once the last search of this pathfinding algorithm has stopped.
         """
-        diff_row = abs(end_node_coords[0] - coords[0])
-        diff_column = abs(end_node_coords[1] - coords[1])
-        manhattan_distance = diff_row + diff_column
-        # NOTE(ali): This makes sure that the heuristic and distance values
-        #            don't mess each other up.
-        return manhattan_distance*3
+        self.run_pending = False
+        grid_model = self.get_search_model()
+        key = self.path_cache.get_key(grid_model, self.type, self.heuristic)
+        result = self.path_cache.get(key, grid_model)
+        if result != None:
+            self.load_result(grid_model, result)
+            return
+
+        self.search_key = key
+        self.search_update_time = time.perf_counter()
+        self.search_events = queue.Queue(maxsize=self.EVENT_BUFFER_SIZE)
+        self.search_budget = self.create_search_budget()
+        self.search_future = self.search_executor.submit(self.send_events, grid_model, self.type, self.heuristic,
+                                                         self.search_events, self.search_budget)
+        PathfindingAlgorithm.active_search = self
+
+    def start_background_search(self, grid_model):
+        """
+        Starts running self.engine on search_executor with the grid_model given (which has to be the
+        one returned by get_search_model) without streaming its events, so the repair of the planner and
+        the ComponentIndex check before it never hold up the main loop. The result is taken once the engine
+        has finished by get_background_search_result, and the search can be cancelled like any other search.
+
+        @param grid_model: GridModel
+        """
+        self.search_budget = self.create_search_budget()
+        self.search_future = self.search_executor.submit(self.engine.run, grid_model, self.type, self.heuristic, self.search_budget)
+        self.background_search = True
+        PathfindingAlgorithm.active_search = self
+
+    def get_background_search_result(self):
+        """
+        Returns the PathfindingResult of the search started by start_background_search once the engine has
+        finished, or None if there isn't one (or it is still running). If the engine raised an exception it is
+        raised again here on the main thread.
+
+        @return: PathfindingResult or None
+        """
+        if self.background_search == False or self.is_searching():
+            return None
+
+        self.background_search = False
+        if PathfindingAlgorithm.active_search is self:
+            PathfindingAlgorithm.active_search = None
+        return self.search_future.result()
+
+    def create_search_budget(self):
+        """
+        Returns the SearchBudget which the engine is run with.
+
+        @return: SearchBudget
+        """
+        return SearchBudget(self.MAX_SEARCH_TIME, self.MAX_SEARCH_EXPANSIONS)
+
+    def send_events(self, grid_model, algorithm_type, heuristic, events, budget):
+        """
+        This function is run on search_executor. It runs self.engine one step at a time with the
+        budget given and puts its events into the events queue given in batches of EVENT_BATCH_SIZE
+        events. If the queue is full it waits until the main loop has taken a batch out of it (which
+        isn't counted towards the budget), and it stops as soon as the budget has been cancelled (the
+        generator is then thrown away, which stops the algorithm). The budget is cancelled here as well
+        if the main loop hasn't looked for events for EVENT_CONSUMER_TIMEOUT seconds while it is waiting.
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param heuristic: PathfindingHeuristics or None
+        @param events: queue.Queue
+        @param budget: SearchBudget
+        """
+        batch = []
+        for event in self.engine.iter_events(grid_model, algorithm_type, heuristic, budget):
+            batch.append(event)
+            if len(batch) == self.EVENT_BATCH_SIZE or event[0] in (PathfindingEventTypes.PATH_FOUND, PathfindingEventTypes.PATH_IMPROVED):
+                budget.pause()
+                while budget.cancelled == False:
+                    try:
+                        events.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if time.perf_counter() - self.search_update_time > self.EVENT_CONSUMER_TIMEOUT:
+                            budget.cancel()
+                else:
+                    return
+                budget.resume()
+                batch = []
+
+    def needs_events(self):
+        """
+        Returns True if the main loop should take another batch of events from the engine, which is
+        when it has nearly drawn every checked node it already has, or when it is waiting for the
+        end of a layer which hasn't been found yet.
+
+        @return: bool
+        """
+        if len(self.layer_ends) != 0 and self.layer_ends[-1] <= self.checked_nodes_pointer:
+            return True
+        return self.checked_nodes.get_size() - self.checked_nodes_pointer <= self.EVENT_BATCH_SIZE
+
+    def update_search(self):
+        """
+        Takes the batches of events which the engine has sent (see send_events) while needs_events
+        returns True, and adds the coordinates of the checked nodes in them to the checked_nodes stack
+        so that they can be drawn while the engine is still running. Once the PATH_FOUND event has been
+        taken the path is added to the path stack and the result is saved in self.path_cache.
+
+        The paths in PATH_IMPROVED events are added to self.improved_paths. If there have been any, the
+        path in the PATH_FOUND event is added to self.improved_paths as well so that it replaces them
+        in the same way once every checked node has been drawn.
+
+        If self.run_pending is True the new search is started here once the last one has stopped.
+        """
+        if self.run_pending:
+            if self.is_searching():
+                return
+            self.start_search()
+
+        if self.search_key == None:
+            return
+
+        self.search_update_time = time.perf_counter()
+        grid_model = self.search_model
+        while self.needs_events():
+            try:
+                batch = self.search_events.get_nowait()
+            except queue.Empty:
+                # NOTE(ali): If the engine has stopped without sending every event it has either raised an
+                #            exception (calling result raises it again here on the main thread), or it gave up
+                #            because the main loop didn't look for events for too long (see send_events), in
+                #            which case the search is finished with the checked nodes it had sent and no path.
+                if self.search_future.done() and self.search_events.empty():
+                    self.search_future.result()
+                    if self.search_budget.stop_reason == None:
+                        self.search_budget.stop(SearchStopReasons.CANCELLED)
+                    self.finish_search([])
+                return
+
+            for event_type, value in batch:
+                if event_type == PathfindingEventTypes.FRONTIER_PUSH:
+                    self.checked_nodes.push(grid_model.get_coords(value))
+                elif event_type == PathfindingEventTypes.LAYER_END:
+                    self.layer_ends.append(value)
+                elif event_type == PathfindingEventTypes.PATH_IMPROVED:
+                    self.improved_paths.append((self.checked_nodes.get_size(), [grid_model.get_coords(index) for index in value]))
+                elif event_type == PathfindingEventTypes.PATH_FOUND:
+                    if self.path_pointer != -1 or len(self.improved_paths) != 0:
+                        self.improved_paths.append((self.checked_nodes.get_size(), [grid_model.get_coords(index) for index in value]))
+                    else:
+                        for index in value:
+                            self.path.push(grid_model.get_coords(index))
+                    self.finish_search(value)
+                    return
+
+    def show_improved_paths(self):
+        """
+        Replaces the path stack with the last path in self.improved_paths whose checked nodes have all been
+        drawn, and draws it straight away instead of animating it one node at a time. The nodes of the old
+        path which aren't on the new path are animated back to the colour of a checked node (or the board).
+        """
+        path = None
+        while len(self.improved_paths) != 0 and self.improved_paths[0][0] <= self.checked_nodes_pointer:
+            path = self.improved_paths.pop(0)[1]
+
+        if path == None:
+            return
+
+        new_path = Stack()
+        for coord in path:
+            new_path.push(coord)
+        new_path.remove_empty_values()
+
+        if self.path_pointer != -1:
+            for coord in self.path.gen_copy_without_empty_values()[:self.path_pointer]:
+                if new_path.exists(coord) == False:
+                    if self.checked_nodes.exists(coord):
+                        self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.SHRINKING_SQUARE, self.color_manager.PATH_NODE_FOREGROUND_COLOR, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR)
+                    else:
+                        self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.SHRINKING_SQUARE, self.color_manager.PATH_NODE_FOREGROUND_COLOR, self.color_manager.BOARD_COLOR)
+
+        self.path = new_path
+        self.path_pointer = self.path.get_size()
+        self.drawn_checked_nodes = True
+
+    def finish_search(self, path):
+        """
+        Saves the checked nodes and the path given (the indexes of the cells on the path) of the search
+        which has just finished in self.path_cache, and forgets about the search. If the search ran out
+        of budget its result isn't saved, since the path is only the best path found so far. Either way
+        the reason the search stopped and the number of cells it expanded are kept in self.search_stop_reason
+        and self.search_num_of_expansions.
+
+        @param path: List
+        """
+        grid_model = self.search_model
+        self.checked_nodes.remove_empty_values()
+        self.path.remove_empty_values()
+
+        # NOTE(ali): The engine only finishes the budget after the PATH_FOUND event has been taken
+        #            from it, so the stop reason can still be None here if the search didn't stop early.
+        budget = self.search_budget
+        self.search_stop_reason = budget.stop_reason if budget.is_stopped_early else SearchStopReasons.FINISHED
+        self.search_num_of_expansions = budget.num_of_expansions
+        if budget.is_stopped_early == False:
+            checked_nodes = [grid_model.get_index(coord) for coord in self.checked_nodes.gen_copy_without_empty_values()]
+            result = PathfindingResult(checked_nodes, path, self.layer_ends)
+            result.num_of_expansions = budget.num_of_expansions
+            result.elapsed_time = budget.get_elapsed_time()
+            self.path_cache.put(self.search_key, result, grid_model)
+
+        self.search_key = None
+        if PathfindingAlgorithm.active_search is self:
+            PathfindingAlgorithm.active_search = None
+
+    def load_result(self, grid_model, result):
+        """
+        Replaces the checked_nodes stack and the path stack with new stacks holding
+        the coordinates of the checked nodes and the path nodes in the result given.
+
+        @param grid_model: GridModel
+        @param result: PathfindingResult
+        """
+        self.checked_nodes = Stack()
+        self.path = Stack()
+        self.animated_checked_nodes_pointer = 0
+
+        for index in result.checked_nodes:
+            self.checked_nodes.push(grid_model.get_coords(index))
+
+        for index in result.path:
+            self.path.push(grid_model.get_coords(index))
+
+        self.checked_nodes.remove_empty_values()
+        self.path.remove_empty_values()
+        self.layer_ends = result.layer_ends
+        self.search_stop_reason = result.stop_reason
+        self.search_num_of_expansions = result.num_of_expansions
 
     def draw(self):
         """
@@ -208,6 +591,10 @@ class PathfindingAlgorithm:
         When we first start drawing a pathfinding algorithm the self.checked_nodes_pointer attribute
         is set to 0. Over time, we increment the value of self.checked_nodes_pointer (this process is handled
         separately and not by this function) and start drawing and animating checked nodes onto the screen.
+        The checked nodes are always drawn in the order they are in the checked_nodes stack, so the nodes
+        before self.animated_checked_nodes_pointer have already been animated and are drawn straight away,
+        and only the nodes after it are animated (which means nothing has to be stored for each node which
+        has been animated).
 
         Once the checked_nodes_pointer is equal to the total size of the checked_nodes stack (we can get the size of
         the stack using the get_size method in self.checked_nodes) we will then set the drawn_checked_nodes variable to
@@ -216,14 +603,16 @@ class PathfindingAlgorithm:
         """
         for x in range(self.checked_nodes_pointer):
             coord = self.checked_nodes.stack[x]
+            if self.rect_array_obj.array[coord[0]][coord[1]].is_user_weight:
+                continue
 
-            if self.animated_checked_coords.exists(coord) == False:
-                if self.rect_array_obj.array[coord[0]][coord[1]].is_user_weight == False:
-                    self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.CIRCLE_TO_SQUARE, (self.color_manager.CHECKED_NODE_BACKGROUND_COLOR, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR), AnimationBackgroundTypes.THEME_BACKGROUND)
-                self.animated_checked_coords.push(coord)
+            if x >= self.animated_checked_nodes_pointer:
+                self.animation_manager.add_coords_to_animation_dict(coord, AnimationTypes.CIRCLE_TO_SQUARE, (self.color_manager.CHECKED_NODE_BACKGROUND_COLOR, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR), AnimationBackgroundTypes.THEME_BACKGROUND)
             else:
-                if self.rect_array_obj.array[coord[0]][coord[1]].is_user_weight == False:
-                    pygame.draw.rect(self.screen_manager.screen, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR, self.rect_array_obj.array[coord[0]][coord[1]])
+                pygame.draw.rect(self.screen_manager.screen, self.color_manager.CHECKED_NODE_FOREGROUND_COLOR, self.rect_array_obj.array[coord[0]][coord[1]])
+
+        if self.checked_nodes_pointer > self.animated_checked_nodes_pointer:
+            self.animated_checked_nodes_pointer = self.checked_nodes_pointer
 
         if self.checked_nodes_pointer == self.checked_nodes.get_size() and self.drawn_checked_nodes == False:
             self.drawn_checked_nodes = True
@@ -239,6 +628,17 @@ class PathfindingAlgorithm:
                     pygame.draw.rect(self.screen_manager.screen, self.color_manager.PATH_NODE_FOREGROUND_COLOR, self.rect_array_obj.array[coord[0]][coord[1]])
 
 
+def shutdown_search_executor():
+    """
+    Cancels the search which is running on PathfindingAlgorithm.search_executor (if there is one) and
+    shuts search_executor down without waiting for it, throwing away any searches which haven't started.
+    This is called when the window is closed, so the game quits straight away instead of waiting for the
+    engine to finish a search (or for the main loop to take its events, which would never happen).
+    """
+    if PathfindingAlgorithm.active_search != None:
+        PathfindingAlgorithm.active_search.cancel_search()
+    PathfindingAlgorithm.search_executor.shutdown(wait=False, cancel_futures=True)
+
 class DFS(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
@@ -252,55 +652,6 @@ class DFS(PathfindingAlgorithm):
         super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
         self.type = PathfindingAlgorithmTypes.DFS
 
-    def run(self):
-        """
-        Runs the DFS (Depth First Search) pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
-
-        @return: Stack
-        """
-        self.reset_checked_nodes = False
-        self.reset_path_nodes = False
-
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
-
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-        
-        self.checked_nodes.push(start_node_coords)
-        self.path.push(start_node_coords)
-
-        running = True
-        while running:
-            if self.path.peek(False) == -1:
-                running = False
-                break
-
-            for coords in self.rect_array_obj.get_valid_adjacent_nodes(self.path.peek()):
-                if coords == end_node_coords:
-                    running = False
-                    break
-                if coords not in self.checked_nodes.stack:
-                    self.checked_nodes.push(coords)
-                    self.path.push(coords)
-                    break
-            else:
-                if self.path.get_size() == 0:
-                    return Stack(0)
-                else:
-                    self.path.pop()
-
-        self.checked_nodes.remove_empty_values()
-        self.path.remove_empty_values()
-
-
 class BFS(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
@@ -314,68 +665,6 @@ class BFS(PathfindingAlgorithm):
         super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
         self.type = PathfindingAlgorithmTypes.BFS
 
-    def run(self):
-        """
-        Runs the BFS (Breadth First Search) pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
-
-        @return: Stack
-        """
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
-
-        frontier = Queue()
-
-        parent_child_dict = {}
-
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                parent_child_dict[(y, x)] = None
-
-        self.checked_nodes.push(start_node_coords)
-        frontier.enqueue(start_node_coords) 
-
-        running = True
-        while frontier.is_empty() == False and running:
-            current_coord = frontier.dequeue()
-
-            if current_coord == end_node_coords:
-                running = False
-                break
-
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(current_coord):
-                if self.checked_nodes.exists(coord) == False:
-                    frontier.enqueue(coord)
-                    self.checked_nodes.push(coord)
-                    parent_child_dict[tuple(coord)] = current_coord
-
-        
-        self.checked_nodes.remove_empty_values()
-
-        if running == False:
-            self.path.push(end_node_coords)
-            coord = end_node_coords
-            while True:
-                parent_coord = parent_child_dict[tuple(coord)]
-                if parent_coord == start_node_coords:
-                    break
-
-                self.path.push(parent_coord)
-                coord = parent_coord
-
-
-        self.path.remove_empty_values()
-        self.path.reverse()
-
 class Dijkastra(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
@@ -386,82 +675,21 @@ class Dijkastra(PathfindingAlgorithm):
         @param color_manager: ColorManager
         @param animation_manager: AnimationManager
         """
-        super().__init__(screen_manager, rect_array_obj,  color_manager, animation_manager)
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
         self.type = PathfindingAlgorithmTypes.DIJKASTRA
 
-    def run(self):
+class DialDijkastra(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        Runs the Dijkastra pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
+        Initializes the DialDijkastra class.
 
-        @return: Stack
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
         """
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
-
-        parent_child_dict = {}
-        expanded_nodes = []
-        frontier = PriorityQueue()
-
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                parent_child_dict[(y, x)] = None
-
-        self.checked_nodes.push(start_node_coords)
-        frontier.enqueue(start_node_coords, self.rect_array_obj.get_weight_at_node(start_node_coords))
-
-        running = True
-        while frontier.is_empty() == False and running:
-            current_coord = frontier.dequeue()
-            expanded_nodes.append(current_coord)
-
-            if current_coord == end_node_coords:
-                running = False
-                break
-
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(current_coord):
-                if coord not in expanded_nodes:
-                    current_distance = self.rect_array_obj.get_weight_at_node(current_coord)
-                    coord_distance = self.rect_array_obj.get_weight_at_node(coord)
-
-                    if frontier.exists(coord) == False:
-                        self.rect_array_obj.set_weight_at_node(coord, current_distance + coord_distance)
-                        parent_child_dict[tuple(coord)] = current_coord
-                        frontier.enqueue(coord, current_distance + coord_distance)
-
-                        self.checked_nodes.push(coord)
-                    elif current_distance + 1 < coord_distance:
-                        self.rect_array_obj.set_weight_at_node(coord, current_distance + 1)
-                        parent_child_dict[tuple(coord)] = current_coord
-
-                        frontier.replace(coord, current_distance + 1)
-
-
-        self.checked_nodes.remove_empty_values()
-
-        if running == False:
-            self.path.push(end_node_coords)
-            coord = end_node_coords
-            while True:
-                parent_coord = parent_child_dict[tuple(coord)]
-                if parent_coord == None:
-                    break
-
-                self.path.push(parent_coord)
-                coord = parent_coord
-
-        self.path.remove_empty_values()
-        self.path.reverse()
-
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.DIAL_DIJKASTRA
 
 class AStar(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
@@ -473,325 +701,283 @@ class AStar(PathfindingAlgorithm):
         @param color_manager: ColorManager
         @param animation_manager: AnimationManager
         """
-        super().__init__(screen_manager, rect_array_obj,  color_manager, animation_manager)
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
         self.type = PathfindingAlgorithmTypes.ASTAR
-        self.heuristic_dict = {}
-        frontier = PriorityQueue()
-        expanded_nodes = []
 
-    def calculate_f_value(self, coords):
+class GreedyBFS(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        This function will calculate the f-value of the RectNode at the given coordinates.
-        The f-value will be calculated by adding the weight of the RectNode at the coordinates
-        given (we can get this information by passing in the coordinates given into the get_weight_at_node
-        method in self.rect_array_obj) with the heuristic we have calculated for the RectNode at the coordinate
-        (we can get the heuristic for the coordinate by passing the coordinate as a key into the heuristic_dict
-        dictionary). We will then return this f-value.
+        Initializes the GreedyBFS class.
 
-        @param coords: List
-        @return: int
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
         """
-        g = self.rect_array_obj.get_weight_at_node(coords)
-        h = self.heuristic_dict[tuple(coords)]
-        return g + h
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.GREEDY_BFS
 
-    def run(self):
+class BidirectionalBFS(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        Runs the A* pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
+        Initializes the BidirectionalBFS class.
 
-        @return: Stack
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
         """
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
-
-        self.heuristic_dict = {}
-        parent_child_dict = {}
-
-        frontier = PriorityQueue()
-        expanded_nodes = []
-
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                if self.heuristic == PathfindingHeuristics.MANHATTAN_DISTANCE:
-                    distance = self.get_manhattan_distance([y, x], end_node_coords)
-                else:
-                    distance = self.get_euclidean_distance([y, x], end_node_coords)
-
-                self.heuristic_dict[(y, x)] = distance
-                parent_child_dict[(y, x)] = None
-
-        frontier.enqueue(start_node_coords, self.calculate_f_value(start_node_coords))
-
-        running = True
-        while not frontier.is_empty() and running:
-            current_coord = frontier.dequeue()
-            expanded_nodes.append(current_coord)
-
-            if current_coord == end_node_coords:
-                running = False
-                break
-
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(current_coord):
-                if coord not in expanded_nodes:
-                    current_distance = self.rect_array_obj.get_weight_at_node(current_coord)
-                    coord_distance = self.rect_array_obj.get_weight_at_node(coord)
-
-                    if frontier.exists(coord) == False:
-                        self.rect_array_obj.set_weight_at_node(coord, current_distance + 1)
-                        parent_child_dict[tuple(coord)] = current_coord
-                        frontier.enqueue(coord, self.calculate_f_value(coord))
-
-                        self.checked_nodes.push(coord)
-                    elif current_distance + 1 < coord_distance:
-                        self.rect_array_obj.set_weight_at_node(coord, current_distance + 1)
-                        parent_child_dict[tuple(coord)] = current_coord
-
-                        frontier.replace(coord, self.calculate_f_value(coord))
-
-
-        self.checked_nodes.remove_empty_values()
-
-        if running == False:
-            self.path.push(end_node_coords)
-            coord = end_node_coords
-            while True:
-                parent_coord = parent_child_dict[tuple(coord)]
-                if parent_coord == None:
-                    break
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS
 
-                self.path.push(parent_coord)
-                coord = parent_coord
 
-        self.path.remove_empty_values()
-        self.path.reverse()
+class JumpPointSearch(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the JumpPointSearch class.
 
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.JUMP_POINT_SEARCH
 
 
-class GreedyBFS(PathfindingAlgorithm):
+class LPAStar(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        Initializes the GreedyBFS class.
+        Initializes the LPAStar class.
+
+        self.replan_checked_nodes holds the cells which have been repaired by the runs of replan
+        which ran out of budget, so they can be drawn along with the path once the repair has finished.
 
         @param screen_manager: ScreenManager
         @param rect_array_obj: RectArray
         @param color_manager: ColorManager
         @param animation_manager: AnimationManager
         """
-        super().__init__(screen_manager, rect_array_obj,  color_manager, animation_manager)
-        self.type = PathfindingAlgorithmTypes.GREEDY_BFS
-        self.h_parent_dict = {}
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.LPA_STAR
+        self.replan_checked_nodes = []
 
     def run(self):
         """
-        Runs the Greedy BFS (Best First Search) pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
-
-        @return: Stack
+        Runs the algorithm in the same way as the other pathfinding algorithms, after
+        forgetting the cells repaired by any runs of replan which hadn't finished.
         """
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
+        self.replan_checked_nodes = []
+        super().run()
 
-        heuristic_dict = {}
-        parent_child_dict = {}
-
-        frontier = PriorityQueue()
-        expanded_nodes = []
-
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
-
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                if self.heuristic == PathfindingHeuristics.MANHATTAN_DISTANCE:
-                    distance = self.get_manhattan_distance([y, x], end_node_coords)
-                else:
-                    distance = self.get_euclidean_distance([y, x], end_node_coords)
+    def replan(self):
+        """
+        This function is called every frame. If the path from the last run has finished being
+        drawn and the grid has changed since then, it will run self.engine again, which only
+        repairs the part of the search which has changed. The engine is run on search_executor
+        (see start_background_search), and once it has finished the new checked nodes (the cells
+        which were repaired) and the new path are drawn straight away instead of being animated one
+        by one, so the path stays on the screen while the user is marking and unmarking nodes. If the
+        repair runs out of budget the planner carries on from where it stopped on the next run (see
+        LPAStarPlanner.is_repaired), and the old path stays on the screen until it has finished.
+        """
+        result = self.get_background_search_result()
+        if result != None:
+            self.replan_checked_nodes.extend(result.checked_nodes)
+            if result.is_partial:
+                return
 
-                heuristic_dict[(y, x)] = distance
-                parent_child_dict[(y, x)] = None
+            result.checked_nodes = self.replan_checked_nodes
+            self.replan_checked_nodes = []
+            self.load_result(self.search_model, result)
 
-        frontier.enqueue(start_node_coords, heuristic_dict[tuple(start_node_coords)])
+            self.checked_nodes_pointer = self.checked_nodes.get_size()
+            self.path_pointer = self.path.get_size()
+            return
 
-        running = True
-        while frontier.is_empty() == False and running:
-            current_coord = frontier.dequeue()
-            expanded_nodes.append(current_coord)
+        if self.reset_path_nodes or self.path_pointer != self.path.get_size() or self.is_searching():
+            return
 
-            if current_coord == end_node_coords:
-                running = False
-                break
+        grid_model = self.get_search_model()
+        if self.engine.lpa_star_planner.needs_update(grid_model) == False:
+            return
 
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(current_coord):
-                if coord not in expanded_nodes:
-                    if frontier.exists(coord) == False:
-                        parent_child_dict[tuple(coord)] = current_coord
-                        frontier.enqueue(coord, heuristic_dict[tuple(coord)])
+        self.start_background_search(grid_model)
 
-                        self.checked_nodes.push(coord)
 
+class BidirectionalDijkastra(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the BidirectionalDijkastra class.
 
-        self.checked_nodes.remove_empty_values()
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA
 
-        if running == False:
-            self.path.push(end_node_coords)
-            coord = end_node_coords
-            while True:
-                parent_coord = parent_child_dict[tuple(coord)]
-                if parent_coord == None:
-                    break
 
-                self.path.push(parent_coord)
-                coord = parent_coord
+class BidirectionalAStar(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the BidirectionalAStar class.
 
-        self.path.remove_empty_values()
-        self.path.reverse()
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR
 
 
-class BidirectionalBFS(PathfindingAlgorithm):
+class HPAStar(PathfindingAlgorithm):
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        Initializes the BidirectionalBFS class.
+        Initializes the HPAStar class.
 
         @param screen_manager: ScreenManager
         @param rect_array_obj: RectArray
         @param color_manager: ColorManager
         @param animation_manager: AnimationManager
         """
-        super().__init__(screen_manager, rect_array_obj,  color_manager, animation_manager)
-        self.type = PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS
-        self.search_a_checked_nodes = Queue()
-        self.search_b_checked_nodes = Queue()
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.HPA_STAR
+
 
-    def find_common_coord(self):
+class FlowField(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
         """
-        This function will return the first coordinate it finds which is in both the
-        search_a_checked_nodes stack and the search_b_checked_nodes stack.
+        Initializes the FlowField class.
 
-        @return: List
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
         """
-        for item in self.search_a_checked_nodes:
-            if self.search_b_checked_nodes.exists(item):
-                return item
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.FLOW_FIELD
+        self.preview_start_index = -1
 
     def run(self):
         """
-        Runs the Bidirectional BFS (Best First Search) pathfinding algorithm and saves the coordinates of the
-        checked nodes in the checked_nodes stack and the coordinates of the path nodes in the path stack.
-
-        @return: Stack
+        Runs the algorithm in the same way as the other pathfinding algorithms,
+        and then saves the start node which the path was found from.
         """
-        self.reset_path_nodes = False
-        self.reset_checked_nodes = False
-
-        self.search_a_checked_nodes = Queue()
-        self.search_b_checked_nodes = Queue()
-        self.checked_nodes = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+        super().run()
+        self.preview_start_index = self.rect_array_obj.grid_model.start_index
 
-        self.path = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-
-        self.checked_nodes_pointer = -1
-        self.path_pointer = -1
-
-        search_a_frontier = Queue()
-        search_b_frontier = Queue()
+    def update_preview(self):
+        """
+        This function is called every frame. If the path from the last run has finished being drawn
+        and the start node has moved since then, it will find the path from the new start node by
+        following the next hops in the goal distance field (which is only built again if the grid has
+        changed). The engine is run on search_executor (see start_background_search), and once it has
+        finished the path is drawn straight away instead of being animated one node at a time, so the
+        path follows the start node while it is being dragged around with the middle mouse button.
+        """
+        result = self.get_background_search_result()
+        if result != None:
+            self.load_result(self.search_model, result)
+            self.checked_nodes_pointer = self.checked_nodes.get_size()
+            self.path_pointer = self.path.get_size()
+            return
 
-        search_a_parent_child_dict = {}
-        search_b_parent_child_dict = {}
+        if self.reset_path_nodes or self.path_pointer != self.path.get_size() or self.is_searching():
+            return
 
-        # Getting the coordinates of the start and end nodes.
-        start_node_coords, end_node_coords = self.rect_array_obj.get_start_and_end_node_coords()
+        if self.rect_array_obj.grid_model.start_index in (self.preview_start_index, -1):
+            return
 
-        for y in range(self.screen_manager.num_of_rows):
-            for x in range(self.screen_manager.num_of_columns):
-                search_a_parent_child_dict[(y, x)] = None
-                search_b_parent_child_dict[(y, x)] = None
+        grid_model = self.get_search_model()
+        self.preview_start_index = grid_model.start_index
+        self.start_background_search(grid_model)
 
-        self.search_a_checked_nodes.enqueue(start_node_coords)
 
-        search_a_frontier.enqueue(start_node_coords) 
-        search_b_frontier.enqueue(end_node_coords) 
+class BitboardBFS(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the BitboardBFS class.
 
-        running = True
-        while (search_a_frontier.is_empty() == False and search_b_frontier.is_empty() == False) and running:
-            search_a_current_coord = search_a_frontier.dequeue()
-            search_b_current_coord = search_b_frontier.dequeue()
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.BITBOARD_BFS
 
-            common_coord = self.find_common_coord()
-            if common_coord != None:
-                running = False
-                break
 
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(search_a_current_coord):
-                if self.search_a_checked_nodes.exists(coord) == False:
-                    search_a_frontier.enqueue(coord)
-                    self.search_a_checked_nodes.enqueue(coord)
-                    search_a_parent_child_dict[tuple(coord)] = search_a_current_coord
+class ARAStar(PathfindingAlgorithm):
+    # NOTE(ali): ARA* keeps finding better paths until it runs out of time, so its time limit is set
+    #            from the Pathfinding Algorithm Speed slider instead of MAX_SEARCH_TIME: the slower the
+    #            nodes are drawn, the longer it is given to find a better path (the time it spends waiting
+    #            for its nodes to be drawn isn't counted, see SearchBudget.pause).
+    SECONDS_PER_SPEED = 0.1
 
-            for coord in self.rect_array_obj.get_valid_adjacent_nodes(search_b_current_coord):
-                if self.search_b_checked_nodes.exists(coord) == False:
-                    search_b_frontier.enqueue(coord)
-                    self.search_b_checked_nodes.enqueue(coord)
-                    search_b_parent_child_dict[tuple(coord)] = search_b_current_coord
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the ARAStar class.
 
-        
-        if running == False:
-            common_coord = self.find_common_coord()
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.ARA_STAR
+        self.max_search_time = self.MAX_SEARCH_TIME
 
-            path_a = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
-            path_b = Stack(self.screen_manager.num_of_rows*self.screen_manager.num_of_columns)
+    def set_speed(self, pathfinding_algorithm_speed):
+        """
+        Sets the time limit of the search from the value of the Pathfinding Algorithm Speed slider
+        given (the number of milliseconds between each node being drawn).
 
-            search_a_coord = common_coord
-            search_b_coord = common_coord
+        @param pathfinding_algorithm_speed: int
+        """
+        self.max_search_time = pathfinding_algorithm_speed*self.SECONDS_PER_SPEED
 
-            path_a.push(common_coord)
-            coord = common_coord
-            while True:
-                parent_coord = search_a_parent_child_dict[tuple(coord)]
-                if parent_coord == start_node_coords:
-                    break
+    def create_search_budget(self):
+        """
+        Returns a SearchBudget with the time limit set by set_speed.
 
-                path_a.push(parent_coord)
-                coord = parent_coord
+        @return: SearchBudget
+        """
+        return SearchBudget(self.max_search_time, self.MAX_SEARCH_EXPANSIONS)
 
-            path_a.reverse()
 
-            coord = common_coord
-            while True:
-                parent_coord = search_b_parent_child_dict[tuple(coord)]
-                if parent_coord == end_node_coords:
-                    break
+class IDAStar(PathfindingAlgorithm):
+    # NOTE(ali): IDA* expands the same cells again on every iteration, so on big open boards (with the
+    #            octile or Chebyshev distance) it can need hundreds of thousands of expansions. It is
+    #            stopped after MAX_SEARCH_EXPANSIONS expansions as well as MAX_SEARCH_TIME, and the deepest
+    #            path it had found is shown instead (see PathfindingEngine.stop_events). The engine doesn't
+    #            run it at all on grids bigger than PathfindingEngine.IDA_STAR_MAX_NUM_OF_CELLS.
+    MAX_SEARCH_EXPANSIONS = 1000000
 
-                path_b.push(parent_coord)
-                coord = parent_coord
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the IDAStar class.
 
-            self.path.merge(path_a, path_b)
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.IDA_STAR
 
-        # NOTE(ali): Getting the checked nodes.
-        while True:
-            coord_a = self.search_a_checked_nodes.dequeue()
-            coord_b = self.search_b_checked_nodes.dequeue()
 
-            if coord_a != None:
-                self.checked_nodes.push(coord_a)
-            if coord_b != None:
-                self.checked_nodes.push(coord_b)
+class FringeSearch(PathfindingAlgorithm):
+    def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager):
+        """
+        Initializes the FringeSearch class.
 
-            if coord_a == None and coord_b == None:
-                self.checked_nodes.remove_empty_values()
-                break
+        @param screen_manager: ScreenManager
+        @param rect_array_obj: RectArray
+        @param color_manager: ColorManager
+        @param animation_manager: AnimationManager
+        """
+        super().__init__(screen_manager, rect_array_obj, color_manager, animation_manager)
+        self.type = PathfindingAlgorithmTypes.FRINGE_SEARCH
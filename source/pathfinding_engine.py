@@ -0,0 +1,1527 @@
+from enum import IntEnum
+from array import array
+import math
+
+from queue_classes import Queue, PriorityQueue, create_distance_queue
+from search_space import SearchSpace
+from grid_model import GridModel
+from heuristic_field import PathfindingHeuristics, HeuristicFieldProvider
+from lpa_star import LPAStarPlanner
+from hpa_star import HPAStarPlanner
+from component_index import ComponentIndex
+from goal_distance_field import GoalDistanceField
+from bitboard_bfs import BitboardBFS
+from search_budget import SearchStopReasons, SearchBudget
+
+class PathfindingAlgorithmTypes(IntEnum):
+    DFS = 0,
+    BFS = 1,
+    DIJKASTRA = 2,
+    ASTAR = 3,
+    GREEDY_BFS = 4,
+    BIDIRECTIONAL_BFS = 5,
+    DIAL_DIJKASTRA = 6,
+    JUMP_POINT_SEARCH = 7,
+    LPA_STAR = 8,
+    BIDIRECTIONAL_DIJKASTRA = 9,
+    BIDIRECTIONAL_ASTAR = 10,
+    HPA_STAR = 11,
+    FLOW_FIELD = 12,
+    BITBOARD_BFS = 13,
+    ARA_STAR = 14,
+    IDA_STAR = 15,
+    FRINGE_SEARCH = 16
+
+def create_grid_model(num_of_rows, num_of_columns, walls=(), weights=(), start_node_coords=None, end_node_coords=None):
+    """
+    Creates a GridModel from a description of a grid. This lets the PathfindingEngine
+    be used without having to create a RectArray (and so without needing pygame).
+
+    @param num_of_rows: int
+    @param num_of_columns: int
+    @param walls: Iterable of [y, x] coordinates of the marked nodes.
+    @param weights: Iterable of [[y, x], weight] pairs for the weighted nodes.
+    @param start_node_coords: List or None (defaults to the top left most cell)
+    @param end_node_coords: List or None (defaults to the bottom right most cell)
+    @return: GridModel
+    """
+    grid_model = GridModel(num_of_rows, num_of_columns)
+
+    for coords in walls:
+        grid_model.set_wall(grid_model.get_index(coords), True)
+
+    for coords, weight in weights:
+        index = grid_model.get_index(coords)
+        grid_model.set_user_weight(index, True)
+        grid_model.set_weight(index, weight)
+
+    if start_node_coords != None:
+        grid_model.start_index = grid_model.get_index(start_node_coords)
+    if end_node_coords != None:
+        grid_model.end_index = grid_model.get_index(end_node_coords)
+
+    return grid_model
+
+
+class PathfindingEventTypes(IntEnum):
+    EXPANDED = 0,
+    FRONTIER_PUSH = 1,
+    LAYER_END = 2,
+    PATH_FOUND = 3,
+    PATH_IMPROVED = 4
+
+class PathfindingResult:
+    def __init__(self, checked_nodes, path, layer_ends=None):
+        """
+        Initializes the PathfindingResult class.
+
+        This is what the PathfindingEngine returns after running an algorithm.
+        Both lists hold linear cell indexes (see GridModel.get_index).
+
+        checked_nodes: the cells in the order they were checked by the algorithm.
+        path: the cells on the path from the start node to the end node, or an
+              empty list if no path was found. Every algorithm gives the path in the
+              same shape: the first cell is the start node and the last cell is the end
+              node (the start node and end node are drawn over the path by the grid).
+        layer_ends: the number of checked nodes at the end of each layer for algorithms
+                    which check a whole layer of cells at once (so that each layer can be
+                    drawn at the same time), or an empty list for every other algorithm.
+
+        The statistics of the search are set by PathfindingEngine.run (see SearchBudget):
+
+        stop_reason: the SearchStopReasons the search stopped for. If the search was stopped
+                     early the path is the best path found so far, which goes from the start
+                     node to the cell closest to the end node that had been reached.
+        num_of_expansions: the number of cells which were expanded.
+        elapsed_time: the number of seconds the search ran for.
+
+        @param checked_nodes: List
+        @param path: List
+        @param layer_ends: List or None
+        """
+        self.checked_nodes = checked_nodes
+        self.path = path
+        self.layer_ends = [] if layer_ends == None else layer_ends
+        self.stop_reason = SearchStopReasons.FINISHED
+        self.num_of_expansions = 0
+        self.elapsed_time = 0
+
+    @property
+    def is_partial(self):
+        """
+        Returns True if the search was stopped before it finished (so the path, if
+        there is one, is only the best path which had been found so far).
+
+        @return: bool
+        """
+        return self.stop_reason != SearchStopReasons.FINISHED
+
+    @property
+    def found_path(self):
+        """
+        Returns True if the algorithm found a path to the end node.
+
+        @return: bool
+        """
+        return len(self.path) != 0 and self.is_partial == False
+
+
+class PathfindingEngine:
+    # NOTE(ali): ARA* starts with the heuristic multiplied by ARA_STAR_INITIAL_WEIGHT, and takes
+    #            ARA_STAR_WEIGHT_STEP off the weight every time it finds a path until the weight is 1.
+    ARA_STAR_INITIAL_WEIGHT = 3
+    ARA_STAR_WEIGHT_STEP = 0.5
+
+    # NOTE(ali): The last path ARA* finds is only the best path if its heuristic never overestimates the
+    #            distance to the end node. The Manhattan distance (which is multiplied by 3) and the Euclidean
+    #            distance (which is squared) both do, so ARA* uses ARA_STAR_DEFAULT_HEURISTIC instead of them.
+    ARA_STAR_HEURISTICS = (PathfindingHeuristics.OCTILE_DISTANCE, PathfindingHeuristics.CHEBYSHEV_DISTANCE, PathfindingHeuristics.LANDMARKS)
+    ARA_STAR_DEFAULT_HEURISTIC = PathfindingHeuristics.OCTILE_DISTANCE
+
+    # NOTE(ali): The number of cells which IDA* remembers the distance of in each iteration (see iter_ida_star).
+    #            This is the most memory it uses for them however big the grid is.
+    IDA_STAR_TABLE_SIZE = 4096
+
+    # NOTE(ali): IDA* isn't run on grids with more cells than this, it stops straight away with an empty path
+    #            and GRID_TOO_BIG as its stop reason (see start_events). On open grids with the octile distance
+    #            it takes about 1 second with 2376 cells (36x66) but about 8 seconds with 6600 cells (60x110),
+    #            and the Chebyshev distance takes more than twice as long as that, so on bigger grids it would
+    #            almost always run out of budget without finding a path.
+    IDA_STAR_MAX_NUM_OF_CELLS = 2500
+
+    def __init__(self):
+        """
+        Initializes the PathfindingEngine class.
+
+        The PathfindingEngine runs the pathfinding algorithms directly on a GridModel,
+        so it does not depend on pygame or on anything to do with drawing the grid.
+        The PathfindingAlgorithm classes are adapters which run the engine and then
+        turn the indexes in the PathfindingResult into coordinates which can be drawn.
+
+        The SearchSpace instances are kept between runs so that running the engine
+        again does not have to allocate new arrays (the reverse search space is only
+        used by algorithms which also search backwards from the end node). The values of
+        the heuristics are also kept between runs by self.heuristic_field_provider,
+        self.lpa_star_planner keeps its state between runs so that it can replan incrementally,
+        self.hpa_star_planner keeps its abstract graph between runs, and self.goal_distance_field
+        keeps the distance from every cell to the end node between runs. self.bitboard_bfs keeps
+        the bitboard of open cells between runs.
+
+        self.component_index keeps track of which cells are connected to each other, so when
+        there is no path from the start node to the end node this is known before running
+        any algorithm (see run).
+
+        The algorithms in self.event_algorithms are generators which yield an event for each
+        step of the search (see iter_events), so their checked nodes can be drawn while they are
+        still running without the whole search having to be stored first. Every other algorithm
+        is in self.algorithms and returns a PathfindingResult once it has finished.
+
+        self.budget is the SearchBudget of the search which is running at the moment. It is checked
+        every time a cell is expanded, so a search can be stopped early when it takes too long or
+        when it is cancelled from another thread (see SearchBudget.cancel).
+
+        IDA* doesn't use self.search_space, so self.ida_star_path is the best path it has found
+        so far, which is what it returns if it is stopped early (see stop_events). Fringe Search
+        doesn't use it either, it keeps the distance and the parent of the cells it has reached in
+        self.fringe_search_distances and self.fringe_search_parents instead.
+        """
+        self.budget = SearchBudget()
+        self.search_space = SearchSpace()
+        self.reverse_search_space = SearchSpace()
+        self.heuristic_field_provider = HeuristicFieldProvider()
+        self.lpa_star_planner = LPAStarPlanner()
+        self.hpa_star_planner = HPAStarPlanner()
+        self.component_index = ComponentIndex()
+        self.goal_distance_field = GoalDistanceField()
+        self.bitboard_bfs = BitboardBFS()
+        self.ida_star_path = []
+        self.fringe_search_distances = {}
+        self.fringe_search_parents = {}
+        self.event_algorithms = {
+            PathfindingAlgorithmTypes.DFS: self.iter_dfs,
+            PathfindingAlgorithmTypes.BFS: self.iter_bfs,
+            PathfindingAlgorithmTypes.DIJKASTRA: self.iter_dijkastra,
+            PathfindingAlgorithmTypes.ASTAR: self.iter_astar,
+            PathfindingAlgorithmTypes.GREEDY_BFS: self.iter_greedy_bfs,
+            PathfindingAlgorithmTypes.DIAL_DIJKASTRA: self.iter_dial_dijkastra,
+            PathfindingAlgorithmTypes.JUMP_POINT_SEARCH: self.iter_jump_point_search,
+            PathfindingAlgorithmTypes.ARA_STAR: self.iter_ara_star,
+            PathfindingAlgorithmTypes.IDA_STAR: self.iter_ida_star,
+            PathfindingAlgorithmTypes.FRINGE_SEARCH: self.iter_fringe_search
+        }
+        self.algorithms = {
+            PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS: self.run_bidirectional_bfs,
+            PathfindingAlgorithmTypes.LPA_STAR: self.run_lpa_star,
+            PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA: self.run_bidirectional_dijkastra,
+            PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR: self.run_bidirectional_astar,
+            PathfindingAlgorithmTypes.HPA_STAR: self.run_hpa_star,
+            PathfindingAlgorithmTypes.FLOW_FIELD: self.run_flow_field,
+            PathfindingAlgorithmTypes.BITBOARD_BFS: self.run_bitboard_bfs
+        }
+
+    def run(self, grid_model, algorithm_type, heuristic=None, budget=None):
+        """
+        Runs the pathfinding algorithm given on the grid_model given, from the start
+        node to the end node of the grid_model, and returns the result.
+
+        If the end node can't be reached from the start node the algorithm is not run at
+        all, and the checked nodes of the result are the cells which can be reached from
+        the start node instead (which is what a search would have ended up checking).
+
+        If a SearchBudget is given the search is stopped once it has run out of budget (or
+        has been cancelled), and the result then holds the best path found so far. IDA* isn't
+        run at all on grids with more than IDA_STAR_MAX_NUM_OF_CELLS cells, and the result
+        then has no checked nodes or path and GRID_TOO_BIG as its stop reason.
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param heuristic: PathfindingHeuristics or None
+        @param budget: SearchBudget or None
+        @return: PathfindingResult
+        """
+        events = self.start_events(grid_model, algorithm_type, heuristic, budget)
+        result = self.collect_events(grid_model, algorithm_type, events)
+        result.stop_reason = self.budget.stop_reason
+        result.num_of_expansions = self.budget.num_of_expansions
+        result.elapsed_time = self.budget.get_elapsed_time()
+        return result
+
+    def iter_events(self, grid_model, algorithm_type, heuristic=None, budget=None):
+        """
+        Runs the pathfinding algorithm given on the grid_model given one step at a time, yielding
+        a tuple of a PathfindingEventTypes and a value for each step:
+
+        EXPANDED: the index of a cell which has been taken off the frontier.
+        FRONTIER_PUSH: the index of a cell which has been reached for the first time and added to
+                       the frontier. These are the checked nodes of the result, in the same order.
+        LAYER_END: the number of checked nodes so far at the end of a layer (see PathfindingResult).
+        PATH_FOUND: the list of indexes of the cells on the path (starting with the start node and ending
+                    with the end node, see PathfindingResult), or an empty list if there is no path.
+                    This is always the last event.
+        PATH_IMPROVED: the list of indexes of the cells on a path which is better than the last one the
+                       algorithm found, but which might not be the best path. This is only yielded by
+                       anytime algorithms (see iter_ara_star) which keep searching for a better path.
+
+        Nothing is stored apart from the search space and the frontier, so the cells which have been
+        checked can be handled while the algorithm is running and then thrown away. The algorithms
+        which aren't in self.event_algorithms are run until they have finished and their result is
+        then yielded as events.
+
+        If the end node can't be reached from the start node the algorithm is not run at
+        all (see run).
+
+        The budget given (or a SearchBudget without any limits) is checked on the EXPANDED
+        events, and once it has run out the algorithm is stopped and the last event is PATH_FOUND
+        with the best path found so far (see get_partial_path). The algorithms which aren't in
+        self.event_algorithms check self.budget themselves (the planners are given it when they
+        are run), so every algorithm can be stopped early or cancelled.
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param heuristic: PathfindingHeuristics or None
+        @param budget: SearchBudget or None
+        @return: Generator
+        """
+        events = self.start_events(grid_model, algorithm_type, heuristic, budget)
+
+        budget = self.budget
+        expanded = PathfindingEventTypes.EXPANDED
+        check_interval = countdown = budget.get_check_interval()
+        for event in events:
+            if event[0] is expanded:
+                countdown -= 1
+                if countdown == 0:
+                    budget.add_expansions(check_interval)
+                    if budget.check():
+                        yield PathfindingEventTypes.PATH_FOUND, self.stop_events(grid_model, algorithm_type, events)
+                        return
+                    check_interval = countdown = budget.get_check_interval()
+            yield event
+
+        budget.add_expansions(check_interval - countdown)
+        budget.finish()
+
+    def start_events(self, grid_model, algorithm_type, heuristic, budget):
+        """
+        Starts the budget given (or a SearchBudget without any limits) and returns the events of the
+        algorithm given (see iter_events) without checking the budget, which is left to whatever goes
+        through the events (see iter_events and collect_events).
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param heuristic: PathfindingHeuristics or None
+        @param budget: SearchBudget or None
+        @return: Iterator
+        """
+        self.budget = SearchBudget() if budget == None else budget
+        self.budget.start()
+
+        start_index = grid_model.start_index
+        if self.component_index.is_connected(grid_model, start_index, grid_model.end_index) == False:
+            # NOTE(ali): LPA* has to take in the cells which have changed even though it isn't run,
+            #            otherwise it would keep saying it needs to be run again (see LPAStar.replan).
+            if algorithm_type == PathfindingAlgorithmTypes.LPA_STAR:
+                self.lpa_star_planner.skip_repair(grid_model)
+            return self.iter_result_events(PathfindingResult(self.component_index.get_component(grid_model, start_index), []))
+        elif algorithm_type == PathfindingAlgorithmTypes.IDA_STAR and grid_model.num_of_cells > self.IDA_STAR_MAX_NUM_OF_CELLS:
+            self.budget.stop(SearchStopReasons.GRID_TOO_BIG)
+            return self.iter_result_events(PathfindingResult([], []))
+        elif algorithm_type in self.event_algorithms:
+            return self.event_algorithms[algorithm_type](grid_model, heuristic)
+        else:
+            return self.iter_result_events(self.algorithms[algorithm_type](grid_model, heuristic))
+
+    def stop_events(self, grid_model, algorithm_type, events):
+        """
+        Stops the algorithm which is yielding the events given once it has run out of budget,
+        and returns the best path it had found (see get_partial_path). IDA* keeps its own
+        best path in self.ida_star_path instead, and Fringe Search keeps its own parents in
+        self.fringe_search_parents, since neither of them use self.search_space.
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param events: Generator
+        @return: List
+        """
+        events.close()
+        if algorithm_type == PathfindingAlgorithmTypes.IDA_STAR:
+            return self.ida_star_path
+        elif algorithm_type == PathfindingAlgorithmTypes.FRINGE_SEARCH:
+            return self.get_fringe_search_partial_path(grid_model)
+        return self.get_partial_path(grid_model, algorithm_type == PathfindingAlgorithmTypes.JUMP_POINT_SEARCH)
+
+    def get_partial_path(self, grid_model, fill_jump_points=False):
+        """
+        Returns the best path found by a search which was stopped before it finished, which is the
+        path from the start node to the cell closest to the end node (by the Manhattan distance) that
+        the search had reached, or an empty list if it hadn't reached any cells. If the search was a
+        Jump Point Search (fill_jump_points is True) the cells in between the jump points are added.
+
+        @param grid_model: GridModel
+        @param fill_jump_points: bool
+        @return: List
+        """
+        columns = grid_model.num_of_columns
+        end_y, end_x = divmod(grid_model.end_index, columns)
+
+        best_index = -1
+        best_distance = 0
+        for index in self.search_space.get_reached_indexes():
+            y, x = divmod(index, columns)
+            distance = abs(end_y - y) + abs(end_x - x)
+            if best_index == -1 or distance < best_distance:
+                best_index = index
+                best_distance = distance
+
+        if best_index == -1:
+            return []
+
+        path = self.search_space.get_path(best_index)
+        if fill_jump_points:
+            path = self.fill_jump_point_path(grid_model, path)
+        return path
+
+    def get_fringe_search_partial_path(self, grid_model):
+        """
+        Returns the best path found by a Fringe Search which was stopped before it finished, in the
+        same way as get_partial_path but with the cells in self.fringe_search_parents.
+
+        @param grid_model: GridModel
+        @return: List
+        """
+        columns = grid_model.num_of_columns
+        end_y, end_x = divmod(grid_model.end_index, columns)
+        parents = self.fringe_search_parents
+
+        best_index = -1
+        best_distance = 0
+        for index in parents:
+            y, x = divmod(index, columns)
+            distance = abs(end_y - y) + abs(end_x - x)
+            if best_index == -1 or distance < best_distance:
+                best_index = index
+                best_distance = distance
+
+        if best_index == -1:
+            return []
+        return self.get_fringe_search_path(best_index)
+
+    def get_fringe_search_path(self, index):
+        """
+        Returns the path from the start node to the index given by following self.fringe_search_parents.
+
+        @param index: int
+        @return: List
+        """
+        parents = self.fringe_search_parents
+        path = []
+        while index != -1:
+            path.append(index)
+            index = parents[index]
+        path.reverse()
+        return path
+
+    def iter_result_events(self, result):
+        """
+        Yields the events (see iter_events) for a PathfindingResult which has already been found.
+
+        @param result: PathfindingResult
+        @return: Generator
+        """
+        checked_nodes = result.checked_nodes
+        start = 0
+        for layer_end in result.layer_ends:
+            for index in checked_nodes[start:layer_end]:
+                yield PathfindingEventTypes.FRONTIER_PUSH, index
+            yield PathfindingEventTypes.LAYER_END, layer_end
+            start = layer_end
+
+        for index in checked_nodes[start:]:
+            yield PathfindingEventTypes.FRONTIER_PUSH, index
+        yield PathfindingEventTypes.PATH_FOUND, result.path
+
+    def collect_events(self, grid_model, algorithm_type, events):
+        """
+        Goes through every event given (see iter_events) and returns the PathfindingResult they make up.
+        self.budget is checked on the EXPANDED events in the same way as in iter_events. The path of the
+        result is the path in the last PATH_FOUND event (any PATH_IMPROVED events before it are replaced by it).
+
+        @param grid_model: GridModel
+        @param algorithm_type: PathfindingAlgorithmTypes
+        @param events: Iterator
+        @return: PathfindingResult
+        """
+        checked_nodes = []
+        layer_ends = []
+        path = []
+
+        # NOTE(ali): There is an event for every cell which is checked, so the event types are
+        #            looked up once here instead of on every event.
+        frontier_push = PathfindingEventTypes.FRONTIER_PUSH
+        expanded = PathfindingEventTypes.EXPANDED
+        layer_end = PathfindingEventTypes.LAYER_END
+        budget = self.budget
+        check_interval = countdown = budget.get_check_interval()
+        for event_type, value in events:
+            if event_type is frontier_push:
+                checked_nodes.append(value)
+            elif event_type is expanded:
+                countdown -= 1
+                if countdown == 0:
+                    budget.add_expansions(check_interval)
+                    if budget.check():
+                        return PathfindingResult(checked_nodes, self.stop_events(grid_model, algorithm_type, events), layer_ends)
+                    check_interval = countdown = budget.get_check_interval()
+            elif event_type is layer_end:
+                layer_ends.append(value)
+            else:
+                path = value
+
+        budget.add_expansions(check_interval - countdown)
+        budget.finish()
+        return PathfindingResult(checked_nodes, path, layer_ends)
+
+    def iter_dfs(self, grid_model, heuristic=None):
+        """
+        Runs the DFS (Depth First Search) pathfinding algorithm, yielding its events (see iter_events).
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: Generator
+        """
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+
+        path = [start_index]
+        search_space.set_node(start_index, 0, -1)
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        found_path = False
+        while len(path) != 0 and found_path == False:
+            # NOTE(ali): The cell at the top of the stack is expanded every time its neighbours are looked
+            #            at, which happens again each time the search backtracks to it.
+            yield PathfindingEventTypes.EXPANDED, path[-1]
+
+            for index in grid_model.get_open_neighbors(path[-1]):
+                if index == end_index:
+                    path.append(index)
+                    found_path = True
+                    break
+                if search_space.is_reached(index) == False:
+                    search_space.set_node(index, len(path), path[-1])
+                    path.append(index)
+                    yield PathfindingEventTypes.FRONTIER_PUSH, index
+                    break
+            else:
+                path.pop()
+
+        yield PathfindingEventTypes.PATH_FOUND, path
+
+    def iter_bfs(self, grid_model, heuristic=None):
+        """
+        Runs the BFS (Breadth First Search) pathfinding algorithm, yielding its events (see iter_events).
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: Generator
+        """
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+
+        frontier = Queue()
+        search_space.set_node(start_index, 0, -1)
+        frontier.enqueue(start_index)
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        while frontier.is_empty() == False:
+            current_index = frontier.dequeue()
+            yield PathfindingEventTypes.EXPANDED, current_index
+
+            if current_index == end_index:
+                yield PathfindingEventTypes.PATH_FOUND, search_space.get_path(end_index)
+                return
+
+            current_distance = search_space.get_distance(current_index)
+            for index in grid_model.get_open_neighbors(current_index):
+                if search_space.is_reached(index) == False:
+                    search_space.set_node(index, current_distance + 1, current_index)
+                    frontier.enqueue(index)
+                    yield PathfindingEventTypes.FRONTIER_PUSH, index
+
+        yield PathfindingEventTypes.PATH_FOUND, []
+
+    def iter_best_first_search(self, grid_model, frontier, get_priority):
+        """
+        Runs a best first search from the start node to the end node of the grid_model
+        given, where the distance of each cell is the sum of the weights of the cells on
+        the way to it. This is what the Dijkastra, Dial's Dijkastra and A* algorithms all
+        do, and they only differ in the frontier they use and the priority given to each
+        cell, which is calculated by get_priority(index, distance). The events of the search
+        are yielded as it runs (see iter_events).
+
+        @param grid_model: GridModel
+        @param frontier: PriorityQueue or BucketQueue
+        @param get_priority: Callable
+        @return: Generator
+        """
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        weights = grid_model.weights
+
+        search_space.set_node(start_index, 0, -1)
+        frontier.enqueue(start_index, get_priority(start_index, 0))
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        while frontier.is_empty() == False:
+            current_index = frontier.dequeue()
+            search_space.close(current_index)
+            yield PathfindingEventTypes.EXPANDED, current_index
+
+            if current_index == end_index:
+                yield PathfindingEventTypes.PATH_FOUND, search_space.get_path(end_index)
+                return
+
+            current_distance = search_space.get_distance(current_index)
+            for index in grid_model.get_open_neighbors(current_index):
+                if search_space.is_closed(index) == False:
+                    new_distance = current_distance + weights[index]
+
+                    if search_space.is_reached(index) == False:
+                        search_space.set_node(index, new_distance, current_index)
+                        frontier.enqueue(index, get_priority(index, new_distance))
+                        yield PathfindingEventTypes.FRONTIER_PUSH, index
+                    elif new_distance < search_space.get_distance(index):
+                        search_space.set_node(index, new_distance, current_index)
+                        frontier.replace(index, get_priority(index, new_distance))
+
+        yield PathfindingEventTypes.PATH_FOUND, []
+
+    def iter_dijkastra(self, grid_model, heuristic=None):
+        """
+        Runs the Dijkastra pathfinding algorithm, yielding its events (see iter_events).
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: Generator
+        """
+        return self.iter_best_first_search(grid_model, PriorityQueue(), lambda index, distance: distance)
+
+    def get_max_weight(self, grid_model):
+        """
+        This function will return the largest weight of any cell in the grid,
+        this is used to decide how many buckets the BucketQueue needs (or whether
+        to use a PriorityQueue instead, see create_distance_queue).
+
+        @param grid_model: GridModel
+        @return: int
+        """
+        return max(1, max(grid_model.weights))
+
+    def iter_dial_dijkastra(self, grid_model, heuristic=None):
+        """
+        Runs Dial's version of the Dijkastra pathfinding algorithm. Since all the weights in
+        the grid are small integers, the frontier is stored in a BucketQueue instead of a
+        PriorityQueue, so the next node to expand is found without comparing any distances.
+        If any weight is bigger than MAX_BUCKET_QUEUE_WEIGHT a PriorityQueue is used after all
+        (see create_distance_queue), which makes this the same as the normal Dijkastra.
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: Generator
+        """
+        return self.iter_best_first_search(grid_model, create_distance_queue(self.get_max_weight(grid_model)), lambda index, distance: distance)
+
+    def iter_astar(self, grid_model, heuristic=None):
+        """
+        Runs the A* pathfinding algorithm. The f-value of each cell is its distance
+        from the start node added to the value of the heuristic for the cell.
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        heuristic_field = self.heuristic_field_provider.get_field(grid_model, heuristic)
+        return self.iter_best_first_search(grid_model, PriorityQueue(),
+                                           lambda index, distance: distance + heuristic_field.get_value(index))
+
+    def iter_greedy_bfs(self, grid_model, heuristic=None):
+        """
+        Runs the Greedy BFS (Best First Search) pathfinding algorithm, yielding its events (see iter_events).
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+
+        heuristic_field = self.heuristic_field_provider.get_field(grid_model, heuristic)
+
+        frontier = PriorityQueue()
+        search_space.set_node(start_index, 0, -1)
+        frontier.enqueue(start_index, heuristic_field.get_value(start_index))
+
+        while frontier.is_empty() == False:
+            current_index = frontier.dequeue()
+            yield PathfindingEventTypes.EXPANDED, current_index
+
+            if current_index == end_index:
+                yield PathfindingEventTypes.PATH_FOUND, search_space.get_path(end_index)
+                return
+
+            current_distance = search_space.get_distance(current_index)
+            for index in grid_model.get_open_neighbors(current_index):
+                if search_space.is_reached(index) == False:
+                    search_space.set_node(index, current_distance + 1, current_index)
+                    frontier.enqueue(index, heuristic_field.get_value(index))
+                    yield PathfindingEventTypes.FRONTIER_PUSH, index
+
+        yield PathfindingEventTypes.PATH_FOUND, []
+
+    def expand_bidirectional_layer(self, grid_model, layer, search_space, other_search_space, checked_nodes):
+        """
+        Expands every cell in the layer given for one side of the Bidirectional BFS and returns the
+        next layer along with the index of the cell where the two searches meet (or -1 if they have
+        not met). The searches meet when a cell is found which the other side has already reached,
+        and since every cell in the layer is the same distance from this side, the meeting cell which
+        is closest to the other side gives the shortest path.
+
+        @param grid_model: GridModel
+        @param layer: List
+        @param search_space: SearchSpace
+        @param other_search_space: SearchSpace
+        @param checked_nodes: List
+        @return: Tuple
+        """
+        next_layer = []
+        meeting_index = -1
+        for current_index in layer:
+            distance = search_space.get_distance(current_index) + 1
+            for index in grid_model.get_open_neighbors(current_index):
+                if search_space.is_reached(index):
+                    continue
+
+                search_space.set_node(index, distance, current_index)
+                next_layer.append(index)
+                checked_nodes.append(index)
+
+                if other_search_space.is_reached(index):
+                    if meeting_index == -1 or other_search_space.get_distance(index) < other_search_space.get_distance(meeting_index):
+                        meeting_index = index
+
+        return next_layer, meeting_index
+
+    def run_bidirectional_bfs(self, grid_model, heuristic=None):
+        """
+        Runs the Bidirectional BFS (Breadth First Search) pathfinding algorithm.
+        Search A goes forwards from the start node and search B goes backwards
+        from the end node, so they each need their own SearchSpace.
+
+        In each step, whichever side has the smaller frontier expands a whole layer,
+        and the two searches stop as soon as one of them finds a cell that the other
+        side has already reached, so there is no need to compare the checked nodes.
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: PathfindingResult
+        """
+        search_a_space = self.search_space
+        search_b_space = self.reverse_search_space
+        search_a_space.begin_search(grid_model.num_of_cells)
+        search_b_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+
+        search_a_space.set_node(start_index, 0, -1)
+        search_b_space.set_node(end_index, 0, -1)
+
+        search_a_layer = [start_index]
+        search_b_layer = [end_index]
+        search_a_checked_nodes = [start_index]
+        search_b_checked_nodes = []
+
+        meeting_index = start_index if start_index == end_index else -1
+        while meeting_index == -1 and len(search_a_layer) != 0 and len(search_b_layer) != 0:
+            # NOTE(ali): A whole layer is expanded at once, so the budget is checked once per layer.
+            self.budget.add_expansions(min(len(search_a_layer), len(search_b_layer)))
+            if self.budget.check():
+                break
+
+            if len(search_a_layer) <= len(search_b_layer):
+                search_a_layer, meeting_index = self.expand_bidirectional_layer(grid_model, search_a_layer, search_a_space, search_b_space, search_a_checked_nodes)
+            else:
+                search_b_layer, meeting_index = self.expand_bidirectional_layer(grid_model, search_b_layer, search_b_space, search_a_space, search_b_checked_nodes)
+
+        path = []
+        if meeting_index != -1:
+            # NOTE(ali): Search A gives the path from the start node to the meeting node,
+            #            and search B gives the path from the end node to the meeting node,
+            #            so the second half has to be reversed and the meeting node skipped.
+            path = search_a_space.get_path(meeting_index)
+            path.extend(reversed(search_b_space.get_path(meeting_index)[:-1]))
+        elif self.budget.is_stopped_early:
+            path = self.get_partial_path(grid_model)
+
+        # NOTE(ali): Getting the checked nodes, taking one from each search in turn.
+        checked_nodes = []
+        for x in range(max(len(search_a_checked_nodes), len(search_b_checked_nodes))):
+            if x < len(search_a_checked_nodes):
+                checked_nodes.append(search_a_checked_nodes[x])
+            if x < len(search_b_checked_nodes):
+                checked_nodes.append(search_b_checked_nodes[x])
+
+        return PathfindingResult(checked_nodes, path)
+
+    def relax_bidirectional_neighbors(self, grid_model, frontier, search_space, other_search_space, get_edge_weight, get_potential, checked_nodes):
+        """
+        Expands the cell at the front of the frontier given for one side of a bidirectional best first
+        search. The distance of each cell next to it is relaxed, where get_edge_weight(current_index, index)
+        is the cost of the edge between them for this side, and the priority of each cell in the frontier is
+        its distance added to get_potential(index). Every time a cell is reached which the other side has
+        also reached, the length of the path through that cell is worked out, and the shortest of these is
+        returned as (path_length, meeting_index), or (infinity, -1) if no such cell was reached.
+
+        @param grid_model: GridModel
+        @param frontier: PriorityQueue
+        @param search_space: SearchSpace
+        @param other_search_space: SearchSpace
+        @param get_edge_weight: Callable
+        @param get_potential: Callable
+        @param checked_nodes: List
+        @return: Tuple
+        """
+        best_path_length = float('inf')
+        meeting_index = -1
+
+        current_index = frontier.dequeue()
+        search_space.close(current_index)
+
+        current_distance = search_space.get_distance(current_index)
+        for index in grid_model.get_open_neighbors(current_index):
+            if search_space.is_closed(index):
+                continue
+
+            new_distance = current_distance + get_edge_weight(current_index, index)
+            if search_space.is_reached(index) == False:
+                search_space.set_node(index, new_distance, current_index)
+                frontier.enqueue(index, new_distance + get_potential(index))
+                checked_nodes.append(index)
+            elif new_distance < search_space.get_distance(index):
+                search_space.set_node(index, new_distance, current_index)
+                frontier.replace(index, new_distance + get_potential(index))
+            else:
+                continue
+
+            if other_search_space.is_reached(index):
+                path_length = new_distance + other_search_space.get_distance(index)
+                if path_length < best_path_length:
+                    best_path_length = path_length
+                    meeting_index = index
+
+        return best_path_length, meeting_index
+
+    def run_bidirectional_best_first_search(self, grid_model, get_potential):
+        """
+        Runs a best first search forwards from the start node and backwards from the end node at the
+        same time. Moving into a cell costs its weight, so the forwards search uses the weight of the cell
+        it moves into and the backwards search uses the weight of the cell it moves out of.
+
+        The priority of a cell in the forwards frontier is its distance added to get_potential(index), and
+        in the backwards frontier it is its distance minus get_potential(index). mu is the length of the
+        shortest path found so far through a cell reached by both searches, and the search stops once the
+        priorities at the front of the two frontiers add up to at least mu, since no path which has not
+        been found yet can be shorter than that. With get_potential always returning 0 this is
+        bidirectional Dijkastra.
+
+        @param grid_model: GridModel
+        @param get_potential: Callable
+        @return: PathfindingResult
+        """
+        forwards_space = self.search_space
+        backwards_space = self.reverse_search_space
+        forwards_space.begin_search(grid_model.num_of_cells)
+        backwards_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        weights = grid_model.weights
+
+        forwards_frontier = PriorityQueue()
+        backwards_frontier = PriorityQueue()
+        forwards_checked_nodes = [start_index]
+        backwards_checked_nodes = []
+
+        forwards_space.set_node(start_index, 0, -1)
+        backwards_space.set_node(end_index, 0, -1)
+        forwards_frontier.enqueue(start_index, get_potential(start_index))
+        backwards_frontier.enqueue(end_index, -get_potential(end_index))
+
+        mu = 0 if start_index == end_index else float('inf')
+        meeting_index = start_index if start_index == end_index else -1
+
+        check_interval = countdown = self.budget.get_check_interval()
+        while forwards_frontier.is_empty() == False and backwards_frontier.is_empty() == False:
+            if forwards_frontier.peek_priority() + backwards_frontier.peek_priority() >= mu:
+                break
+
+            countdown -= 1
+            if countdown == 0:
+                self.budget.add_expansions(check_interval)
+                if self.budget.check():
+                    break
+                check_interval = countdown = self.budget.get_check_interval()
+
+            if len(forwards_frontier) <= len(backwards_frontier):
+                path_length, index = self.relax_bidirectional_neighbors(grid_model, forwards_frontier, forwards_space, backwards_space,
+                                                                        lambda current_index, index: weights[index],
+                                                                        get_potential, forwards_checked_nodes)
+            else:
+                path_length, index = self.relax_bidirectional_neighbors(grid_model, backwards_frontier, backwards_space, forwards_space,
+                                                                        lambda current_index, index: weights[current_index],
+                                                                        lambda index: -get_potential(index), backwards_checked_nodes)
+
+            if path_length < mu:
+                mu = path_length
+                meeting_index = index
+
+        if self.budget.is_stopped_early == False:
+            self.budget.add_expansions(check_interval - countdown)
+
+        path = []
+        if meeting_index != -1:
+            # NOTE(ali): The forwards search gives the path from the start node to the meeting node,
+            #            and the backwards search gives the path from the end node to the meeting node,
+            #            so the second half has to be reversed and the meeting node skipped.
+            path = forwards_space.get_path(meeting_index)
+            path.extend(reversed(backwards_space.get_path(meeting_index)[:-1]))
+        elif self.budget.is_stopped_early:
+            path = self.get_partial_path(grid_model)
+
+        # NOTE(ali): Getting the checked nodes, taking one from each search in turn.
+        checked_nodes = []
+        for x in range(max(len(forwards_checked_nodes), len(backwards_checked_nodes))):
+            if x < len(forwards_checked_nodes):
+                checked_nodes.append(forwards_checked_nodes[x])
+            if x < len(backwards_checked_nodes):
+                checked_nodes.append(backwards_checked_nodes[x])
+
+        return PathfindingResult(checked_nodes, path)
+
+    def run_bidirectional_dijkastra(self, grid_model, heuristic=None):
+        """
+        Runs the bidirectional version of the Dijkastra pathfinding algorithm.
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: PathfindingResult
+        """
+        return self.run_bidirectional_best_first_search(grid_model, lambda index: 0)
+
+    def run_bidirectional_astar(self, grid_model, heuristic=None):
+        """
+        Runs the bidirectional version of the A* pathfinding algorithm.
+
+        The two searches use the balanced potential (h_end(v) - h_start(v)) / 2, where h_end and
+        h_start are the Manhattan distances to the end node and to the start node. This keeps the
+        priorities of both searches consistent with each other so that the stopping rule still
+        gives the shortest path. The Manhattan distance is not multiplied by 3 here (unlike in A*)
+        since the potential has to be admissible for the stopping rule to work.
+
+        @param grid_model: GridModel
+        @param heuristic: None (the Manhattan distance is always used)
+        @return: PathfindingResult
+        """
+        columns = grid_model.num_of_columns
+        start_y, start_x = grid_model.start_index // columns, grid_model.start_index % columns
+        end_y, end_x = grid_model.end_index // columns, grid_model.end_index % columns
+
+        def get_potential(index):
+            y, x = index // columns, index % columns
+            return ((abs(end_y - y) + abs(end_x - x)) - (abs(start_y - y) + abs(start_x - x))) / 2
+
+        return self.run_bidirectional_best_first_search(grid_model, get_potential)
+
+    def is_open_cell(self, grid_model, y, x):
+        """
+        Returns True if the coordinates given are inside the grid and
+        the cell at them is not marked.
+
+        @param grid_model: GridModel
+        @param y: int
+        @param x: int
+        @return: bool
+        """
+        return 0 <= y < grid_model.num_of_rows and 0 <= x < grid_model.num_of_columns and grid_model.walls[y*grid_model.num_of_columns + x] == 0
+
+    def is_unweighted_cell(self, grid_model, y, x):
+        """
+        Returns True if the coordinates given are inside the grid and the cell at them is not
+        marked and has a weight of 1. The jumps treat every other cell as if it was marked when
+        looking for forced neighbors, since a path through a weighted cell isn't as short as the
+        path next to it which the jump would otherwise prune.
+
+        @param grid_model: GridModel
+        @param y: int
+        @param x: int
+        @return: bool
+        """
+        if 0 <= y < grid_model.num_of_rows and 0 <= x < grid_model.num_of_columns:
+            index = y*grid_model.num_of_columns + x
+            return grid_model.walls[index] == 0 and grid_model.weights[index] == 1
+        return False
+
+    def get_jump_stops(self, grid_model):
+        """
+        Returns a bytearray with a 1 for every open cell which a jump has to stop at apart from the end
+        node, which is every open cell whose weight isn't 1 and every open cell next to one of them. The
+        cells in between two jump points are then always cells with a weight of 1, so the distance between
+        them only depends on how far apart they are and on the weight of the second jump point.
+
+        @param grid_model: GridModel
+        @return: bytearray
+        """
+        jump_stops = bytearray(grid_model.num_of_cells)
+        weights = grid_model.weights
+        if weights.count(1) == grid_model.num_of_cells:
+            return jump_stops
+
+        walls = grid_model.walls
+        for index in range(grid_model.num_of_cells):
+            if weights[index] != 1 and walls[index] == 0:
+                jump_stops[index] = 1
+                for neighbor in grid_model.get_open_neighbors(index):
+                    jump_stops[neighbor] = 1
+        return jump_stops
+
+    def jump_horizontally(self, grid_model, jump_stops, y, x, dx):
+        """
+        Moves from the cell at the coordinates given in the horizontal direction dx until
+        it reaches a jump point, which is either the end node, a cell in jump_stops (see
+        get_jump_stops) or a cell with a forced neighbor (a cell above or below it which
+        is open while the cell above or below the previous cell is marked or weighted, so
+        the cell can only be reached by the shortest path by turning here).
+
+        @param grid_model: GridModel
+        @param jump_stops: bytearray
+        @param y: int
+        @param x: int
+        @param dx: int
+        @return: int (the index of the jump point, or -1 if there is none)
+        """
+        end_index = grid_model.end_index
+        while True:
+            x += dx
+            if self.is_open_cell(grid_model, y, x) == False:
+                return -1
+
+            index = y*grid_model.num_of_columns + x
+            if index == end_index or jump_stops[index]:
+                return index
+
+            for dy in (-1, 1):
+                if self.is_unweighted_cell(grid_model, y+dy, x) and self.is_unweighted_cell(grid_model, y+dy, x-dx) == False:
+                    return index
+
+    def jump(self, grid_model, jump_stops, index, dy, dx):
+        """
+        Moves from the cell at the index given in the direction given until it reaches a jump point.
+
+        Paths are treated as going vertically first and then horizontally, so moving vertically
+        works like moving diagonally in the 8-connected version of Jump Point Search: every cell
+        on the way is a jump point if a horizontal jump from it in either direction finds one.
+
+        @param grid_model: GridModel
+        @param jump_stops: bytearray
+        @param index: int
+        @param dy: int
+        @param dx: int
+        @return: int (the index of the jump point, or -1 if there is none)
+        """
+        y, x = index // grid_model.num_of_columns, index % grid_model.num_of_columns
+        if dy == 0:
+            return self.jump_horizontally(grid_model, jump_stops, y, x, dx)
+
+        end_index = grid_model.end_index
+        while True:
+            y += dy
+            if self.is_open_cell(grid_model, y, x) == False:
+                return -1
+
+            index = y*grid_model.num_of_columns + x
+            if index == end_index or jump_stops[index]:
+                return index
+
+            if self.jump_horizontally(grid_model, jump_stops, y, x, 1) != -1 or self.jump_horizontally(grid_model, jump_stops, y, x, -1) != -1:
+                return index
+
+    def get_jump_directions(self, grid_model, index, direction):
+        """
+        Returns the directions which have to be searched from the jump point at the index
+        given, when it was reached by moving in the direction given (which is (0, 0) for
+        the start node and the cells in jump_stops, see get_jump_stops). All the other
+        directions are pruned since there is another path to those cells which is at least
+        as short.
+
+        @param grid_model: GridModel
+        @param index: int
+        @param direction: Tuple
+        @return: List
+        """
+        dy, dx = direction
+        if dy == 0 and dx == 0:
+            return [(0, 1), (1, 0), (-1, 0), (0, -1)]
+
+        if dx == 0:
+            return [(dy, 0), (0, 1), (0, -1)]
+
+        y, x = index // grid_model.num_of_columns, index % grid_model.num_of_columns
+        directions = [(0, dx)]
+        for vertical_dy in (-1, 1):
+            if self.is_unweighted_cell(grid_model, y+vertical_dy, x) and self.is_unweighted_cell(grid_model, y+vertical_dy, x-dx) == False:
+                directions.append((vertical_dy, 0))
+        return directions
+
+    def fill_jump_point_path(self, grid_model, jump_points):
+        """
+        Jump points on a path are always in a straight line from each other, so this
+        function returns the full path by adding the cells in between each of them.
+
+        @param grid_model: GridModel
+        @param jump_points: List
+        @return: List
+        """
+        columns = grid_model.num_of_columns
+        path = jump_points[:1]
+        for previous_index, index in zip(jump_points, jump_points[1:]):
+            if previous_index // columns == index // columns:
+                step = 1 if index > previous_index else -1
+            else:
+                step = columns if index > previous_index else -columns
+            path.extend(range(previous_index + step, index + step, step))
+        return path
+
+    def iter_jump_point_search(self, grid_model, heuristic=None):
+        """
+        Runs the Jump Point Search pathfinding algorithm, which is A* where only jump
+        points are added to the frontier instead of every cell next to the current one.
+        Only the jump points are yielded as FRONTIER_PUSH, so they are the only checked
+        nodes (the cells the jumps move over on the way are never checked nodes).
+
+        The pruning only works where every move costs the same, so the weighted nodes and
+        the open cells next to them are always jump points (see get_jump_stops), and the search
+        goes in every direction from them like A*. On a grid without weighted nodes this checks
+        around 2 to 3 times fewer nodes than A* (see benchmark.py with --weights 0), and the more
+        weighted nodes there are the closer it gets to A*. On the default boards of benchmark.py
+        (where 10% of the cells are weighted) it checks about 25% fewer nodes than A*, but it takes
+        about as long to run since the jumps still have to move over the cells one at a time.
+
+        The events of the search are yielded as it runs (see iter_events).
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+        jump_stops = self.get_jump_stops(grid_model)
+        weights = grid_model.weights
+
+        heuristic_field = self.heuristic_field_provider.get_field(grid_model, heuristic)
+        columns = grid_model.num_of_columns
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+
+        frontier = PriorityQueue()
+        directions = {start_index: (0, 0)}
+        search_space.set_node(start_index, 0, -1)
+        frontier.enqueue(start_index, heuristic_field.get_value(start_index))
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        while frontier.is_empty() == False:
+            current_index = frontier.dequeue()
+            search_space.close(current_index)
+            yield PathfindingEventTypes.EXPANDED, current_index
+
+            if current_index == end_index:
+                yield PathfindingEventTypes.PATH_FOUND, self.fill_jump_point_path(grid_model, search_space.get_path(end_index))
+                return
+
+            current_distance = search_space.get_distance(current_index)
+            for dy, dx in self.get_jump_directions(grid_model, current_index, directions[current_index]):
+                index = self.jump(grid_model, jump_stops, current_index, dy, dx)
+                if index == -1 or search_space.is_closed(index):
+                    continue
+
+                # NOTE(ali): Every cell in between the two jump points has a weight of 1 (see get_jump_stops),
+                #            so only the weight of the jump point itself can be different.
+                num_of_steps = abs(index // columns - current_index // columns) + abs(index % columns - current_index % columns)
+                new_distance = current_distance + num_of_steps - 1 + weights[index]
+                if jump_stops[index]:
+                    dy, dx = 0, 0
+
+                if search_space.is_reached(index) == False:
+                    search_space.set_node(index, new_distance, current_index)
+                    directions[index] = (dy, dx)
+                    frontier.enqueue(index, new_distance + heuristic_field.get_value(index))
+                    yield PathfindingEventTypes.FRONTIER_PUSH, index
+                elif new_distance < search_space.get_distance(index):
+                    search_space.set_node(index, new_distance, current_index)
+                    directions[index] = (dy, dx)
+                    frontier.replace(index, new_distance + heuristic_field.get_value(index))
+
+        yield PathfindingEventTypes.PATH_FOUND, []
+
+    def iter_ara_star(self, grid_model, heuristic=None):
+        """
+        Runs the ARA* (Anytime Repairing A*) pathfinding algorithm, yielding its events (see iter_events).
+
+        ARA* runs A* with the value of the heuristic multiplied by a weight which is bigger than 1, so
+        it heads straight for the end node and finds a path quickly, but the path can be up to weight
+        times longer than the best path. The path is yielded as a PATH_IMPROVED event and the search is
+        then repaired with a smaller weight (taking ARA_STAR_WEIGHT_STEP off it each time) to find a
+        better path, until the weight is 1 (the path is then yielded as PATH_FOUND), and this last path
+        is the best path. That is only true when the heuristic never overestimates the distance to the end
+        node, so only the heuristics in ARA_STAR_HEURISTICS are used, and any other heuristic is replaced
+        by ARA_STAR_DEFAULT_HEURISTIC.
+
+        The distances in self.search_space are kept between each repair, so each repair only expands
+        the cells whose distance can still get smaller instead of starting again from the start node.
+        The cells which have been expanded in this repair are closed, and a cell whose distance gets
+        smaller after it has been closed is only added to the frontier again in the next repair. Every
+        cell is only yielded as FRONTIER_PUSH the first time it is reached, but can be EXPANDED once
+        in every repair.
+
+        If the search runs out of budget the best path found so far is the path to the end
+        node in self.search_space (see get_partial_path).
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        if heuristic not in self.ARA_STAR_HEURISTICS:
+            heuristic = self.ARA_STAR_DEFAULT_HEURISTIC
+
+        heuristic_field = self.heuristic_field_provider.get_field(grid_model, heuristic)
+        search_space = self.search_space
+        search_space.begin_search(grid_model.num_of_cells)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        weights = grid_model.weights
+
+        weight = self.ARA_STAR_INITIAL_WEIGHT
+        frontier = PriorityQueue()
+        inconsistent_nodes = []
+        path_distance = float('inf')
+        search_space.set_node(start_index, 0, -1)
+        frontier.enqueue(start_index, weight*heuristic_field.get_value(start_index))
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        while True:
+            while frontier.is_empty() == False and search_space.get_distance(end_index) > frontier.peek_priority():
+                current_index = frontier.dequeue()
+                search_space.close(current_index)
+                yield PathfindingEventTypes.EXPANDED, current_index
+
+                current_distance = search_space.get_distance(current_index)
+                for index in grid_model.get_open_neighbors(current_index):
+                    new_distance = current_distance + weights[index]
+
+                    if search_space.is_reached(index) == False:
+                        search_space.set_node(index, new_distance, current_index)
+                        frontier.enqueue(index, new_distance + weight*heuristic_field.get_value(index))
+                        yield PathfindingEventTypes.FRONTIER_PUSH, index
+                    elif new_distance < search_space.get_distance(index):
+                        search_space.set_node(index, new_distance, current_index)
+                        if search_space.is_closed(index):
+                            inconsistent_nodes.append(index)
+                        elif frontier.exists(index):
+                            frontier.replace(index, new_distance + weight*heuristic_field.get_value(index))
+                        else:
+                            frontier.enqueue(index, new_distance + weight*heuristic_field.get_value(index))
+
+            end_distance = search_space.get_distance(end_index)
+            if end_distance == float('inf'):
+                yield PathfindingEventTypes.PATH_FOUND, []
+                return
+
+            if weight == 1:
+                yield PathfindingEventTypes.PATH_FOUND, search_space.get_path(end_index)
+                return
+
+            if end_distance < path_distance:
+                path_distance = end_distance
+                yield PathfindingEventTypes.PATH_IMPROVED, search_space.get_path(end_index)
+
+            weight = max(1, weight - self.ARA_STAR_WEIGHT_STEP)
+            open_nodes = [index for index, priority in frontier] + inconsistent_nodes
+            frontier = PriorityQueue()
+            for index in open_nodes:
+                if frontier.exists(index) == False:
+                    frontier.enqueue(index, search_space.get_distance(index) + weight*heuristic_field.get_value(index))
+            inconsistent_nodes = []
+            search_space.clear_closed()
+
+    def iter_ida_star(self, grid_model, heuristic=None):
+        """
+        Runs the IDA* (Iterative Deepening A*) pathfinding algorithm, yielding its events (see iter_events).
+
+        IDA* runs a depth first search from the start node which doesn't go into any cell whose distance
+        plus heuristic is bigger than a threshold. The first threshold is the value of the heuristic for the
+        start node, and if the end node isn't found the search is run again with the smallest distance plus
+        heuristic of the cells it didn't go into as the next threshold. With a heuristic which never
+        overestimates the distance to the end node the first path found is the best path.
+
+        Every weight is a whole number, so the length of every path is a whole number as well, and each
+        threshold is rounded up to the next whole number. The best path is still found first (the threshold
+        never goes past its length), but with heuristics like the octile distance almost every cell has a
+        different distance plus heuristic, and without rounding the threshold there would be an iteration
+        for nearly every one of them.
+
+        IDA* keeps track of the path it is on at the moment (the cells on it, their distances and the
+        neighbours of each cell which haven't been looked at yet), and it doesn't use self.search_space or
+        store the values of the heuristic. On its own a depth first search like this goes into the same cell
+        again on every different path to it, which takes exponentially long on open grids, so each iteration
+        also has a transposition table of IDA_STAR_TABLE_SIZE cells and their distances. A cell isn't gone into
+        again if the table says it has already been gone into in this iteration with a distance which is at
+        least as short. Each cell has one place in the table (its index modulo IDA_STAR_TABLE_SIZE), so on
+        grids with more cells than that some cells overwrite each other and can be gone into more than once,
+        but the memory used never depends on the size of the grid. It can still take a lot longer than A*
+        on big grids (so it is best used with a budget, see SearchBudget).
+
+        The only other thing kept for every cell is one byte for whether the cell has been yielded as
+        FRONTIER_PUSH yet, so that each cell is only a checked node once. self.ida_star_path is kept as the
+        path to the cell closest to the end node (by the Manhattan distance) which has been gone into, which
+        is the best path found so far if the search is stopped early (see stop_events).
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        heuristic_field = self.heuristic_field_provider.create_unstored_field(grid_model, heuristic)
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        weights = grid_model.weights
+        columns = grid_model.num_of_columns
+        end_y, end_x = divmod(end_index, columns)
+        table_size = min(grid_model.num_of_cells, self.IDA_STAR_TABLE_SIZE)
+
+        checked_cells = bytearray(grid_model.num_of_cells)
+        checked_cells[start_index] = 1
+        self.ida_star_path = [start_index]
+        best_end_distance = abs(end_y - start_index // columns) + abs(end_x - start_index % columns)
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        threshold = math.ceil(heuristic_field.calculate_value(start_index))
+        while True:
+            path = [start_index]
+            distances = [0]
+            neighbors = [iter(grid_model.get_open_neighbors(start_index))]
+            cells_on_path = {start_index}
+            next_threshold = float('inf')
+            table_cells = array('i', [-1]) * table_size
+            table_distances = array('d', [0]) * table_size
+            table_cells[start_index % table_size] = start_index
+            yield PathfindingEventTypes.EXPANDED, start_index
+
+            while len(path) != 0:
+                index = next(neighbors[-1], -1)
+                if index == -1:
+                    cells_on_path.remove(path.pop())
+                    distances.pop()
+                    neighbors.pop()
+                    continue
+
+                if index in cells_on_path:
+                    continue
+
+                distance = distances[-1] + weights[index]
+                priority = distance + heuristic_field.calculate_value(index)
+                if priority > threshold:
+                    next_threshold = min(next_threshold, priority)
+                    continue
+
+                slot = index % table_size
+                if table_cells[slot] == index and table_distances[slot] <= distance:
+                    continue
+                table_cells[slot] = index
+                table_distances[slot] = distance
+
+                if checked_cells[index] == 0:
+                    checked_cells[index] = 1
+                    yield PathfindingEventTypes.FRONTIER_PUSH, index
+
+                path.append(index)
+                if index == end_index:
+                    self.ida_star_path = path
+                    yield PathfindingEventTypes.PATH_FOUND, path
+                    return
+
+                end_distance = abs(end_y - index // columns) + abs(end_x - index % columns)
+                if end_distance < best_end_distance:
+                    best_end_distance = end_distance
+                    self.ida_star_path = list(path)
+
+                distances.append(distance)
+                neighbors.append(iter(grid_model.get_open_neighbors(index)))
+                cells_on_path.add(index)
+                yield PathfindingEventTypes.EXPANDED, index
+
+            if next_threshold == float('inf'):
+                yield PathfindingEventTypes.PATH_FOUND, []
+                return
+            threshold = math.ceil(next_threshold)
+
+    def iter_fringe_search(self, grid_model, heuristic=None):
+        """
+        Runs the Fringe Search pathfinding algorithm, yielding its events (see iter_events).
+
+        Fringe Search uses thresholds in the same way as IDA* (see iter_ida_star), but instead of starting
+        again from the start node every time the threshold goes up, it keeps the fringe: the cells whose
+        distance plus heuristic was bigger than the threshold are saved in a list and the next search carries
+        on from them. The cells in the fringe are expanded one at a time from the end of the list (so their
+        neighbours are expanded straight after them like in a depth first search) instead of being kept in
+        order in a priority queue, so the frontier is only two plain lists of indexes and their distances
+        instead of a heap and a dictionary of the position of every cell in it. As with IDA*, the path
+        found is only the best path if the heuristic never overestimates the distance to the end node.
+
+        The distance and parent of each cell which has been reached are kept in self.fringe_search_distances
+        and self.fringe_search_parents so that a cell is only added to the fringe again if a shorter path to it
+        has been found. They are dictionaries instead of a SearchSpace, so they only take up memory for the cells
+        which have been reached rather than for every cell in the grid. The values of the heuristic aren't stored,
+        they are calculated every time a cell is taken out of the fringe.
+
+        @param grid_model: GridModel
+        @param heuristic: PathfindingHeuristics
+        @return: Generator
+        """
+        heuristic_field = self.heuristic_field_provider.create_unstored_field(grid_model, heuristic)
+        self.fringe_search_distances = distances = {}
+        self.fringe_search_parents = parents = {}
+
+        start_index = grid_model.start_index
+        end_index = grid_model.end_index
+        weights = grid_model.weights
+
+        # NOTE(ali): The distance of each cell is saved next to it in the fringe, so that when a shorter
+        #            path has been found to a cell which is already in the fringe (and it has been added
+        #            to the fringe again), the old entry can be told apart and skipped.
+        fringe = [start_index]
+        fringe_distances = [0]
+        distances[start_index] = 0
+        parents[start_index] = -1
+        yield PathfindingEventTypes.FRONTIER_PUSH, start_index
+
+        threshold = heuristic_field.calculate_value(start_index)
+        while len(fringe) != 0:
+            later_fringe = []
+            later_fringe_distances = []
+            next_threshold = float('inf')
+
+            while len(fringe) != 0:
+                current_index = fringe.pop()
+                current_distance = fringe_distances.pop()
+                if current_distance != distances[current_index]:
+                    continue
+
+                priority = current_distance + heuristic_field.calculate_value(current_index)
+                if priority > threshold:
+                    next_threshold = min(next_threshold, priority)
+                    later_fringe.append(current_index)
+                    later_fringe_distances.append(current_distance)
+                    continue
+
+                yield PathfindingEventTypes.EXPANDED, current_index
+                if current_index == end_index:
+                    yield PathfindingEventTypes.PATH_FOUND, self.get_fringe_search_path(end_index)
+                    return
+
+                for index in grid_model.get_open_neighbors(current_index):
+                    new_distance = current_distance + weights[index]
+
+                    if index not in distances:
+                        distances[index] = new_distance
+                        parents[index] = current_index
+                        fringe.append(index)
+                        fringe_distances.append(new_distance)
+                        yield PathfindingEventTypes.FRONTIER_PUSH, index
+                    elif new_distance < distances[index]:
+                        distances[index] = new_distance
+                        parents[index] = current_index
+                        fringe.append(index)
+                        fringe_distances.append(new_distance)
+
+            fringe = later_fringe
+            fringe_distances = later_fringe_distances
+            threshold = next_threshold
+
+        yield PathfindingEventTypes.PATH_FOUND, []
+
+    def run_lpa_star(self, grid_model, heuristic=None):
+        """
+        Runs the Lifelong Planning A* pathfinding algorithm (see lpa_star.py). The first run
+        works the same way as A*, but after that only the cells which have changed since the
+        last run are repaired, so the checked nodes are only the cells which had to be updated.
+
+        @param grid_model: GridModel
+        @param heuristic: None (the planner always uses its own heuristic)
+        @return: PathfindingResult
+        """
+        checked_nodes, path = self.lpa_star_planner.run(grid_model, self.budget)
+        return PathfindingResult(checked_nodes, path)
+
+    def run_hpa_star(self, grid_model, heuristic=None):
+        """
+        Runs the HPA* pathfinding algorithm (see hpa_star.py). The abstract graph is only built
+        on the first run and then only the clusters which have changed are built again, so the
+        checked nodes are only the nodes of the abstract graph which were expanded. The path
+        is usually very close to the shortest path, but it is not always the shortest path.
+
+        @param grid_model: GridModel
+        @param heuristic: None (the planner always uses its own heuristic)
+        @return: PathfindingResult
+        """
+        checked_nodes, path = self.hpa_star_planner.run(grid_model, self.budget)
+        return PathfindingResult(checked_nodes, path)
+
+    def run_flow_field(self, grid_model, heuristic=None):
+        """
+        Finds the path using the goal distance field (see goal_distance_field.py). The field
+        is only built when the end node, the walls or the weights have changed since the last
+        run, and then the checked nodes are the cells it expanded. Otherwise the path is found
+        straight away by following the next hops from the start node, and there are no checked nodes.
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: PathfindingResult
+        """
+        checked_nodes, path = self.goal_distance_field.run(grid_model, self.budget)
+        return PathfindingResult(checked_nodes, path)
+
+    def run_bitboard_bfs(self, grid_model, heuristic=None):
+        """
+        Runs the BFS (Breadth First Search) pathfinding algorithm on bitboards (see bitboard_bfs.py),
+        which finds a whole layer of cells at once. The checked nodes are the cells in each layer in
+        order, and the end of each layer is saved in the layer_ends of the result.
+
+        @param grid_model: GridModel
+        @param heuristic: None
+        @return: PathfindingResult
+        """
+        checked_nodes, layer_ends, path = self.bitboard_bfs.run(grid_model, self.budget)
+        return PathfindingResult(checked_nodes, path, layer_ends)
@@ -1,41 +1,59 @@
+from collections import deque
+
+from stack import make_hashable
+
 class Queue:
-    def __init__(self):
+    def __init__(self, track_visited=False):
         """
         Initializes the Queue class.
+
+        The items in the queue are stored in a deque so that both enqueue and
+        dequeue are O(1), and the self.members dictionary keeps a count of each
+        item currently in the queue so that exists is also O(1). If track_visited
+        is set to True the queue will also keep a self.visited set containing
+        every item which has ever been enqueued (even after it has been dequeued),
+        which the searches can use as their visited set.
+
+        @param track_visited: bool
         """
-        self.heap = []
+        self.queue = deque()
+        self.members = {}
+        self.track_visited = track_visited
+        self.visited = set() if track_visited else None
 
     def __iter__(self):
         """
         Makes it so that when we loop over the instance of the Queue
-        class it will actually loop over the self.heap list.
+        class it will loop over the items in the order they were enqueued.
 
         @return: Iterator
         """
-        return iter(self.heap)
+        return iter(self.queue)
 
     def __str__(self):
         """
         Whenever we try to print out the instance of the Queue class it
-        will instead print the self.heap list.
+        will instead print a list of the items in the queue.
 
         @return: Str
         """
-        return str(self.heap)
+        return str(list(self.queue))
 
-    def remove_empty_values(self):
+    def __len__(self):
         """
-        This function will go through the self.heap list and find
-        any elements which are the None value, and it will remove them
-        from the list.
+        Returns the number of items in the queue.
+
+        @return: int
         """
-        indexes_to_remove = []
-        for i in range(len(self.heap)):
-            if self.heap[i] == None:
-                indexes_to_remove.append(i)
+        return len(self.queue)
 
-        for i in indexes_to_remove:
-            self.heap.pop(i)
+    def remove_empty_values(self):
+        """
+        This function will go through the queue and remove any
+        elements which are the None value.
+        """
+        self.queue = deque(item for item in self.queue if item != None)
+        self.members.pop(None, None)
 
     def enqueue(self, item):
         """
@@ -43,7 +61,11 @@ class Queue:
 
         @param item: Any
         """
-        self.heap.append(item)
+        self.queue.append(item)
+        key = make_hashable(item)
+        self.members[key] = self.members.get(key, 0) + 1
+        if self.track_visited:
+            self.visited.add(key)
 
     def dequeue(self):
         """
@@ -52,31 +74,44 @@ class Queue:
 
         @return: Any or None
         """
-        if len(self.heap) > 0:
-            return self.heap.pop(0)
+        if len(self.queue) > 0:
+            item = self.queue.popleft()
+            key = make_hashable(item)
+            count = self.members[key]
+            if count == 1:
+                del self.members[key]
+            else:
+                self.members[key] = count - 1
+            return item
         else:
             return None
 
     def peek(self):
         """
-        This function will return the first item in the
-        self.heap list.
+        This function will return the first item in the queue.
 
-        @return: ANy
+        @return: Any
         """
-        return self.heap[0]
+        return self.queue[0]
 
     def exists(self, item):
         """
-        This function will check if the item given exists in the self.heap list.
+        This function will check if the item given is currently in the queue.
 
         @param item: Any
         @return: bool
         """
-        if item in self.heap:
-            return True
-        else:
-            return False
+        return make_hashable(item) in self.members
+
+    def was_visited(self, item):
+        """
+        This function will check if the item given has ever been enqueued.
+        This only works if the queue was created with track_visited set to True.
+
+        @param item: Any
+        @return: bool
+        """
+        return make_hashable(item) in self.visited
 
     def is_empty(self):
         """
@@ -84,7 +119,7 @@ class Queue:
 
         @return: bool
         """
-        if len(self.heap) == 0:
+        if len(self.queue) == 0:
             return True
         else:
             return False
@@ -93,26 +128,95 @@ class PriorityQueue:
     def __init__(self):
         """
         Initializes the PriorityQueue class.
+
+        The queue is stored as a binary min-heap in the self.heap list where each
+        entry is a list of the form [priority, counter, item]. The counter is
+        incremented every time an item is enqueued so that items with the same
+        priority always come out in the order they were added, which keeps the
+        results of the pathfinding algorithms the same for every client. The
+        self.positions dictionary maps each item to its index in self.heap so that
+        exists and replace do not have to search through the heap.
         """
         self.heap = []
+        self.positions = {}
+        self.counter = 0
 
     def __iter__(self):
         """
         Makes it so that when we loop over the instance of the PriorityQueue
-        class it will actually loop over the self.heap list.
+        class it will loop over (item, priority) tuples for every item in
+        the priority queue.
 
         @return: Iterator
         """
-        return iter(self.heap)
+        return iter([(entry[2], entry[0]) for entry in self.heap])
 
     def __str__(self):
         """
         Whenever we try to print out the instance of the PriorityQueue class it
-        will instead print the self.heap list.
+        will instead print a list of the (item, priority) tuples in the queue.
 
         @return: Str
         """
-        return str(self.heap)
+        return str([(entry[2], entry[0]) for entry in self.heap])
+
+    def __len__(self):
+        """
+        Returns the number of items in the priority queue.
+
+        @return: int
+        """
+        return len(self.heap)
+
+    def swap(self, i, j):
+        """
+        Swaps the entries at the indexes i and j in self.heap and updates
+        the self.positions dictionary accordingly.
+
+        @param i: int
+        @param j: int
+        """
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.positions[make_hashable(heap[i][2])] = i
+        self.positions[make_hashable(heap[j][2])] = j
+
+    def sift_up(self, i):
+        """
+        Moves the entry at index i up the heap until its parent has a
+        smaller (priority, counter) pair.
+
+        @param i: int
+        """
+        heap = self.heap
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[i][0] < heap[parent][0] or (heap[i][0] == heap[parent][0] and heap[i][1] < heap[parent][1]):
+                self.swap(i, parent)
+                i = parent
+            else:
+                break
+
+    def sift_down(self, i):
+        """
+        Moves the entry at index i down the heap until both of its children
+        have a larger (priority, counter) pair.
+
+        @param i: int
+        """
+        heap = self.heap
+        size = len(heap)
+        while True:
+            smallest = i
+            for child in (2*i + 1, 2*i + 2):
+                if child < size and (heap[child][0] < heap[smallest][0] or (heap[child][0] == heap[smallest][0] and heap[child][1] < heap[smallest][1])):
+                    smallest = child
+
+            if smallest == i:
+                break
+
+            self.swap(i, smallest)
+            i = smallest
 
     def enqueue(self, item, priority):
         """
@@ -121,24 +225,30 @@ class PriorityQueue:
         @param item: Any
         @param priority: int
         """
-        self.heap.append((item, priority))
+        self.heap.append([priority, self.counter, item])
+        self.counter += 1
+        self.positions[make_hashable(item)] = len(self.heap) - 1
+        self.sift_up(len(self.heap) - 1)
 
     def dequeue(self):
         """
         This function will remove the item which has the highest
-        priority from the priority queue as long as the queue is not
-        empty.
+        priority (the lowest priority value) from the priority queue
+        as long as the queue is not empty.
 
-        @return: Any
+        @return: Any or None
         """
-        current_item_index = 0
-        for i in range(len(self.heap)):
-            if self.heap[i][1] < self.heap[current_item_index][1]:
-                current_item_index = i
+        if len(self.heap) == 0:
+            return None
 
-        coord = self.heap[current_item_index][0]
-        self.heap.pop(current_item_index)
-        return coord
+        self.swap(0, len(self.heap) - 1)
+        priority, counter, item = self.heap.pop()
+        self.positions.pop(make_hashable(item))
+
+        if len(self.heap) > 0:
+            self.sift_down(0)
+
+        return item
 
     def peek(self):
         """
@@ -147,42 +257,71 @@ class PriorityQueue:
 
         @return: Any
         """
-        current_item_index = 0
-        for i in range(len(self.heap)):
-            if self.heap[i][1] < self.heap[current_item_index][1]:
-                current_item_index = i
+        return self.heap[0][2]
+
+    def peek_priority(self):
+        """
+        This function will return the priority of the item with the
+        highest priority in the priority queue.
+
+        @return: Any
+        """
+        return self.heap[0][0]
 
-        coord = self.heap[current_item_index][0]
-        return coord
+    def remove(self, item):
+        """
+        If the item given exists in the priority queue, this function
+        will remove it from the priority queue.
+
+        @param item: Any
+        """
+        i = self.positions.get(make_hashable(item))
+        if i == None:
+            return
+
+        last = len(self.heap) - 1
+        if i != last:
+            self.swap(i, last)
+
+        self.heap.pop()
+        self.positions.pop(make_hashable(item))
+
+        # NOTE(ali): The last entry has been moved into the removed entry's place,
+        #            so it might have to go either up or down the heap.
+        if i != last:
+            moved_item = self.heap[i][2]
+            self.sift_up(i)
+            self.sift_down(self.positions[make_hashable(moved_item)])
 
     def exists(self, item):
         """
-        This will check if the item given exists in the self.heap list.
+        This will check if the item given exists in the priority queue.
 
         @param item: Any
         @return: bool
         """
-        for heap_item, heap_priority in self.heap:
-            if heap_item == item: 
-                return True
-
-        return False
+        return make_hashable(item) in self.positions
 
     def replace(self, item, new_priority_value):
         """
         If the item given exists in the priority queue, this
         function will change the priority of that item to
-        the new priority value we have been given.
+        the new priority value we have been given and move it
+        to the correct position in the heap.
 
         @param item: Any
         @param new_priority_value: int
         """
-        for i in range(len(self.heap)):
-            if self.heap[i][0] == item:
-                element = list(self.heap[i])
-                element[1] = new_priority_value
-                self.heap[i] = element
-                break
+        i = self.positions.get(make_hashable(item))
+        if i == None:
+            return
+
+        old_priority_value = self.heap[i][0]
+        self.heap[i][0] = new_priority_value
+        if new_priority_value < old_priority_value:
+            self.sift_up(i)
+        else:
+            self.sift_down(i)
 
     def is_empty(self):
         """
@@ -194,3 +333,141 @@ class PriorityQueue:
             return True
         else:
             return False
+
+class BucketQueue:
+    def __init__(self, max_weight):
+        """
+        Initializes the BucketQueue class.
+
+        This is the bucket queue used by Dial's algorithm. It only supports
+        integer priorities, and it expects every priority which is enqueued to be
+        between the priority of the last dequeued item and that priority plus
+        max_weight (this is always true for Dijkstra's algorithm when no edge
+        costs more than max_weight). Because of this we only need max_weight+1
+        buckets which are reused in a circular way, and items are found by
+        moving the self.current_priority attribute forward instead of comparing
+        priorities. The self.priorities dictionary maps each item in the queue
+        to its current priority, when the priority of an item is replaced the
+        old entry is left in its bucket and skipped when it is dequeued.
+
+        @param max_weight: int
+        """
+        self.num_of_buckets = max_weight + 1
+        self.buckets = [deque() for x in range(self.num_of_buckets)]
+        self.priorities = {}
+        self.current_priority = 0
+
+    def __iter__(self):
+        """
+        Makes it so that when we loop over the instance of the BucketQueue
+        class it will loop over (item, priority) tuples for every item in
+        the bucket queue.
+
+        @return: Iterator
+        """
+        items = []
+        for bucket in self.buckets:
+            for priority, item in bucket:
+                if self.priorities.get(make_hashable(item)) == priority:
+                    items.append((item, priority))
+        return iter(items)
+
+    def __str__(self):
+        """
+        Whenever we try to print out the instance of the BucketQueue class it
+        will instead print a list of the (item, priority) tuples in the queue.
+
+        @return: Str
+        """
+        return str(list(self))
+
+    def __len__(self):
+        """
+        Returns the number of items in the bucket queue.
+
+        @return: int
+        """
+        return len(self.priorities)
+
+    def enqueue(self, item, priority):
+        """
+        Will add an item to the bucket for the given priority.
+
+        @param item: Any
+        @param priority: int
+        """
+        self.priorities[make_hashable(item)] = priority
+        self.buckets[priority % self.num_of_buckets].append((priority, item))
+
+    def dequeue(self):
+        """
+        This function will remove the item with the lowest priority from the
+        bucket queue as long as the queue is not empty. Entries whose priority
+        has since been replaced are thrown away as they are found.
+
+        @return: Any or None
+        """
+        while len(self.priorities) > 0:
+            bucket = self.buckets[self.current_priority % self.num_of_buckets]
+            while len(bucket) > 0:
+                priority, item = bucket.popleft()
+                key = make_hashable(item)
+                if self.priorities.get(key) == priority:
+                    del self.priorities[key]
+                    return item
+
+            self.current_priority += 1
+
+        return None
+
+    def exists(self, item):
+        """
+        This will check if the item given exists in the bucket queue.
+
+        @param item: Any
+        @return: bool
+        """
+        return make_hashable(item) in self.priorities
+
+    def replace(self, item, new_priority_value):
+        """
+        If the item given exists in the bucket queue, this function will
+        move it to the bucket for the new priority value we have been given.
+
+        @param item: Any
+        @param new_priority_value: int
+        """
+        if self.exists(item):
+            self.enqueue(item, new_priority_value)
+
+    def is_empty(self):
+        """
+        This function will check if the bucket queue is empty.
+
+        @return: bool
+        """
+        if len(self.priorities) == 0:
+            return True
+        else:
+            return False
+
+# NOTE(ali): A BucketQueue holds max_weight+1 buckets and dequeue steps through every empty bucket
+#            between two priorities, so it is only quicker than a PriorityQueue while the weights are
+#            small. A single cell with a huge weight (the weight text entry used to accept any number)
+#            would otherwise allocate millions of buckets, so above this a PriorityQueue is used instead.
+MAX_BUCKET_QUEUE_WEIGHT = 256
+
+def create_distance_queue(max_weight):
+    """
+    Returns the queue which the searches that expand cells in order of their distance (Dial's
+    algorithm, the landmark table, the goal distance field and the HPA* cluster searches) use as
+    their frontier. This is a BucketQueue if max_weight (the largest weight of any cell) is at most
+    MAX_BUCKET_QUEUE_WEIGHT, otherwise it is a PriorityQueue. Both have the same enqueue, dequeue,
+    exists, replace and is_empty methods, so the searches don't need to know which one they have.
+
+    @param max_weight: int
+    @return: BucketQueue or PriorityQueue
+    """
+    if max_weight <= MAX_BUCKET_QUEUE_WEIGHT:
+        return BucketQueue(max_weight)
+    return PriorityQueue()
@@ -0,0 +1,152 @@
+from enum import IntEnum
+import time
+
+class SearchStopReasons(IntEnum):
+    FINISHED = 0,
+    CANCELLED = 1,
+    TIME_LIMIT = 2,
+    EXPANSION_LIMIT = 3,
+    GRID_TOO_BIG = 4
+
+class SearchBudget:
+    # NOTE(ali): The budget is only checked once every CHECK_INTERVAL expansions (or sooner if
+    #            the expansion limit is closer than that), so that searches which expand a lot of
+    #            cells don't spend most of their time checking the budget and getting the time.
+    CHECK_INTERVAL = 256
+
+    def __init__(self, max_time=None, max_expansions=None):
+        """
+        Initializes the SearchBudget class.
+
+        A SearchBudget is given to PathfindingEngine.run (or PathfindingEngine.iter_events) to limit how
+        long a search can run for. The search is stopped once it has been running for more than max_time
+        seconds, once it has expanded more than max_expansions cells, or once cancel has been called
+        (which can be done from another thread while the search is running), whichever happens first.
+        Either limit can be None, in which case the search is never stopped because of it.
+
+        The search counts the cells it expands, and after every get_check_interval expansions it adds
+        them with add_expansions and calls check. Once check returns True the search stops and returns
+        the best path it has found so far. self.stop_reason is the SearchStopReasons the search stopped
+        for (or None while the search is running), and self.num_of_expansions and get_elapsed_time give
+        the statistics of the search.
+
+        The time spent between pause and resume (such as while the search is waiting for the cells it
+        has checked to be drawn) isn't counted towards max_time.
+
+        @param max_time: float or None
+        @param max_expansions: int or None
+        """
+        self.max_time = max_time
+        self.max_expansions = max_expansions
+        self.cancelled = False
+        self.stop_reason = None
+        self.num_of_expansions = 0
+        self.start_time = 0
+        self.pause_time = None
+        self.elapsed_time = 0
+
+    def start(self):
+        """
+        Starts counting the expansions and the time from 0 again. This is called by the
+        PathfindingEngine at the start of every search, so cancel has to be called after it.
+        """
+        self.stop_reason = None
+        self.num_of_expansions = 0
+        self.start_time = time.perf_counter()
+        self.pause_time = None
+        self.elapsed_time = 0
+
+    def cancel(self):
+        """
+        Stops the search the next time it checks the budget.
+        """
+        self.cancelled = True
+
+    def pause(self):
+        """
+        Stops counting the time until resume is called.
+        """
+        if self.pause_time == None:
+            self.pause_time = time.perf_counter()
+
+    def resume(self):
+        """
+        Starts counting the time again after pause has been called, the
+        time in between is taken off by moving self.start_time forwards.
+        """
+        if self.pause_time != None:
+            self.start_time += time.perf_counter() - self.pause_time
+            self.pause_time = None
+
+    def get_elapsed_time(self):
+        """
+        Returns the number of seconds the search has been running for, or the number of
+        seconds it ran for if it has stopped (not counting the time it was paused for).
+
+        @return: float
+        """
+        if self.stop_reason != None:
+            return self.elapsed_time
+
+        now = time.perf_counter() if self.pause_time == None else self.pause_time
+        return now - self.start_time
+
+    def get_check_interval(self):
+        """
+        Returns the number of cells the search can expand before it has to check the budget again.
+
+        @return: int
+        """
+        if self.max_expansions == None:
+            return self.CHECK_INTERVAL
+        return max(1, min(self.CHECK_INTERVAL, self.max_expansions + 1 - self.num_of_expansions))
+
+    def add_expansions(self, num_of_expansions):
+        """
+        Adds the number of cells given to the number of cells which have been expanded.
+
+        @param num_of_expansions: int
+        """
+        self.num_of_expansions += num_of_expansions
+
+    def check(self):
+        """
+        Returns True if the search has to stop (self.stop_reason is then set to the reason why).
+
+        @return: bool
+        """
+        if self.cancelled:
+            self.stop(SearchStopReasons.CANCELLED)
+        elif self.max_expansions != None and self.num_of_expansions > self.max_expansions:
+            self.stop(SearchStopReasons.EXPANSION_LIMIT)
+        elif self.max_time != None and self.get_elapsed_time() > self.max_time:
+            self.stop(SearchStopReasons.TIME_LIMIT)
+        else:
+            return False
+
+        return True
+
+    def stop(self, stop_reason):
+        """
+        Records that the search has stopped for the reason given.
+
+        @param stop_reason: SearchStopReasons
+        """
+        self.elapsed_time = self.get_elapsed_time()
+        self.stop_reason = stop_reason
+
+    def finish(self):
+        """
+        Records that the search has finished without running out of budget, if it hasn't already stopped.
+        """
+        if self.stop_reason == None:
+            self.stop(SearchStopReasons.FINISHED)
+
+    @property
+    def is_stopped_early(self):
+        """
+        Returns True if the search was stopped before it finished.
+
+        @return: bool
+        """
+        return self.stop_reason != None and self.stop_reason != SearchStopReasons.FINISHED
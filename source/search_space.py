@@ -0,0 +1,143 @@
+from array import array
+
+class SearchSpace:
+    def __init__(self):
+        """
+        Initializes the SearchSpace class.
+
+        The SearchSpace class holds the distance and parent of every cell which
+        has been reached by a pathfinding algorithm, as well as whether the cell
+        has been expanded (closed). These are stored in preallocated arrays which
+        are indexed by the linear index of the cell and are reused between runs.
+
+        Instead of clearing the arrays before every run, each run is given a new
+        generation number and every cell which is written to is stamped with it.
+        A cell whose stamp is not the current generation is treated as not having
+        been reached yet, so starting a new run only costs O(1) and the arrays are
+        only reallocated when the number of cells in the grid changes.
+        """
+        self.num_of_cells = 0
+        self.generation = 0
+        self.distances = array('q')
+        self.parents = array('i')
+        self.stamps = array('I')
+        self.closed_stamps = array('I')
+
+    def begin_search(self, num_of_cells):
+        """
+        This function should be called at the start of every run. It will reallocate
+        the arrays if the number of cells given is different to the current number of
+        cells, and then move on to the next generation.
+
+        @param num_of_cells: int
+        """
+        if num_of_cells != self.num_of_cells:
+            self.num_of_cells = num_of_cells
+            self.generation = 0
+            self.distances = array('q', [0]) * num_of_cells
+            self.parents = array('i', [-1]) * num_of_cells
+            self.stamps = array('I', [0]) * num_of_cells
+            self.closed_stamps = array('I', [0]) * num_of_cells
+
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF:
+            self.stamps = array('I', [0]) * num_of_cells
+            self.closed_stamps = array('I', [0]) * num_of_cells
+            self.generation = 1
+
+    def is_reached(self, index):
+        """
+        Returns True if the cell at the index given has been reached in this run.
+
+        @param index: int
+        @return: bool
+        """
+        return self.stamps[index] == self.generation
+
+    def get_distance(self, index):
+        """
+        Returns the distance of the cell at the index given, or infinity if the
+        cell has not been reached in this run.
+
+        @param index: int
+        @return: int or float
+        """
+        if self.stamps[index] == self.generation:
+            return self.distances[index]
+        return float('inf')
+
+    def get_parent(self, index):
+        """
+        Returns the index of the parent of the cell at the index given, or -1
+        if the cell has no parent or has not been reached in this run.
+
+        @param index: int
+        @return: int
+        """
+        if self.stamps[index] == self.generation:
+            return self.parents[index]
+        return -1
+
+    def set_node(self, index, distance, parent):
+        """
+        Sets the distance and parent of the cell at the index given.
+
+        @param index: int
+        @param distance: int
+        @param parent: int
+        """
+        self.stamps[index] = self.generation
+        self.distances[index] = distance
+        self.parents[index] = parent
+
+    def close(self, index):
+        """
+        Marks the cell at the index given as expanded.
+
+        @param index: int
+        """
+        self.closed_stamps[index] = self.generation
+
+    def is_closed(self, index):
+        """
+        Returns True if the cell at the index given has been expanded in this run.
+
+        @param index: int
+        @return: bool
+        """
+        return self.closed_stamps[index] == self.generation
+
+    def clear_closed(self):
+        """
+        Marks every cell as not expanded without forgetting the distances and parents of the cells which
+        have been reached, so that a search which goes over the grid more than once (see ARA*) can
+        expand the cells again while still using the distances it has already found.
+        """
+        self.closed_stamps = array('I', [0]) * self.num_of_cells
+
+    def get_reached_indexes(self):
+        """
+        Returns a list containing the indexes of every cell which has been reached in this run.
+
+        @return: List
+        """
+        generation = self.generation
+        return [index for index, stamp in enumerate(self.stamps) if stamp == generation]
+
+    def get_path(self, end_index):
+        """
+        Follows the parents of the cells back from the index given and returns
+        a list containing the indexes of the cells on the path, starting with
+        the cell which has no parent and ending with end_index.
+
+        @param end_index: int
+        @return: List
+        """
+        path = []
+        index = end_index
+        while index != -1:
+            path.append(index)
+            index = self.get_parent(index)
+
+        path.reverse()
+        return path
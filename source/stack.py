@@ -1,17 +1,66 @@
 import traceback
 
+def make_hashable(item):
+    """
+    Converts the item given into a value which can be used as a
+    key in a dictionary. Lists (such as the [y, x] coordinates which
+    are pushed onto most of the stacks in the game) are turned into
+    tuples, and this is done recursively for nested lists.
+
+    @param item: Any
+    @return: Any
+    """
+    if isinstance(item, list):
+        return tuple(make_hashable(i) for i in item)
+    return item
+
 class Stack:
-    def __init__(self, size):
+    def __init__(self, size=None):
         """
         Initializes the Stack class.
 
-        @param size: int
+        The self.index dictionary keeps a count of how many times each
+        item appears in the stack so that the exists method does not
+        have to scan through the whole self.stack list.
+
+        If no size is given the stack has no limit, and instead of
+        filling the self.stack list with None values up front it only
+        grows as items are pushed onto it.
+
+        @param size: int or None
         """
         self.size = size
-        self.stack = []
-        for x in range(self.size):
-            self.stack.append(None)
+        self._stack = [] if self.size == None else [None] * self.size
         self.pointer = -1
+        self.index = {}
+
+    @property
+    def stack(self):
+        """
+        Getter for the list which holds the elements of the stack.
+
+        @return: List
+        """
+        return self._stack
+
+    @stack.setter
+    def stack(self, new_stack):
+        """
+        Setter for the list which holds the elements of the stack. Since
+        the list has been replaced we will work out the new value of the
+        pointer attribute (the index of the last element before the first
+        None value) and rebuild the self.index dictionary.
+
+        @param new_stack: List
+        """
+        self._stack = new_stack
+        self.pointer = -1
+        self.index = {}
+        for item in self._stack:
+            if item == None:
+                break
+            self.pointer += 1
+            self.add_to_index(item)
 
     def __iter__(self):
         """
@@ -20,7 +69,7 @@ class Stack:
 
         @return: Iterator
         """
-        return iter(self.stack)
+        return iter(self._stack)
 
     def __str__(self):
         """
@@ -29,22 +78,51 @@ class Stack:
 
         @return: Str
         """
-        return str(self.stack)
+        return str(self._stack)
+
+    def add_to_index(self, item):
+        """
+        Increments the count of the item given in the self.index dictionary.
+
+        @param item: Any
+        """
+        key = make_hashable(item)
+        self.index[key] = self.index.get(key, 0) + 1
+
+    def remove_from_index(self, item):
+        """
+        Decrements the count of the item given in the self.index dictionary,
+        removing the item from the dictionary once the count reaches 0.
+
+        @param item: Any
+        """
+        key = make_hashable(item)
+        count = self.index.get(key, 0)
+        if count <= 1:
+            self.index.pop(key, None)
+        else:
+            self.index[key] = count - 1
 
     def push(self, value, show_errors=True):
         """
         If the stack is not full, this function will add an element
-        to the stack and also increment the pointer attribute. If
-        the stack is full and the show_errors variable given is equal
-        to True we will print out an error message.
+        to the stack and also increment the pointer attribute (a stack
+        without a size is never full). If the stack is full and the
+        show_errors variable given is equal to True we will print out
+        an error message.
 
         @param value: Any
         @param show_errors: bool
         @return: None or -1
         """
-        if None in self.stack:
+        if self.pointer + 1 < len(self._stack):
             self.pointer += 1
-            self.stack[self.pointer] = value
+            self._stack[self.pointer] = value
+            self.add_to_index(value)
+        elif self.size == None:
+            self.pointer += 1
+            self._stack.append(value)
+            self.add_to_index(value)
         else:
             if show_errors:
                 print("STACK PUSH ERROR: The stack is full.")
@@ -63,7 +141,11 @@ class Stack:
         @return: None or -1
         """
         if self.pointer != -1:
-            self.stack[self.pointer] = None
+            self.remove_from_index(self._stack[self.pointer])
+            if self.size == None and self.pointer + 1 == len(self._stack):
+                self._stack.pop()
+            else:
+                self._stack[self.pointer] = None
             self.pointer -= 1
         else:
             if show_errors:
@@ -82,7 +164,7 @@ class Stack:
         @return: Any or -1
         """
         if self.pointer != -1:
-            return self.stack[self.pointer]
+            return self._stack[self.pointer]
         else:
             if show_errors:
                 print("STACK PEEK ERROR: The stack is empty.")
@@ -96,42 +178,25 @@ class Stack:
 
         @return: int
         """
-        counter = 0
-        for item in self.stack:
-            if item != None:
-                counter += 1
-
-        return counter
+        return self.pointer + 1
 
     def remove_empty_values(self):
         """
-        This function will go through the self.stack list and find
-        any elements which are the None value, and it will remove them
-        from the list.
+        This function will remove the None values which come after
+        the element at the index of the pointer attribute from the
+        self.stack list.
         """
-        for i in range(len(self.stack)):
-            if self.stack[i] == None:
-                self.stack = self.stack[:i]
-                break
+        if self.pointer + 1 < len(self._stack):
+            del self._stack[self.pointer+1:]
 
     def gen_copy_without_empty_values(self):
         """
-        This function will create a copy of the self.stack list, and
-        remove any None values in the list. It will then return this
-        list.
+        This function will create a copy of the self.stack list
+        without any of the None values and return it.
 
         @return: List
         """
-        stack_copy = self.stack.copy()
-        items_to_remove_indexes = []
-        for i in range(len(stack_copy)):
-            if stack_copy[i] == None:
-                items_to_remove_indexes.append(i)
-
-        for index in items_to_remove_indexes[::-1]:
-            stack_copy.pop(index)
-
-        return stack_copy
+        return self._stack[:self.pointer+1]
 
 
     def reverse(self):
@@ -140,19 +205,16 @@ class Stack:
         and then reverse the self.stack list.
         """
         self.remove_empty_values()
-        self.stack = self.stack[::-1]
+        self._stack.reverse()
 
     def exists(self, item):
         """
-        This function will check if the item given exists in the self.stack list.
+        This function will check if the item given exists in the stack.
 
         @param item: Any
         @return: bool
         """
-        if item in self.stack:
-            return True
-        else:
-            return False
+        return make_hashable(item) in self.index
 
     def merge(self, stack1, stack2):
         """
@@ -175,4 +237,4 @@ class Stack:
         @return: List
         """
         self.remove_empty_values()
-        return self.stack
+        return self._stack
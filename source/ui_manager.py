@@ -2648,6 +2648,12 @@ class GameUIStates(IntEnum):
     UI_RUNNING_RECURSIVE_DIVISION_STATE = 2
 
 class GameUIManager:
+    # NOTE(ali): The weights which can be typed into the weighted node text entry. A weight of 0
+    #            would let the heuristics overestimate, and huge weights make the searches slower
+    #            for no reason (see create_distance_queue), so anything outside this is clamped.
+    MIN_WEIGHT = 1
+    MAX_WEIGHT = 100
+
     def __init__(self, screen_manager, rect_array_obj, color_manager, animation_manager, grid, client, server, pathfinding_algorithms_dict, maze_generation_algorithms_dict, events_dict):
         """
         Initializes the GameUIManager class.
@@ -2711,14 +2717,18 @@ class GameUIManager:
 
         self.run_button = pygame_gui.elements.UIButton(relative_rect=pygame.Rect((810, 130), (180, 50)), text="Run", manager=self.manager)
 
-        self.pathfinding_algorithms_options = ['Depth First Search', 'Breadth First Search', 'Dijkstra', 'A*', 'Greedy Best First Search', 'Bidirectional Best First Search']
+        self.pathfinding_algorithms_options = ['Depth First Search', 'Breadth First Search', 'Dijkstra', 'A*', 'Greedy Best First Search', 'Bidirectional Best First Search', "Dijkstra (Dial's Buckets)", "Jump Point Search", "Lifelong Planning A*", "Bidirectional Dijkstra", "Bidirectional A*", "HPA* (Hierarchical A*)", "Flow Field (Reverse Dijkstra)", "Bitboard BFS", "Anytime Repairing A* (ARA*)", "IDA* (memory-bounded, small grids only)", "Fringe Search"]
         self.pathfinding_algorithms_menu = pygame_gui.elements.UIDropDownMenu(relative_rect=pygame.Rect((20, 10), (200, 50)),
                                                                               options_list=self.pathfinding_algorithms_options,
                                                                               starting_option="A*",
                                                                               manager=self.manager)
 
+        self.heuristics_options = ['Manhattan Distance', 'Euclidean Distance', 'Octile Distance', 'Chebyshev Distance', 'Landmarks (ALT)']
+        # NOTE(ali): ARA* only finds the best path with a heuristic which never overestimates the distance
+        #            to the end node (see PathfindingEngine.ARA_STAR_HEURISTICS), so it only gets these options.
+        self.admissible_heuristics_options = ['Octile Distance', 'Chebyshev Distance', 'Landmarks (ALT)']
         self.heuristics_menu = pygame_gui.elements.UIDropDownMenu(relative_rect=pygame.Rect((230, 10), (200, 50)),
-                                                                  options_list=['Manhattan Distance', 'Euclidean Distance'],
+                                                                  options_list=self.heuristics_options,
                                                                   starting_option='Manhattan Distance',
                                                                   manager=self.manager)
 
@@ -2797,6 +2807,7 @@ class GameUIManager:
         self.current_maze_generation_algorithm = MazeGenerationAlgorithmTypes.RANDOM_MARKED_MAZE
         self.recursive_division_skew = None
         self.pathfinding_algorithm_speed = 25
+        self.pathfinding_algorithms_dict[PathfindingAlgorithmTypes.ARA_STAR].set_speed(self.pathfinding_algorithm_speed)
         self.recursive_division_speed = 15
         self.cursor_node_type = CursorNodeTypes.MARKED_NODE
         self.weight = 1
@@ -2868,27 +2879,28 @@ class GameUIManager:
         This function will be used to run a pathfinding algorithm, and it will
         do the following things in the order given:
 
-        1) Run the reset_rect_array_adjacent_nodes method in self.rect_array_obj.
-        2) Run the gen_rect_array_with_adjacent_nodes method in self.rect_array_obj.
-        3) Run the reset_non_user_weights method in self.rect_array_obj.
-        4) Run the reset_path_pointer method in pathfinding_algorithm.
-        5) Run the reset_checked_nodes_pointer method in pathfinding_algorithm.
-        6) Run the reset_animated_checked_coords_stack method in pathfinding_algorithm.
-        7) Run the reset_animated_path_coords_stack method in pathfinding_algorithm.
-        8) Set the heuristic attribute in pathfinding_algorithm to be the same as the heuristic given.
-        9) Run the run method in pathfinding_algorithm.
+        1) Run the reset_path_pointer method in pathfinding_algorithm.
+        2) Run the reset_checked_nodes_pointer method in pathfinding_algorithm.
+        3) Run the reset_animated_checked_nodes_pointer method in pathfinding_algorithm.
+        4) Run the reset_animated_path_coords_stack method in pathfinding_algorithm.
+        5) Set the heuristic attribute in pathfinding_algorithm to be the same as the heuristic given.
+        6) Run the run method in pathfinding_algorithm.
+
+        The run method doesn't wait for the algorithm to finish (it is run on another thread),
+        so the DRAW_CHECKED_NODES timer starts drawing the checked nodes as soon as they are found.
+
+        The adjacent nodes of each node do not need to be generated here since the neighbor
+        table in the GridModel is kept up to date whenever a node is marked or unmarked, and
+        the weights do not need to be reset since the pathfinding algorithms keep their
+        distances in their own SearchSpace instead of in the weights of the grid.
 
         @param pathfinding_algorithm: An instance of a child class of the PathfindingAlgorithm class.
         @param heuristic: PathfindingHeuristics
         """
-        self.rect_array_obj.reset_rect_array_adjacent_nodes()
-        self.rect_array_obj.gen_rect_array_with_adjacent_nodes()
-        self.rect_array_obj.reset_non_user_weights()
-
         pathfinding_algorithm.reset_path_pointer()
         pathfinding_algorithm.reset_checked_nodes_pointer()
 
-        pathfinding_algorithm.reset_animated_checked_coords_stack()
+        pathfinding_algorithm.reset_animated_checked_nodes_pointer()
         pathfinding_algorithm.reset_animated_path_coords_stack()
 
         print("Current pathfinding heuristic:", heuristic)
@@ -2910,24 +2922,36 @@ class GameUIManager:
                                                                   manager=self.manager)
         self.heuristics_menu.disable()
 
-    def create_heuristics_menu_with_distances(self, starting_value='Manhattan Distance'):
+    def create_heuristics_menu_with_distances(self, starting_value='Manhattan Distance', options_list=None):
         """
         This function will first destroy the current heuristics menu. After this it will check
-        if the starting_value given is equal to the string 'Manhattan Distance' or 'Euclidean Distance'
-        and it will set the heuristic attribute to be PathfindingHeuristics.MANHATTAN_DISTANCE or
-        PathfindingHeuristics.EUCLIDEAN_DISTANCE accordingly. After this we will create a new heuristics menu
-        with the new value of the heuristics attribute.
+        if the starting_value given is equal to the string 'Manhattan Distance', 'Euclidean Distance',
+        'Octile Distance', 'Chebyshev Distance' or 'Landmarks (ALT)' and it will set the heuristic attribute to be
+        PathfindingHeuristics.MANHATTAN_DISTANCE, PathfindingHeuristics.EUCLIDEAN_DISTANCE, PathfindingHeuristics.OCTILE_DISTANCE,
+        PathfindingHeuristics.CHEBYSHEV_DISTANCE or PathfindingHeuristics.LANDMARKS accordingly.
+        After this we will create a new heuristics menu with the new value of the heuristics attribute,
+        which has the options in options_list (or every heuristic if options_list is None).
 
         @param starting_value: Str
+        @param options_list: List or None
         """
         self.heuristics_menu.kill()
         if starting_value == 'Manhattan Distance':
             self.heuristic = PathfindingHeuristics.MANHATTAN_DISTANCE
+        elif starting_value == 'Octile Distance':
+            self.heuristic = PathfindingHeuristics.OCTILE_DISTANCE
+        elif starting_value == 'Chebyshev Distance':
+            self.heuristic = PathfindingHeuristics.CHEBYSHEV_DISTANCE
+        elif starting_value == 'Landmarks (ALT)':
+            self.heuristic = PathfindingHeuristics.LANDMARKS
         else:
             self.heuristic = PathfindingHeuristics.EUCLIDEAN_DISTANCE
 
+        if options_list == None:
+            options_list = self.heuristics_options
+
         self.heuristics_menu = pygame_gui.elements.UIDropDownMenu(relative_rect=pygame.Rect((230, 10), (200, 50)),
-                                                                  options_list=['Manhattan Distance', 'Euclidean Distance'],
+                                                                  options_list=options_list,
                                                                   starting_option=starting_value,
                                                                   manager=self.manager)
 
@@ -3007,6 +3031,28 @@ class GameUIManager:
                 starting_option = 'Greedy Best First Search'
             case PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS:
                 starting_option = 'Bidirectional Best First Search'
+            case PathfindingAlgorithmTypes.DIAL_DIJKASTRA:
+                starting_option = "Dijkstra (Dial's Buckets)"
+            case PathfindingAlgorithmTypes.JUMP_POINT_SEARCH:
+                starting_option = "Jump Point Search"
+            case PathfindingAlgorithmTypes.LPA_STAR:
+                starting_option = "Lifelong Planning A*"
+            case PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA:
+                starting_option = "Bidirectional Dijkstra"
+            case PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR:
+                starting_option = "Bidirectional A*"
+            case PathfindingAlgorithmTypes.HPA_STAR:
+                starting_option = "HPA* (Hierarchical A*)"
+            case PathfindingAlgorithmTypes.FLOW_FIELD:
+                starting_option = "Flow Field (Reverse Dijkstra)"
+            case PathfindingAlgorithmTypes.BITBOARD_BFS:
+                starting_option = "Bitboard BFS"
+            case PathfindingAlgorithmTypes.ARA_STAR:
+                starting_option = "Anytime Repairing A* (ARA*)"
+            case PathfindingAlgorithmTypes.IDA_STAR:
+                starting_option = "IDA* (memory-bounded, small grids only)"
+            case PathfindingAlgorithmTypes.FRINGE_SEARCH:
+                starting_option = "Fringe Search"
 
         self.pathfinding_algorithms_menu.kill()
         self.pathfinding_algorithms_menu = pygame_gui.elements.UIDropDownMenu(relative_rect=pygame.Rect((20, 10), (200, 50)),
@@ -3016,6 +3062,15 @@ class GameUIManager:
 
         if heuristic == None:
             self.create_empty_heuristics_menu()
+        elif self.current_pathfinding_algorithm == PathfindingAlgorithmTypes.ARA_STAR:
+            self.heuristic = heuristic if heuristic in PathfindingEngine.ARA_STAR_HEURISTICS else PathfindingEngine.ARA_STAR_DEFAULT_HEURISTIC
+            match self.heuristic:
+                case PathfindingHeuristics.OCTILE_DISTANCE:
+                    self.create_heuristics_menu_with_distances('Octile Distance', self.admissible_heuristics_options)
+                case PathfindingHeuristics.CHEBYSHEV_DISTANCE:
+                    self.create_heuristics_menu_with_distances('Chebyshev Distance', self.admissible_heuristics_options)
+                case PathfindingHeuristics.LANDMARKS:
+                    self.create_heuristics_menu_with_distances('Landmarks (ALT)', self.admissible_heuristics_options)
         else:
             self.heuristic = heuristic
             match self.heuristic:
@@ -3023,6 +3078,12 @@ class GameUIManager:
                     self.create_heuristics_menu_with_distances('Euclidean Distance')
                 case PathfindingHeuristics.MANHATTAN_DISTANCE:
                     self.create_heuristics_menu_with_distances()
+                case PathfindingHeuristics.OCTILE_DISTANCE:
+                    self.create_heuristics_menu_with_distances('Octile Distance')
+                case PathfindingHeuristics.CHEBYSHEV_DISTANCE:
+                    self.create_heuristics_menu_with_distances('Chebyshev Distance')
+                case PathfindingHeuristics.LANDMARKS:
+                    self.create_heuristics_menu_with_distances('Landmarks (ALT)')
 
         if is_server_event:
             self.build_ui_running_pathfinding_algorithm_state()
@@ -3116,10 +3177,13 @@ class GameUIManager:
         pathfinding algorithm speed slider to be the same as the pathfinding_algorithm_speed
         given.
 
+        The time limit of ARA* is also set from the pathfinding_algorithm_speed given (see ARAStar.set_speed).
+
         @param pathfinding_algorithm_speed: int
         """
         self.pathfinding_algorithm_speed = pathfinding_algorithm_speed
         self.pathfinding_algorithm_speed_slider.set_current_value(self.pathfinding_algorithm_speed)
+        self.pathfinding_algorithms_dict[PathfindingAlgorithmTypes.ARA_STAR].set_speed(self.pathfinding_algorithm_speed)
 
     def update_recursive_division_speed(self, recursive_division_speed):
         """
@@ -3165,6 +3229,39 @@ class GameUIManager:
                 case 'Bidirectional Best First Search':
                     self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS
                     self.create_empty_heuristics_menu()
+                case "Dijkstra (Dial's Buckets)":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.DIAL_DIJKASTRA
+                    self.create_empty_heuristics_menu()
+                case "Jump Point Search":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.JUMP_POINT_SEARCH
+                    self.create_heuristics_menu_with_distances()
+                case "Lifelong Planning A*":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.LPA_STAR
+                    self.create_empty_heuristics_menu()
+                case "Bidirectional Dijkstra":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA
+                    self.create_empty_heuristics_menu()
+                case "Bidirectional A*":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR
+                    self.create_empty_heuristics_menu()
+                case "HPA* (Hierarchical A*)":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.HPA_STAR
+                    self.create_empty_heuristics_menu()
+                case "Flow Field (Reverse Dijkstra)":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.FLOW_FIELD
+                    self.create_empty_heuristics_menu()
+                case "Bitboard BFS":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.BITBOARD_BFS
+                    self.create_empty_heuristics_menu()
+                case "Anytime Repairing A* (ARA*)":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.ARA_STAR
+                    self.create_heuristics_menu_with_distances('Octile Distance', self.admissible_heuristics_options)
+                case "IDA* (memory-bounded, small grids only)":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.IDA_STAR
+                    self.create_heuristics_menu_with_distances()
+                case "Fringe Search":
+                    self.current_pathfinding_algorithm = PathfindingAlgorithmTypes.FRINGE_SEARCH
+                    self.create_heuristics_menu_with_distances()
 
         if event.ui_element == self.heuristics_menu:
             match event.text:
@@ -3172,6 +3269,12 @@ class GameUIManager:
                     self.heuristic = PathfindingHeuristics.MANHATTAN_DISTANCE
                 case 'Euclidean Distance':
                     self.heuristic = PathfindingHeuristics.EUCLIDEAN_DISTANCE
+                case 'Octile Distance':
+                    self.heuristic = PathfindingHeuristics.OCTILE_DISTANCE
+                case 'Chebyshev Distance':
+                    self.heuristic = PathfindingHeuristics.CHEBYSHEV_DISTANCE
+                case 'Landmarks (ALT)':
+                    self.heuristic = PathfindingHeuristics.LANDMARKS
 
         if event.ui_element == self.maze_generation_algorithms_menu:
             match event.text:
@@ -3199,12 +3302,14 @@ class GameUIManager:
                 case 'Marked':
                     self.cursor_node_type = CursorNodeTypes.MARKED_NODE
                     self.weighted_node_text_entry_line.disable()
+                    self.weighted_node_text_entry_line.set_text_length_limit(10)
                     self.weighted_node_text_entry_line.set_allowed_characters([' ', 'N', 'o', 'n', 'e'])
                     self.weighted_node_text_entry_line.set_text('   None')
                 case 'Weighted':
                     self.cursor_node_type = CursorNodeTypes.WEIGHTED_NODE
                     self.weighted_node_text_entry_line.enable()
                     self.weighted_node_text_entry_line.set_allowed_characters('numbers')
+                    self.weighted_node_text_entry_line.set_text_length_limit(len(str(self.MAX_WEIGHT)))
                     self.weighted_node_text_entry_line.set_text('1')
                     self.weight = 1
 
@@ -3363,6 +3468,7 @@ class GameUIManager:
         if event.ui_element == self.pathfinding_algorithm_speed_slider:
             if event.value != self.pathfinding_algorithm_speed:
                 self.pathfinding_algorithm_speed = event.value
+                self.pathfinding_algorithms_dict[PathfindingAlgorithmTypes.ARA_STAR].set_speed(self.pathfinding_algorithm_speed)
                 self.client.create_network_event(NetworkingEventTypes.SET_PATHFINDING_ALGORITHM_SPEED, self.pathfinding_algorithm_speed)
 
         if event.ui_element == self.recursive_division_speed_slider:
@@ -3380,7 +3486,11 @@ class GameUIManager:
         self.theme_window.handle_theme_window_ui_text_entry_finished_event(event)
         self.settings_window.handle_settings_window_ui_text_entry_finished_event(event)
         if event.ui_element == self.weighted_node_text_entry_line:
-            self.weight = int(event.text)
+            if event.text.isdigit():
+                self.weight = min(max(int(event.text), self.MIN_WEIGHT), self.MAX_WEIGHT)
+            else:
+                self.weight = self.MIN_WEIGHT
+            self.weighted_node_text_entry_line.set_text(str(self.weight))
 
     def handle_ui_window_closed_event(self, event):
         """
@@ -0,0 +1,152 @@
+import random
+
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+from search_budget import SearchBudget, SearchStopReasons
+
+def create_random_board(seed, max_size=14, wall_chance=0.3, weight_chance=0.3, max_weight=9):
+    """
+    Creates a GridModel with a random size, random walls, random weights and a random start node
+    and end node from the seed given, so that the same seed always gives the same board.
+
+    @param seed: int
+    @param max_size: int
+    @param wall_chance: float
+    @param weight_chance: float
+    @param max_weight: int
+    @return: GridModel
+    """
+    rng = random.Random(seed)
+    num_of_rows = rng.randint(2, max_size)
+    num_of_columns = rng.randint(2, max_size)
+    cells = [[y, x] for y in range(num_of_rows) for x in range(num_of_columns)]
+    start_node_coords, end_node_coords = rng.sample(cells, 2)
+
+    walls = []
+    weights = []
+    for coords in cells:
+        if coords == start_node_coords or coords == end_node_coords:
+            continue
+
+        value = rng.random()
+        if value < wall_chance:
+            walls.append(coords)
+        elif value < wall_chance + weight_chance:
+            weights.append([coords, rng.randint(2, max_weight)])
+
+    return create_grid_model(num_of_rows, num_of_columns, walls, weights, start_node_coords, end_node_coords)
+
+def get_path_cost(grid_model, path):
+    """
+    Returns the cost of the path given, which is the sum of the weights of every cell stepped onto.
+
+    @param grid_model: GridModel
+    @param path: List
+    @return: int
+    """
+    return sum(grid_model.weights[index] for index in path[1:])
+
+def is_valid_path(grid_model, path, reaches_end_node=True):
+    """
+    Returns True if the path given starts at the start node, only steps between open cells
+    which are next to each other, and (if reaches_end_node is True) ends at the end node.
+
+    @param grid_model: GridModel
+    @param path: List
+    @param reaches_end_node: bool
+    @return: bool
+    """
+    if len(path) == 0 or path[0] != grid_model.start_index:
+        return False
+    if reaches_end_node and path[-1] != grid_model.end_index:
+        return False
+
+    for index, next_index in zip(path, path[1:]):
+        if next_index not in grid_model.get_open_neighbors(index):
+            return False
+    return True
+
+def edit_board(grid_model, rng, num_of_edits):
+    """
+    Marks, unmarks and changes the weight of random cells of the grid_model given (apart from the start
+    node and the end node), and sometimes moves the start node or the end node to a random open cell.
+
+    @param grid_model: GridModel
+    @param rng: random.Random
+    @param num_of_edits: int
+    """
+    for _ in range(num_of_edits):
+        index = rng.randrange(grid_model.num_of_cells)
+        if index in (grid_model.start_index, grid_model.end_index):
+            continue
+
+        if rng.random() < 0.6:
+            grid_model.set_wall(index, grid_model.walls[index] == 0)
+        else:
+            weight = rng.randint(1, 9)
+            grid_model.set_user_weight(index, weight != 1)
+            grid_model.set_weight(index, weight)
+
+    open_cells = [index for index in range(grid_model.num_of_cells) if grid_model.walls[index] == 0]
+    if rng.random() < 0.3:
+        grid_model.start_index = rng.choice([index for index in open_cells if index != grid_model.end_index])
+    if rng.random() < 0.2:
+        grid_model.end_index = rng.choice([index for index in open_cells if index != grid_model.start_index])
+
+def check_against_dijkastra(grid_model, algorithm_type, result, message):
+    """
+    Checks the result of the incremental algorithm given against the result of a new run of Dijkastra.
+
+    @param grid_model: GridModel
+    @param algorithm_type: PathfindingAlgorithmTypes
+    @param result: PathfindingResult
+    @param message: Any
+    """
+    expected = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+    assert result.found_path == expected.found_path, message
+    if result.found_path == False:
+        return
+
+    assert is_valid_path(grid_model, result.path), message
+    # NOTE(ali): HPA* doesn't always find the shortest path (see HPAStarPlanner).
+    if algorithm_type == PathfindingAlgorithmTypes.HPA_STAR:
+        assert get_path_cost(grid_model, result.path) >= get_path_cost(grid_model, expected.path), message
+    else:
+        assert get_path_cost(grid_model, result.path) == get_path_cost(grid_model, expected.path), message
+
+def check_results_after_edits(algorithm_type):
+    """
+    Runs the incremental algorithm given with the same engine on random boards after rounds of random
+    edits (so the planner repairs what it kept from the last run) and checks every result against Dijkastra.
+
+    @param algorithm_type: PathfindingAlgorithmTypes
+    """
+    for seed in range(15):
+        rng = random.Random(seed)
+        grid_model = create_random_board(seed, max_size=24, wall_chance=0.2, weight_chance=0.2)
+        engine = PathfindingEngine()
+        for edit in range(10):
+            result = engine.run(grid_model, algorithm_type)
+            check_against_dijkastra(grid_model, algorithm_type, result, (seed, edit))
+            edit_board(grid_model, rng, rng.randint(1, 12))
+
+def check_results_after_running_out_of_budget(algorithm_type):
+    """
+    Runs the incremental algorithm given with a tiny expansion limit after rounds of random edits, so
+    that the planner is stopped part of the way through its repair, and checks that the next run without
+    a limit carries on from there and finds the same path as Dijkastra.
+
+    @param algorithm_type: PathfindingAlgorithmTypes
+    """
+    for seed in range(15):
+        rng = random.Random(seed)
+        grid_model = create_random_board(seed, max_size=24, wall_chance=0.2, weight_chance=0.2)
+        engine = PathfindingEngine()
+        engine.run(grid_model, algorithm_type)
+
+        for edit in range(5):
+            edit_board(grid_model, rng, rng.randint(5, 30))
+            engine.run(grid_model, algorithm_type, None, SearchBudget(None, rng.randint(1, 20)))
+
+            result = engine.run(grid_model, algorithm_type)
+            assert result.stop_reason == SearchStopReasons.FINISHED
+            check_against_dijkastra(grid_model, algorithm_type, result, (seed, edit))
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# NOTE(ali): The modules in source/ import each other by name (main.py is run from inside
+#            source/), so the tests have to be able to import them in the same way.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'source'))
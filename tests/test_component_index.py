@@ -0,0 +1,65 @@
+import random
+
+from component_index import ComponentIndex
+from grid_model import GridModel
+
+def get_component_by_flood_fill(grid_model, index):
+    """
+    Returns a set of the indexes of every open cell connected to the cell at the index given.
+
+    @param grid_model: GridModel
+    @param index: int
+    @return: Set
+    """
+    component = {index}
+    stack = [index]
+    while len(stack) != 0:
+        for neighbor in grid_model.get_open_neighbors(stack.pop()):
+            if neighbor not in component:
+                component.add(neighbor)
+                stack.append(neighbor)
+    return component
+
+def test_components_after_random_edits():
+    rng = random.Random(0)
+    grid_model = GridModel(12, 15)
+    component_index = ComponentIndex()
+    component_index.rebuild(grid_model)
+
+    for _ in range(600):
+        grid_model.set_wall(rng.randrange(grid_model.num_of_cells), rng.random() < 0.6)
+        index = rng.randrange(grid_model.num_of_cells)
+        if grid_model.walls[index]:
+            continue
+        assert set(component_index.get_component(grid_model, index)) == get_component_by_flood_fill(grid_model, index)
+
+def test_wall_which_cannot_split_keeps_labels():
+    grid_model = GridModel(5, 5)
+    component_index = ComponentIndex()
+    component_index.rebuild(grid_model)
+
+    # NOTE(ali): None of these cells can split the open cells around them apart.
+    for index in (0, 12, 2):
+        grid_model.set_wall(index, True)
+    assert component_index.needs_rebuild == False
+    assert len(component_index.get_component(grid_model, 6)) == 22
+
+    # NOTE(ali): The cells to the left and to the right of [1, 2] aren't connected around it
+    #            once it is marked, so the labels are worked out again (the cells are still
+    #            connected by the rows below, which the ComponentIndex finds when it rebuilds).
+    grid_model.set_wall(7, True)
+    assert component_index.needs_rebuild
+    assert len(component_index.get_component(grid_model, 6)) == 21
+
+def test_wall_which_splits_component():
+    grid_model = GridModel(5, 5)
+    component_index = ComponentIndex()
+    component_index.rebuild(grid_model)
+
+    for y in range(4):
+        grid_model.set_wall(y*5 + 2, True)
+    assert component_index.is_connected(grid_model, 0, 4)
+
+    grid_model.set_wall(22, True)
+    assert component_index.is_connected(grid_model, 0, 4) == False
+    assert component_index.is_connected(grid_model, 0, 20)
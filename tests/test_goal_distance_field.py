@@ -0,0 +1,13 @@
+from boards import check_against_dijkastra, check_results_after_edits, check_results_after_running_out_of_budget
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+
+def test_flow_field_results_after_edits_match_dijkastra():
+    check_results_after_edits(PathfindingAlgorithmTypes.FLOW_FIELD)
+
+def test_flow_field_run_after_running_out_of_budget_matches_dijkastra():
+    check_results_after_running_out_of_budget(PathfindingAlgorithmTypes.FLOW_FIELD)
+
+def test_flow_field_with_huge_weight():
+    grid_model = create_grid_model(30, 30, [], [[[y, 15], 3000000] for y in range(30)])
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.FLOW_FIELD)
+    check_against_dijkastra(grid_model, PathfindingAlgorithmTypes.FLOW_FIELD, result, None)
@@ -0,0 +1,62 @@
+import random
+
+from grid_model import GridModel
+from pathfinding_engine import create_grid_model
+
+def test_board_hash_after_mark_and_unmark():
+    grid_model = GridModel(8, 12)
+    empty_board_hash = grid_model.board_hash
+
+    grid_model.set_wall(20, True)
+    assert grid_model.board_hash != empty_board_hash
+
+    # NOTE(ali): Marking a cell which is already marked doesn't change anything.
+    marked_board_hash = grid_model.board_hash
+    grid_model.set_wall(20, True)
+    assert grid_model.board_hash == marked_board_hash
+
+    grid_model.set_wall(20, False)
+    assert grid_model.board_hash == empty_board_hash
+
+def test_board_hash_after_weight_changes():
+    grid_model = GridModel(8, 12)
+    empty_board_hash = grid_model.board_hash
+
+    grid_model.set_user_weight(30, True)
+    grid_model.set_weight(30, 7)
+    assert grid_model.board_hash != empty_board_hash
+
+    grid_model.set_weight(30, 1)
+    grid_model.set_user_weight(30, False)
+    assert grid_model.board_hash == empty_board_hash
+
+def test_board_hash_matches_board_built_from_scratch():
+    rng = random.Random(0)
+    grid_model = GridModel(10, 10)
+    walls = set()
+    for _ in range(500):
+        index = rng.randrange(grid_model.num_of_cells)
+        value = rng.random() < 0.5
+        grid_model.set_wall(index, value)
+        if value:
+            walls.add(index)
+        else:
+            walls.discard(index)
+
+    # NOTE(ali): The hash only depends on the board and not on the order the cells were changed in.
+    new_grid_model = create_grid_model(10, 10, [grid_model.get_coords(index) for index in sorted(walls)])
+    assert grid_model.board_hash == new_grid_model.board_hash
+
+def test_board_hash_after_copy_and_sync_from():
+    grid_model = create_grid_model(6, 9, [[1, 1], [2, 2]], [[[3, 3], 5]])
+    copied_grid_model = grid_model.copy()
+    assert copied_grid_model.board_hash == grid_model.board_hash
+
+    grid_model.set_wall(grid_model.get_index([1, 1]), False)
+    grid_model.set_wall(grid_model.get_index([4, 4]), True)
+    grid_model.set_weight(grid_model.get_index([3, 3]), 2)
+    assert copied_grid_model.board_hash != grid_model.board_hash
+
+    copied_grid_model.sync_from(grid_model)
+    assert copied_grid_model.board_hash == grid_model.board_hash
+    assert copied_grid_model.walls == grid_model.walls
@@ -0,0 +1,49 @@
+import pytest
+
+from boards import create_random_board, get_path_cost
+from heuristic_field import PathfindingHeuristics
+from landmarks import LandmarkTable
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+
+NUM_OF_BOARDS = 40
+
+def test_landmarks_never_overestimate():
+    for seed in range(15):
+        grid_model = create_random_board(seed, max_size=9)
+        landmark_table = LandmarkTable(grid_model)
+        end_index = grid_model.end_index
+        engine = PathfindingEngine()
+
+        for index in range(grid_model.num_of_cells):
+            if grid_model.walls[index] or index == end_index:
+                continue
+
+            grid_model.start_index = index
+            result = engine.run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+            if result.found_path:
+                assert landmark_table.get_lower_bound(index, end_index) <= get_path_cost(grid_model, result.path), (seed, index)
+
+@pytest.mark.parametrize('algorithm_type', (PathfindingAlgorithmTypes.ASTAR, PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR,
+                                            PathfindingAlgorithmTypes.IDA_STAR, PathfindingAlgorithmTypes.FRINGE_SEARCH))
+def test_landmarks_find_shortest_path_after_board_changes(algorithm_type):
+    # NOTE(ali): The same engine is used for every board, so the landmark table has to be built again each time.
+    engine = PathfindingEngine()
+    for seed in range(NUM_OF_BOARDS):
+        grid_model = create_random_board(seed, max_size=20)
+        expected = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+        result = engine.run(grid_model, algorithm_type, PathfindingHeuristics.LANDMARKS)
+
+        assert result.found_path == expected.found_path, seed
+        if result.found_path:
+            assert get_path_cost(grid_model, result.path) == get_path_cost(grid_model, expected.path), seed
+
+def test_landmarks_with_huge_weights():
+    # NOTE(ali): The distances through these cells don't fit in a 32 bit int.
+    weights = [[[y, 5], 2000000000] for y in range(1, 10)]
+    grid_model = create_grid_model(10, 10, [], weights, [5, 0], [5, 9])
+    landmark_table = LandmarkTable(grid_model)
+    expected = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.ASTAR, PathfindingHeuristics.LANDMARKS)
+
+    assert landmark_table.get_lower_bound(grid_model.start_index, grid_model.end_index) <= get_path_cost(grid_model, expected.path)
+    assert get_path_cost(grid_model, result.path) == get_path_cost(grid_model, expected.path)
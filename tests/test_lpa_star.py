@@ -0,0 +1,40 @@
+from boards import check_against_dijkastra, check_results_after_edits, check_results_after_running_out_of_budget
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+
+def test_lpa_star_results_after_edits_match_dijkastra():
+    check_results_after_edits(PathfindingAlgorithmTypes.LPA_STAR)
+
+def test_lpa_star_run_after_running_out_of_budget_matches_dijkastra():
+    check_results_after_running_out_of_budget(PathfindingAlgorithmTypes.LPA_STAR)
+
+def test_lpa_star_only_repairs_changed_cells():
+    grid_model = create_grid_model(20, 20)
+    engine = PathfindingEngine()
+    first_result = engine.run(grid_model, PathfindingAlgorithmTypes.LPA_STAR)
+
+    path_index = first_result.path[len(first_result.path) // 2]
+    grid_model.set_user_weight(path_index, True)
+    grid_model.set_weight(path_index, 5)
+    result = engine.run(grid_model, PathfindingAlgorithmTypes.LPA_STAR)
+
+    check_against_dijkastra(grid_model, PathfindingAlgorithmTypes.LPA_STAR, result, None)
+    assert len(result.checked_nodes) < len(first_result.checked_nodes)
+
+def test_lpa_star_settles_when_end_node_is_unreachable():
+    grid_model = create_grid_model(20, 20)
+    engine = PathfindingEngine()
+    engine.run(grid_model, PathfindingAlgorithmTypes.LPA_STAR)
+
+    for x in range(20):
+        grid_model.set_wall(grid_model.get_index([10, x]), True)
+    result = engine.run(grid_model, PathfindingAlgorithmTypes.LPA_STAR)
+    assert result.found_path == False
+    assert engine.lpa_star_planner.needs_update(grid_model) == False
+
+    # NOTE(ali): The cells which weren't repaired while the board was split are repaired once it is joined again.
+    grid_model.set_wall(grid_model.get_index([10, 3]), False)
+    grid_model.set_user_weight(grid_model.get_index([5, 5]), True)
+    grid_model.set_weight(grid_model.get_index([5, 5]), 7)
+    assert engine.lpa_star_planner.needs_update(grid_model)
+    result = engine.run(grid_model, PathfindingAlgorithmTypes.LPA_STAR)
+    check_against_dijkastra(grid_model, PathfindingAlgorithmTypes.LPA_STAR, result, None)
@@ -0,0 +1,36 @@
+from path_cache import PathCache
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+
+def test_result_is_taken_from_cache_on_same_board():
+    path_cache = PathCache()
+    grid_model = create_grid_model(10, 10, [[5, y] for y in range(8)])
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.BFS)
+    key = path_cache.get_key(grid_model, PathfindingAlgorithmTypes.BFS, None)
+    path_cache.put(key, result, grid_model)
+
+    cached_result = path_cache.get(key, grid_model.copy())
+    assert list(cached_result.path) == result.path
+    assert list(cached_result.checked_nodes) == result.checked_nodes
+
+def test_result_is_not_taken_from_cache_on_board_with_same_hash():
+    path_cache = PathCache()
+    grid_model = create_grid_model(10, 10)
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.BFS)
+    key = path_cache.get_key(grid_model, PathfindingAlgorithmTypes.BFS, None)
+    path_cache.put(key, result, grid_model)
+
+    # NOTE(ali): The board hash of the walled board is set to the hash of the empty board,
+    #            which is the same as the two boards colliding.
+    for weight in (1, 5):
+        walled_grid_model = create_grid_model(10, 10, [[y, 5] for y in range(10) if y != 9])
+        walled_grid_model.set_weight(walled_grid_model.get_index([9, 5]), weight)
+        walled_grid_model.board_hash = grid_model.board_hash
+        assert path_cache.get_key(walled_grid_model, PathfindingAlgorithmTypes.BFS, None) == key
+        assert path_cache.get(key, walled_grid_model) == None
+
+def test_result_too_big_for_cache_is_not_saved():
+    grid_model = create_grid_model(10, 10)
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.BFS)
+    path_cache = PathCache(1)
+    path_cache.put(path_cache.get_key(grid_model, PathfindingAlgorithmTypes.BFS, None), result, grid_model)
+    assert path_cache.num_of_bytes == 0 and len(path_cache.results) == 0
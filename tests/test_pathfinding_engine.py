@@ -0,0 +1,81 @@
+import pytest
+
+from boards import create_random_board, get_path_cost, is_valid_path
+from heuristic_field import PathfindingHeuristics
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+from search_budget import SearchStopReasons
+
+NUM_OF_BOARDS = 40
+
+# NOTE(ali): The algorithms which always find the shortest path on weighted boards.
+WEIGHTED_SHORTEST_PATH_ALGORITHMS = (PathfindingAlgorithmTypes.DIJKASTRA, PathfindingAlgorithmTypes.DIAL_DIJKASTRA,
+                                     PathfindingAlgorithmTypes.LPA_STAR, PathfindingAlgorithmTypes.BIDIRECTIONAL_DIJKASTRA,
+                                     PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR, PathfindingAlgorithmTypes.FLOW_FIELD,
+                                     PathfindingAlgorithmTypes.ARA_STAR)
+
+# NOTE(ali): The algorithms which only find the shortest path if their heuristic never overestimates
+#            the distance to the end node (the Manhattan distance is multiplied by 3 and the Euclidean
+#            distance is squared, so they can both overestimate it).
+HEURISTIC_ALGORITHMS = (PathfindingAlgorithmTypes.ASTAR, PathfindingAlgorithmTypes.GREEDY_BFS, PathfindingAlgorithmTypes.JUMP_POINT_SEARCH,
+                        PathfindingAlgorithmTypes.BIDIRECTIONAL_ASTAR, PathfindingAlgorithmTypes.ARA_STAR,
+                        PathfindingAlgorithmTypes.IDA_STAR, PathfindingAlgorithmTypes.FRINGE_SEARCH)
+ADMISSIBLE_HEURISTICS = (PathfindingHeuristics.OCTILE_DISTANCE, PathfindingHeuristics.CHEBYSHEV_DISTANCE, PathfindingHeuristics.LANDMARKS)
+
+# NOTE(ali): The algorithms which find the path with the fewest steps, whatever the weights are.
+FEWEST_STEPS_ALGORITHMS = (PathfindingAlgorithmTypes.BFS, PathfindingAlgorithmTypes.BIDIRECTIONAL_BFS, PathfindingAlgorithmTypes.BITBOARD_BFS)
+
+def get_algorithm_cases():
+    """
+    Returns a list of (algorithm_type, heuristic) pairs for every algorithm with every heuristic it can be run with.
+
+    @return: List
+    """
+    cases = []
+    for algorithm_type in PathfindingAlgorithmTypes:
+        if algorithm_type in HEURISTIC_ALGORITHMS:
+            cases.extend((algorithm_type, heuristic) for heuristic in PathfindingHeuristics)
+        else:
+            cases.append((algorithm_type, None))
+    return cases
+
+def get_unweighted_copy(grid_model):
+    """
+    Returns a copy of the grid_model given with the weight of every cell set to 1.
+
+    @param grid_model: GridModel
+    @return: GridModel
+    """
+    unweighted_grid_model = grid_model.copy()
+    for index in range(unweighted_grid_model.num_of_cells):
+        unweighted_grid_model.set_weight(index, 1)
+    return unweighted_grid_model
+
+@pytest.mark.parametrize('algorithm_type, heuristic', get_algorithm_cases())
+def test_algorithm_against_dijkastra(algorithm_type, heuristic):
+    for seed in range(NUM_OF_BOARDS):
+        grid_model = create_random_board(seed)
+        expected = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+        result = PathfindingEngine().run(grid_model, algorithm_type, heuristic)
+
+        assert result.stop_reason == SearchStopReasons.FINISHED
+        assert result.found_path == expected.found_path, seed
+        if result.found_path == False:
+            continue
+
+        assert is_valid_path(grid_model, result.path), seed
+        cost = get_path_cost(grid_model, result.path)
+        assert cost >= get_path_cost(grid_model, expected.path), seed
+
+        if algorithm_type in WEIGHTED_SHORTEST_PATH_ALGORITHMS or (algorithm_type in HEURISTIC_ALGORITHMS and heuristic in ADMISSIBLE_HEURISTICS and
+                                                                   algorithm_type != PathfindingAlgorithmTypes.GREEDY_BFS):
+            assert cost == get_path_cost(grid_model, expected.path), seed
+        elif algorithm_type in FEWEST_STEPS_ALGORITHMS:
+            fewest_steps = PathfindingEngine().run(get_unweighted_copy(grid_model), PathfindingAlgorithmTypes.DIJKASTRA)
+            assert len(result.path) == len(fewest_steps.path), seed
+
+def test_dial_dijkastra_with_huge_weight():
+    grid_model = create_grid_model(10, 10, [], [[[0, 5], 3000000], [[5, 5], 2]])
+    expected = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIJKASTRA)
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.DIAL_DIJKASTRA)
+
+    assert get_path_cost(grid_model, result.path) == get_path_cost(grid_model, expected.path)
@@ -0,0 +1,144 @@
+import random
+
+from queue_classes import Queue, PriorityQueue, BucketQueue, MAX_BUCKET_QUEUE_WEIGHT, create_distance_queue
+
+def check_heap(priority_queue):
+    """
+    Checks that every entry in the heap of the priority queue given comes before its children,
+    and that self.positions holds the position of every item in the heap.
+
+    @param priority_queue: PriorityQueue
+    """
+    heap = priority_queue.heap
+    for i in range(len(heap)):
+        for child in (2*i + 1, 2*i + 2):
+            if child < len(heap):
+                assert heap[i][:2] <= heap[child][:2]
+        assert priority_queue.positions[heap[i][2]] == i
+    assert len(priority_queue.positions) == len(heap)
+
+def test_priority_queue_dequeues_in_priority_order():
+    rng = random.Random(0)
+    priority_queue = PriorityQueue()
+    priorities = {item: rng.randint(0, 50) for item in range(200)}
+    for item, priority in priorities.items():
+        priority_queue.enqueue(item, priority)
+        check_heap(priority_queue)
+
+    dequeued = []
+    while priority_queue.is_empty() == False:
+        assert priority_queue.peek_priority() == priorities[priority_queue.peek()]
+        dequeued.append(priority_queue.dequeue())
+        check_heap(priority_queue)
+
+    # NOTE(ali): sorted is stable, so items with the same priority stay in the order they were added.
+    assert dequeued == sorted(priorities, key=lambda item: priorities[item])
+    assert priority_queue.dequeue() == None
+
+def test_priority_queue_remove():
+    rng = random.Random(1)
+    priority_queue = PriorityQueue()
+    priorities = {item: rng.randint(0, 50) for item in range(200)}
+    for item, priority in priorities.items():
+        priority_queue.enqueue(item, priority)
+
+    removed = set(rng.sample(sorted(priorities), 80))
+    for item in removed:
+        priority_queue.remove(item)
+        assert priority_queue.exists(item) == False
+        check_heap(priority_queue)
+
+    # NOTE(ali): Removing an item which isn't in the queue doesn't do anything.
+    priority_queue.remove(1000)
+    check_heap(priority_queue)
+
+    dequeued = []
+    while priority_queue.is_empty() == False:
+        dequeued.append(priority_queue.dequeue())
+
+    assert dequeued == sorted((item for item in priorities if item not in removed), key=lambda item: priorities[item])
+
+def test_priority_queue_replace():
+    rng = random.Random(2)
+    priority_queue = PriorityQueue()
+    priorities = {}
+    for item in range(200):
+        priorities[item] = rng.randint(0, 50)
+        priority_queue.enqueue(item, priorities[item])
+
+    for item in rng.sample(sorted(priorities), 100):
+        priorities[item] = rng.randint(-20, 70)
+        priority_queue.replace(item, priorities[item])
+        check_heap(priority_queue)
+
+    dequeued_priorities = []
+    while priority_queue.is_empty() == False:
+        item = priority_queue.dequeue()
+        dequeued_priorities.append(priorities[item])
+
+    assert dequeued_priorities == sorted(priorities.values())
+
+def test_priority_queue_tuple_items():
+    priority_queue = PriorityQueue()
+    priority_queue.enqueue([1, 2], 5)
+    priority_queue.enqueue([3, 4], 1)
+
+    assert priority_queue.exists([1, 2])
+    priority_queue.remove([3, 4])
+    assert priority_queue.exists([3, 4]) == False
+    assert priority_queue.dequeue() == [1, 2]
+
+def test_bucket_queue_dequeues_in_priority_order():
+    rng = random.Random(3)
+    bucket_queue = BucketQueue(9)
+
+    # NOTE(ali): A bucket queue is only used by Dijkastra, where every new priority is at
+    #            most max_weight more than the priority of the last item which was dequeued.
+    priorities = {}
+    last_priority = 0
+    dequeued_priorities = []
+    next_item = 0
+    for _ in range(300):
+        if bucket_queue.is_empty() or rng.random() < 0.6:
+            priorities[next_item] = last_priority + rng.randint(0, 9)
+            bucket_queue.enqueue(next_item, priorities[next_item])
+            next_item += 1
+        else:
+            last_priority = priorities[bucket_queue.dequeue()]
+            dequeued_priorities.append(last_priority)
+
+    while bucket_queue.is_empty() == False:
+        dequeued_priorities.append(priorities[bucket_queue.dequeue()])
+
+    assert dequeued_priorities == sorted(dequeued_priorities)
+    assert len(dequeued_priorities) == next_item
+
+def test_queue_dequeues_in_order():
+    queue = Queue()
+    for item in range(50):
+        queue.enqueue(item)
+    assert queue.exists(10)
+
+    assert [queue.dequeue() for _ in range(50)] == list(range(50))
+    assert queue.exists(10) == False
+    assert queue.is_empty()
+
+def test_queue_visited_set():
+    queue = Queue(track_visited=True)
+    queue.enqueue([1, 2])
+    queue.enqueue([3, 4])
+    queue.dequeue()
+
+    # NOTE(ali): An item stays visited after it has been dequeued.
+    assert queue.exists([1, 2]) == False
+    assert queue.was_visited([1, 2])
+    assert queue.was_visited([3, 4])
+    assert queue.was_visited([5, 6]) == False
+    assert Queue().visited == None
+
+def test_distance_queue_falls_back_to_priority_queue():
+    assert isinstance(create_distance_queue(9), BucketQueue)
+    assert isinstance(create_distance_queue(MAX_BUCKET_QUEUE_WEIGHT), BucketQueue)
+
+    # NOTE(ali): A BucketQueue for this weight would allocate three million buckets.
+    assert isinstance(create_distance_queue(3000000), PriorityQueue)
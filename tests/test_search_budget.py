@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from boards import is_valid_path
+from heuristic_field import PathfindingHeuristics
+from pathfinding_engine import PathfindingAlgorithmTypes, PathfindingEngine, create_grid_model
+from search_budget import SearchBudget, SearchStopReasons
+
+# NOTE(ali): These return an empty path when they run out of budget (see their run functions).
+NO_PARTIAL_PATH_ALGORITHMS = (PathfindingAlgorithmTypes.LPA_STAR, PathfindingAlgorithmTypes.HPA_STAR, PathfindingAlgorithmTypes.FLOW_FIELD)
+
+def create_walled_board():
+    """
+    Returns a 40x40 GridModel with 30% of its cells marked, where every algorithm
+    expands more than 10 cells to find the path from the start node to the end node.
+
+    @return: GridModel
+    """
+    rng = random.Random(0)
+    walls = [[y, x] for y in range(40) for x in range(40) if rng.random() < 0.3 and [y, x] not in ([0, 0], [39, 39])]
+    return create_grid_model(40, 40, walls)
+
+@pytest.mark.parametrize('algorithm_type', list(PathfindingAlgorithmTypes))
+def test_expansion_limit_stops_search_with_partial_path(algorithm_type):
+    grid_model = create_walled_board()
+    result = PathfindingEngine().run(grid_model, algorithm_type, PathfindingHeuristics.OCTILE_DISTANCE, SearchBudget(None, 10))
+
+    assert result.stop_reason == SearchStopReasons.EXPANSION_LIMIT
+    assert result.is_partial
+    assert result.num_of_expansions > 10
+    if algorithm_type in NO_PARTIAL_PATH_ALGORITHMS:
+        assert result.path == []
+    else:
+        assert is_valid_path(grid_model, result.path, reaches_end_node=False)
+
+@pytest.mark.parametrize('algorithm_type', list(PathfindingAlgorithmTypes))
+def test_cancelled_budget_stops_search(algorithm_type):
+    grid_model = create_walled_board()
+    expected = PathfindingEngine().run(grid_model, algorithm_type, PathfindingHeuristics.OCTILE_DISTANCE)
+
+    budget = SearchBudget()
+    budget.cancel()
+    result = PathfindingEngine().run(grid_model, algorithm_type, PathfindingHeuristics.OCTILE_DISTANCE, budget)
+
+    # NOTE(ali): The budget is only checked every CHECK_INTERVAL expansions, so a
+    #            search which finishes before then never finds out it was cancelled.
+    if expected.num_of_expansions <= SearchBudget.CHECK_INTERVAL:
+        assert result.stop_reason == SearchStopReasons.FINISHED
+        assert result.path == expected.path
+    else:
+        assert result.stop_reason == SearchStopReasons.CANCELLED
+        assert budget.is_stopped_early
+
+def test_time_limit_stops_search():
+    result = PathfindingEngine().run(create_grid_model(40, 40), PathfindingAlgorithmTypes.DIJKASTRA, None, SearchBudget(0))
+
+    assert result.stop_reason == SearchStopReasons.TIME_LIMIT
+    assert is_valid_path(create_grid_model(40, 40), result.path, reaches_end_node=False)
+
+def test_search_without_limits_finishes():
+    result = PathfindingEngine().run(create_grid_model(40, 40), PathfindingAlgorithmTypes.DIJKASTRA, None, SearchBudget(10, 10**6))
+
+    assert result.stop_reason == SearchStopReasons.FINISHED
+    assert result.is_partial == False
+    assert result.num_of_expansions > 0
+
+@pytest.mark.parametrize('algorithm_type', list(PathfindingAlgorithmTypes))
+def test_partial_path_is_from_current_board(algorithm_type):
+    engine = PathfindingEngine()
+    engine.run(create_grid_model(30, 30, start_node_coords=[29, 0]), PathfindingAlgorithmTypes.ASTAR, PathfindingHeuristics.OCTILE_DISTANCE)
+    engine.run(create_grid_model(30, 30, start_node_coords=[29, 0]), algorithm_type, PathfindingHeuristics.OCTILE_DISTANCE)
+
+    grid_model = create_grid_model(30, 30, start_node_coords=[0, 29], end_node_coords=[29, 29])
+    result = engine.run(grid_model, algorithm_type, PathfindingHeuristics.OCTILE_DISTANCE, SearchBudget(None, 10))
+    if algorithm_type not in NO_PARTIAL_PATH_ALGORITHMS:
+        assert is_valid_path(grid_model, result.path, reaches_end_node=False)
+
+def test_ida_star_is_not_run_on_big_grids():
+    num_of_columns = PathfindingEngine.IDA_STAR_MAX_NUM_OF_CELLS//50 + 1
+    grid_model = create_grid_model(50, num_of_columns, [])
+    result = PathfindingEngine().run(grid_model, PathfindingAlgorithmTypes.IDA_STAR, PathfindingHeuristics.OCTILE_DISTANCE)
+
+    assert result.stop_reason == SearchStopReasons.GRID_TOO_BIG
+    assert result.checked_nodes == [] and result.path == []